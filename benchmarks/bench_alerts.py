@@ -0,0 +1,55 @@
+"""Benchmark the GitHub-style alerts extension on an alert-heavy document.
+
+Usage:
+    python benchmarks/bench_alerts.py [--alerts 5000] [--repeat 5]
+
+Renders a generated document containing thousands of alerts (mixed with
+plain paragraphs and blockquotes, which the fast path has to reject) and
+reports the best time per render.
+"""
+
+import argparse
+import time
+
+from eidos.plugins.markdown import MarkdownRenderer
+from eidos.plugins.markdown.extensions.alerts import AlertBlockProcessor
+
+
+def alert_document(alerts: int) -> str:
+    """Build a markdown document with ``alerts`` alerts of every type."""
+    types = list(AlertBlockProcessor.ALERT_TYPES)
+    parts = []
+    for i in range(alerts):
+        alert_type = types[i % len(types)]
+        parts.append(f"## Section {i}")
+        parts.append(f"Paragraph {i} with **bold**, `code` and a [link](/page/{i}).")
+        parts.append(f"> [!{alert_type}]\n> Alert {i} body with *emphasis*.\n> - first item\n> - second item")
+        if i % 3 == 0:
+            parts.append("> A continuation paragraph that belongs to the alert.")
+        if i % 5 == 0:
+            parts.append("Text between.\n\n> An ordinary blockquote, not an alert.")
+    return "\n\n".join(parts)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--alerts", type=int, default=5000, help="number of alerts in the document")
+    parser.add_argument("--repeat", type=int, default=5, help="number of timed renders")
+    args = parser.parse_args()
+
+    document = alert_document(args.alerts)
+    renderer = MarkdownRenderer()
+    renderer.render(document)  # warm up the pool
+
+    timings = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        renderer.render(document)
+        timings.append(time.perf_counter() - start)
+
+    best = min(timings)
+    print(f"{args.alerts} alerts, {len(document) / 1024:.0f} KiB: best {best * 1000:.1f} ms per render")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Measure the import-time cost of the markdown plugin.
+
+Usage:
+    python benchmarks/bench_import.py [--runs 10]
+
+Each scenario runs in a fresh interpreter; the best wall time over ``--runs``
+is reported. ``import eidos`` is the baseline, so the difference shows what
+the plugin adds at import time and what ``warmup()`` moves to startup.
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+
+SCENARIOS = {
+    "import eidos": "import eidos",
+    "import eidos.plugins.markdown": "import eidos.plugins.markdown",
+    "import + warmup()": "import eidos.plugins.markdown as m; m.warmup()",
+    "import + first Markdown()": "import eidos.plugins.markdown as m; m.Markdown('# Hi')",
+}
+
+
+def best_time(code: str, runs: int) -> float:
+    """Best wall time, in seconds, to run ``code`` in a fresh interpreter."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10, help="fresh interpreters per scenario")
+    args = parser.parse_args()
+
+    imports_markdown = subprocess.run(
+        [sys.executable, "-c", "import sys, eidos.plugins.markdown; print('markdown' in sys.modules)"],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+    print(f"Python-Markdown imported by 'import eidos.plugins.markdown': {imports_markdown}")
+
+    baseline = None
+    for name, code in SCENARIOS.items():
+        seconds = best_time(code, args.runs)
+        baseline = seconds if baseline is None else baseline
+        print(f"{name:<30} {seconds * 1000:8.1f} ms  ({(seconds - baseline) * 1000:+.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
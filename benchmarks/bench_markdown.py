@@ -0,0 +1,225 @@
+"""Benchmark MarkdownRenderer.render across a corpus and several extension sets.
+
+Usage:
+    python benchmarks/bench_markdown.py [--min-time 1.0] [--json results.json]
+    python benchmarks/bench_markdown.py --compare results.json [--threshold 10]
+    python benchmarks/bench_markdown.py --configs default "without nl2br" --documents comment
+
+For every (configuration, document) pair, reports renders/sec, p50 and p99
+latency, and the peak memory allocated by a single render. ``--json`` writes
+the results in a machine-readable form; ``--compare`` loads an earlier run,
+prints the change per pair and exits with status 1 if any pair's p50 got
+slower by more than ``--threshold`` percent.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+import markdown
+from bench_alerts import alert_document
+
+from eidos.plugins.markdown import HighlightExtension, MarkdownRenderer
+from eidos.plugins.markdown.renderer import default_extensions
+
+Render = Callable[[str], Any]
+
+WORDS = (
+    "render theme markdown component server latency cache token layout browser request "
+    "python table column alert value style option client header content response"
+).split()
+
+
+def sentence(i: int, words: int = 12) -> str:
+    """A deterministic sentence (of at least 6 words) with some inline formatting."""
+    text = [WORDS[(i * 7 + j * 3) % len(WORDS)] for j in range(words)]
+    text[1] = f"**{text[1]}**"
+    text[3] = f"`{text[3]}`"
+    text[-2] = f"[{text[-2]}](/docs/{i})"
+    return " ".join(text).capitalize() + "."
+
+
+def comment_document() -> str:
+    """A short user comment: a couple of lines, inline formatting, a link."""
+    return f"{sentence(1)}\n{sentence(2, 8)}\n\n> {sentence(3, 6)}"
+
+
+def long_document(sections: int = 60) -> str:
+    """A long documentation page: headings, paragraphs, lists and quotes."""
+    parts = ["# Guide"]
+    for i in range(sections):
+        parts.append(f"## Section {i}")
+        parts.append(" ".join(sentence(i * 10 + j) for j in range(5)))
+        parts.append("\n".join(f"- {sentence(i + j, 6)}" for j in range(4)))
+        parts.append(f"### Details {i}")
+        parts.append(" ".join(sentence(i * 20 + j) for j in range(3)))
+        if i % 4 == 0:
+            parts.append(f"> {sentence(i, 10)}")
+    return "\n\n".join(parts)
+
+
+def table_document(tables: int = 40, rows: int = 25) -> str:
+    """Many tables with aligned columns and inline formatting in cells."""
+    parts = []
+    for t in range(tables):
+        parts.append(f"## Table {t}")
+        lines = ["| Name | Value | Notes |", "|:-----|------:|:-----:|"]
+        for r in range(rows):
+            lines.append(f"| `{WORDS[(t + r) % len(WORDS)]}` | {t * rows + r} | *{WORDS[r % len(WORDS)]}* |")
+        parts.append("\n".join(lines))
+    return "\n\n".join(parts)
+
+
+def code_document(blocks: int = 80) -> str:
+    """Many fenced code blocks in several languages, with prose between them."""
+    samples = {
+        "python": "def handler(request):\n    items = [x * 2 for x in range(10)]\n    return {'items': items}\n",
+        "javascript": "function handler(request) {\n  const items = [...Array(10).keys()].map(x => x * 2);\n"
+        "  return { items };\n}\n",
+        "bash": 'for f in *.md; do\n  echo "$f"\ndone\n',
+        "": "plain text without a language\n",
+    }
+    parts = []
+    for i in range(blocks):
+        lang, code = list(samples.items())[i % len(samples)]
+        parts.append(sentence(i))
+        parts.append(f"```{lang}\n{code}```")
+    return "\n\n".join(parts)
+
+
+CORPUS: dict[str, Callable[[], str]] = {
+    "comment": comment_document,
+    "long doc": long_document,
+    "alert-heavy": lambda: alert_document(500),
+    "table-heavy": table_document,
+    "code-heavy": code_document,
+}
+
+
+def plain_markdown(extensions: list[Any]) -> Render:
+    """Render with a bare ``markdown.Markdown``, reused and reset like the renderer does."""
+    md = markdown.Markdown(extensions=extensions)
+
+    def render(text: str) -> str:
+        md.reset()
+        return md.convert(text)
+
+    return render
+
+
+def without(name: str) -> Callable[[], Render]:
+    """The default renderer with one extension removed (by name or class name)."""
+
+    def build() -> Render:
+        kept = [ext for ext in default_extensions() if (ext if isinstance(ext, str) else type(ext).__name__) != name]
+        return MarkdownRenderer(kept, defaults=False).render
+
+    return build
+
+
+def structured(renderer: MarkdownRenderer) -> Render:
+    """Render returning a ``RenderResult`` (headings, word count) instead of a string."""
+    return lambda text: renderer.render(text, structured=True)
+
+
+CONFIGS: dict[str, Callable[[], Render]] = {
+    "python-markdown": lambda: plain_markdown(["fenced_code", "tables"]),
+    "default": lambda: MarkdownRenderer().render,
+    "without nl2br": without("nl2br"),
+    "without AlertExtension": without("AlertExtension"),
+    "without HeadingsExtension": without("HeadingsExtension"),
+    "highlight": lambda: MarkdownRenderer([HighlightExtension()]).render,
+    "safe": lambda: MarkdownRenderer(safe=True).render,
+    "structured": lambda: structured(MarkdownRenderer()),
+}
+
+
+def measure(render: Render, document: str, min_time: float, min_runs: int) -> dict[str, float]:
+    """Time ``render(document)`` repeatedly and measure the peak memory of one render."""
+    render(document)  # warm up caches and the renderer pool
+
+    latencies = []
+    deadline = time.perf_counter() + min_time
+    while len(latencies) < min_runs or time.perf_counter() < deadline:
+        start = time.perf_counter()
+        render(document)
+        latencies.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    render(document)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    cuts = statistics.quantiles(latencies, n=100)
+    return {
+        "runs": len(latencies),
+        "renders_per_sec": len(latencies) / sum(latencies),
+        "p50_ms": cuts[49] * 1000,
+        "p99_ms": cuts[98] * 1000,
+        "peak_kib": peak / 1024,
+    }
+
+
+def compare(results: list[dict[str, Any]], baseline: list[dict[str, Any]], threshold: float) -> bool:
+    """Print per-pair changes against an earlier run; return True if any p50 regressed."""
+    previous = {(row["config"], row["document"]): row for row in baseline}
+    regressed = False
+    print(f"\n{'config':<26} {'document':<12} {'p50':>9} {'renders/s':>10} {'peak mem':>9}")
+    for row in results:
+        old = previous.get((row["config"], row["document"]))
+        if old is None:
+            continue
+        p50 = (row["p50_ms"] / old["p50_ms"] - 1) * 100
+        rate = (row["renders_per_sec"] / old["renders_per_sec"] - 1) * 100
+        peak = (row["peak_kib"] / old["peak_kib"] - 1) * 100 if old["peak_kib"] else 0.0
+        flag = "  REGRESSION" if p50 > threshold else ""
+        regressed = regressed or bool(flag)
+        print(f"{row['config']:<26} {row['document']:<12} {p50:+8.1f}% {rate:+9.1f}% {peak:+8.1f}%{flag}")
+    return regressed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--configs", nargs="+", choices=list(CONFIGS), default=list(CONFIGS))
+    parser.add_argument("--documents", nargs="+", choices=list(CORPUS), default=list(CORPUS))
+    parser.add_argument("--min-time", type=float, default=1.0, help="seconds to spend per pair")
+    parser.add_argument("--min-runs", type=int, default=20, help="minimum renders per pair")
+    parser.add_argument("--json", metavar="PATH", help="write results to PATH as JSON")
+    parser.add_argument("--compare", metavar="PATH", help="compare against results written by --json")
+    parser.add_argument("--threshold", type=float, default=10.0, help="p50 slowdown (%%) that counts as a regression")
+    args = parser.parse_args()
+
+    documents = {name: CORPUS[name]() for name in args.documents}
+    results = []
+    print(f"{'config':<26} {'document':<12} {'renders/s':>10} {'p50 ms':>9} {'p99 ms':>9} {'peak KiB':>9}")
+    for config in args.configs:
+        render = CONFIGS[config]()
+        for name, document in documents.items():
+            row = {"config": config, "document": name, "size": len(document)}
+            row.update(measure(render, document, args.min_time, args.min_runs))
+            results.append(row)
+            print(
+                f"{config:<26} {name:<12} {row['renders_per_sec']:10.1f} {row['p50_ms']:9.3f} "
+                f"{row['p99_ms']:9.3f} {row['peak_kib']:9.1f}"
+            )
+
+    if args.json:
+        meta = {"python": platform.python_version(), "markdown": markdown.__version__, "platform": platform.platform()}
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"meta": meta, "results": results}, f, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
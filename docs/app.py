@@ -1,5 +1,6 @@
 """EidosUI Documentation - A runnable documentation app built with EidosUI"""
 
+import tempfile
 from pathlib import Path
 
 import air
@@ -9,32 +10,36 @@ from api_renderer import render_api_index, render_api_page
 from kitchen_sink import components_page, handle_feedback
 
 from eidos.components.headers import EidosHeaders
+from eidos.components.icon import Icon
 from eidos.components.navigation import NavBar
 from eidos.components.theme import ThemeSwitch
-from eidos.plugins.markdown import Markdown, MarkdownCSS
+from eidos.plugins.markdown import MarkdownCSS, MarkdownFileCache
+from eidos.static import EidosStaticFiles
 from eidos.tags import *
 from eidos.utils import get_eidos_static_files
 
 app = air.Air()
 
-from fastapi.staticfiles import StaticFiles
-
 for mount_path, directory in get_eidos_static_files(markdown=True).items():
     app.mount(
         mount_path,
-        StaticFiles(directory=directory),
+        EidosStaticFiles(directory=directory),
         name=mount_path.strip("/").replace("/", "_"),
     )
 
 # Get the docs directory
 DOCS_DIR = Path(__file__).parent
 
+# Rendered pages survive worker restarts; only changed files are re-rendered
+markdown_cache = MarkdownFileCache(Path(tempfile.gettempdir()) / "eidos-docs-markdown")
+markdown_cache.warm(DOCS_DIR)
+
 
 def layout(title, *content, sidebar=None):
     """Shared layout for all documentation pages"""
     return Html(
         Head(
-            *EidosHeaders(),
+            *EidosHeaders(include_lucide=False),  # Icons are server-rendered with Icon
             MarkdownCSS(),
             Title(f"{title} - EidosUI Docs"),
             Meta(name="viewport", content="width=device-width, initial-scale=1"),
@@ -179,10 +184,10 @@ def layout(title, *content, sidebar=None):
                     sidebarToggle.onclick = () => {
                         const isCollapsed = sidebar.getAttribute('data-collapsed') === 'true';
                         sidebar.setAttribute('data-collapsed', !isCollapsed);
-                        const icon = sidebarToggle.querySelector('[data-lucide]');
+                        const icon = sidebarToggle.querySelector('svg');
                         if (icon) {
-                            icon.setAttribute('data-lucide', isCollapsed ? 'chevron-down' : 'chevron-right');
-                            lucide.createIcons();
+                            // Chevron down when open, pointing right when collapsed
+                            icon.style.transform = isCollapsed ? '' : 'rotate(-90deg)';
                         }
                     };
 
@@ -250,7 +255,7 @@ def create_api_sidebar(modules, current_module=None):
     return Div(
         Button(
             Span("API Reference"),
-            I(data_lucide="chevron-down", class_="w-4 h-4"),
+            Icon("chevron-down", class_="w-4 h-4"),
             class_="sidebar-toggle md:hidden",
         ),
         Div(
@@ -266,8 +271,7 @@ def load_markdown(filename):
     """Load and render a markdown file"""
     filepath = DOCS_DIR / filename
     if filepath.exists():
-        with open(filepath) as f:
-            return Markdown(f.read())
+        return Div(Raw(markdown_cache.render_file(filepath)))
     return P("Documentation file not found.", class_="text-red-500")
 
 
@@ -452,21 +456,32 @@ def tab_code():
         ),
         Details(
             Summary("HTMX Tab Implementation"),
-            Pre("""# Main page with tab component
+            Pre("""# Each panel is built by a plain function returning a Tag
+def typography_panel():
+    return Div(
+        H3("Typography Examples"),
+        P("Content here...")
+    )
+
+PANELS = {"/tab/typography": typography_panel}
+
+# Main page with tab component
 HTMXTabs(
     ("Typography", "/tab/typography"),
     ("Lists", "/tab/lists"),
     ("Code", "/tab/code"),
-    selected=0
+    selected=0,
+    prefetch=True,      # fetch on hover/focus, before the click
+    cache_panels=True,  # revisits swap instantly, then revalidate
+    # render the selected panel into the page itself (None: fetch it after load)
+    resolver=lambda url: PANELS[url]() if url in PANELS else None,
 )
 
-# Each tab route returns just the content
+# Each tab route returns just the content; panel_response adds an
+# ETag so unchanged panels are answered with 304
 @app.get("/tab/typography")
-def tab_typography():
-    return Div(
-        H3("Typography Examples"),
-        P("Content here...")
-    )"""),
+def tab_typography(request: Request):
+    return panel_response(request, typography_panel())"""),
             class_="mt-4",
         ),
         class_="space-y-4",
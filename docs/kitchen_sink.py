@@ -3,7 +3,7 @@
 import air
 
 import eidos.styles as styles
-from eidos.components import DataTable
+from eidos.components import DataTable, Icon
 from eidos.components.feedback import Feedback
 from eidos.components.tabs import AlpineTabs, HTMXTabs
 from eidos.tags import *
@@ -458,14 +458,14 @@ def components_page():
             ),
         ),
         ComponentSection(
-            "Lucide Icons",
-            "lucide-icons",
+            "Icons",
+            "icons",
             Div(
-                I(data_lucide="sun", class_="w-2 h-2"),
-                I(data_lucide="moon", class_="w-3 h-3"),
-                I(data_lucide="menu", class_="w-4 h-4"),
-                I(data_lucide="arrow-right", class_="w-8 h-8"),
-                I(data_lucide="rocket", class_="w-12 h-12"),
+                Icon("sun", class_="w-2 h-2"),
+                Icon("moon", class_="w-3 h-3"),
+                Icon("menu", class_="w-4 h-4"),
+                Icon("arrow-right", class_="w-8 h-8"),
+                Icon("search", class_="w-12 h-12"),
                 class_="flex space-x-4",
             ),
         ),
@@ -17,8 +17,11 @@ from . import styles
 from .components import (
     DataTable,
     EidosHeaders,
+    Icon,
+    IconSprite,
     NavBar,
     ThemeSwitch,
+    theme_from_request,
 )
 from .styles import buttons, lists, tables, typography
 from .tags import (
@@ -174,7 +177,10 @@ __all__ = [
     "DataTable",
     "NavBar",
     "EidosHeaders",
+    "Icon",
+    "IconSprite",
     "ThemeSwitch",
+    "theme_from_request",
     # HTML Tags
     "H1",
     "H2",
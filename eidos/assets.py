@@ -0,0 +1,442 @@
+"""Build-time processing of EidosUI's static assets.
+
+Every asset is copied under a content-hashed file name, and the core
+stylesheets are also concatenated and minified into a single bundle. An
+``AssetManifest`` maps logical names (``"js/theme.js"``) to those URLs, so
+they can be served with long-lived caching and never go stale after an
+upgrade. Assets are built on first use (or ahead of time with
+``python -m eidos.assets``) and written to ``bundle_dir()``.
+"""
+
+import argparse
+import functools
+import getpass
+import gzip
+import hashlib
+import json
+import os
+import re
+import stat
+import tempfile
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+PACKAGE_DIR = Path(__file__).parent
+
+#: Core stylesheets, in cascade order, relative to the package directory
+CSS_FILES = (
+    "css/styles.css",
+    "css/themes/eidos-variables.css",
+    "css/themes/light.css",
+    "css/themes/dark.css",
+)
+
+#: Theme stylesheets in ``CSS_FILES``, by theme name
+THEME_FILES = {
+    "light": "css/themes/light.css",
+    "dark": "css/themes/dark.css",
+}
+
+#: Every asset served from the package, relative to the package directory
+ASSET_FILES = (
+    *CSS_FILES,
+    "js/theme.js",
+    "js/eidos.js",
+    "plugins/markdown/css/markdown.css",
+)
+
+#: Manifest name of the minified bundle of ``CSS_FILES``
+BUNDLE_NAME = "eidos.css"
+
+#: URL path the bundle directory is mounted at by ``get_eidos_static_files``
+BUNDLE_URL_PREFIX = "/eidos/bundle"
+
+MANIFEST_FILENAME = "manifest.json"
+
+#: File types worth storing precompressed
+COMPRESSIBLE_SUFFIXES = frozenset({".css", ".js", ".json", ".svg"})
+
+#: Content-Encoding -> suffix of the precompressed variant, in order of preference
+ENCODING_SUFFIXES = {"zstd": ".zst", "gzip": ".gz"}
+
+# Strings are kept verbatim and comments dropped; matched together so that a
+# quote inside a comment (or "/*" inside a string) is not misread
+RE_STRING_OR_COMMENT = re.compile(r"(\"(?:[^\"\\]|\\.)*\"|'(?:[^'\\]|\\.)*')|/\*.*?\*/", re.DOTALL)
+RE_WHITESPACE = re.compile(r"\s+")
+RE_PUNCTUATION = re.compile(r"\s*([{};,>])\s*")
+# "name: value" inside a declaration block; a value running into "{" is a selector
+RE_DECLARATION = re.compile(r"(?<=[{;])([\w-]+):\s+(?=[^{};]*[;}])")
+RE_STRING_PLACEHOLDER = re.compile(r"\x00(\d+)\x00")
+
+
+def minify_css(css: str) -> str:
+    """Remove comments and redundant whitespace from a stylesheet.
+
+    The minifier is deliberately conservative: it only removes whitespace
+    that can never be significant (around braces, semicolons, commas and
+    child combinators, and after property names) and leaves strings alone.
+
+    Args:
+        css: Stylesheet source
+
+    Returns:
+        Minified stylesheet
+
+    Example:
+        >>> minify_css(".a,\\n.b {\\n    color: red;\\n}\\n")
+        '.a,.b{color:red}'
+    """
+    strings: list[str] = []
+
+    def stash(match: re.Match[str]) -> str:
+        if match.group(1) is None:
+            return " "  # comment
+        strings.append(match.group(1))
+        return f"\x00{len(strings) - 1}\x00"
+
+    css = RE_STRING_OR_COMMENT.sub(stash, css)
+    css = RE_WHITESPACE.sub(" ", css)
+    css = RE_PUNCTUATION.sub(r"\1", css)
+    css = RE_DECLARATION.sub(r"\1:", css)
+    css = css.replace(";}", "}").strip()
+    return RE_STRING_PLACEHOLDER.sub(lambda match: strings[int(match.group(1))], css)
+
+
+@dataclass(frozen=True)
+class CssBundle:
+    """A built CSS bundle: its minified content and content-hashed file name."""
+
+    content: str
+    digest: str
+
+    @property
+    def filename(self) -> str:
+        """File name including the content hash, e.g. ``eidos.1a2b3c4d5e6f.css``."""
+        return f"eidos.{self.digest}.css"
+
+    @property
+    def url(self) -> str:
+        """URL the bundle is served at when mounted by ``get_eidos_static_files``."""
+        return f"{BUNDLE_URL_PREFIX}/{self.filename}"
+
+
+def build_css_bundle(files: tuple[str, ...] = CSS_FILES) -> CssBundle:
+    """Concatenate and minify stylesheets into a bundle, without writing it.
+
+    Args:
+        files: Stylesheet paths relative to the package directory, in cascade order
+
+    Returns:
+        The CssBundle
+    """
+    content = "\n".join(minify_css((PACKAGE_DIR / name).read_text(encoding="utf-8")) for name in files)
+    digest = hashlib.sha256(content.encode()).hexdigest()[:12]
+    return CssBundle(content=content, digest=digest)
+
+
+def theme_css_files(theme: str | None = None) -> tuple[str, ...]:
+    """``CSS_FILES`` for pages rendered in a single theme, without the other themes' stylesheets.
+
+    Raises:
+        ValueError: If ``theme`` is not in ``THEME_FILES``
+    """
+    if theme is None:
+        return CSS_FILES
+    if theme not in THEME_FILES:
+        raise ValueError(f"Unknown theme {theme!r}; expected one of: {', '.join(THEME_FILES)}")
+    return tuple(name for name in CSS_FILES if name not in THEME_FILES.values() or name == THEME_FILES[theme])
+
+
+def theme_bundle_name(theme: str) -> str:
+    """Manifest name of the bundle for one theme, e.g. ``eidos-dark.css``."""
+    return f"eidos-{theme}.css"
+
+
+def bundle_dir() -> Path:
+    """Directory built assets are written to and served from.
+
+    Set ``EIDOS_BUNDLE_DIR`` to use a fixed directory (for example one
+    prepared with ``python -m eidos.assets`` at build time); otherwise a
+    private, per-user directory under the system temporary directory is used.
+
+    Raises:
+        PermissionError: If the default directory exists but is not private to this user
+    """
+    configured = os.environ.get("EIDOS_BUNDLE_DIR")
+    if configured:
+        return Path(configured)
+    user = os.getuid() if hasattr(os, "getuid") else getpass.getuser()
+    return _private_dir(Path(tempfile.gettempdir()) / f"eidos-bundle-{user}")
+
+
+@functools.cache
+def _private_dir(path: Path) -> Path:
+    """Create ``path`` readable by this user only, or check that an existing one is."""
+    path.mkdir(mode=0o700, exist_ok=True)
+    st = os.lstat(path)
+    # Anyone can create names in the temporary directory; only serve from one this user controls
+    if not stat.S_ISDIR(st.st_mode) or (hasattr(os, "getuid") and (st.st_uid != os.getuid() or st.st_mode & 0o077)):
+        raise PermissionError(f"{path} is not a private directory of this user; set EIDOS_BUNDLE_DIR instead")
+    return path
+
+
+@dataclass(frozen=True)
+class Asset:
+    """A built asset: its logical name and content-hashed file name."""
+
+    name: str
+    filename: str
+
+    @property
+    def url(self) -> str:
+        """URL the asset is served at when mounted by ``get_eidos_static_files``."""
+        return f"{BUNDLE_URL_PREFIX}/{self.filename}"
+
+
+class AssetManifest:
+    """Mapping of logical asset names to their content-hashed URLs.
+
+    Example:
+        manifest = get_manifest()
+        manifest.url("js/theme.js")  # "/eidos/bundle/js/theme.5e1f0c2a9b3d.js"
+    """
+
+    def __init__(self, assets: dict[str, Asset]):
+        self.assets = assets
+        self._filenames = frozenset(asset.filename for asset in assets.values())
+
+    def url(self, name: str) -> str:
+        """Content-hashed URL of the asset ``name``.
+
+        Raises:
+            KeyError: If ``name`` is not a known asset
+        """
+        try:
+            return self.assets[name].url
+        except KeyError:
+            raise KeyError(f"Unknown eidos asset {name!r}; known assets: {', '.join(self.assets)}") from None
+
+    def is_fingerprinted(self, filename: str) -> bool:
+        """Whether ``filename`` (relative to the bundle directory) is a content-hashed asset."""
+        return filename in self._filenames
+
+    def to_dict(self) -> dict[str, str]:
+        """Logical name -> URL, as written to ``manifest.json``."""
+        return {name: asset.url for name, asset in self.assets.items()}
+
+
+def fingerprinted_name(name: str, digest: str) -> str:
+    """Insert ``digest`` before the extension: ``js/theme.js`` -> ``js/theme.<digest>.js``."""
+    stem, dot, suffix = name.rpartition(".")
+    return f"{stem}.{digest}.{suffix}" if dot else f"{name}.{digest}"
+
+
+def build_manifest(directory: str | os.PathLike[str] | None = None) -> AssetManifest:
+    """Write every asset and the CSS bundle under content-hashed names.
+
+    Files already present are reused if they hold the expected content, and
+    new files are written to a temporary name and renamed into place, so
+    several worker processes can build at the same time. Each text asset also
+    gets precompressed ``.gz`` (and, when available, ``.zst``) variants.
+
+    Args:
+        directory: Output directory (default: ``bundle_dir()``)
+
+    Returns:
+        The AssetManifest, also written to ``manifest.json`` in ``directory``
+    """
+    out = Path(directory) if directory is not None else bundle_dir()
+    assets = {}
+    for name in ASSET_FILES:
+        data = (PACKAGE_DIR / name).read_bytes()
+        asset = Asset(name, fingerprinted_name(name, hashlib.sha256(data).hexdigest()[:12]))
+        _write(out / asset.filename, data)
+        precompress(out / asset.filename)
+        assets[name] = asset
+
+    bundle = build_css_bundle()
+    _write(out / bundle.filename, bundle.content.encode())
+    precompress(out / bundle.filename)
+    assets[BUNDLE_NAME] = Asset(BUNDLE_NAME, bundle.filename)
+
+    # One bundle per theme, for pages whose theme is chosen on the server
+    for theme in THEME_FILES:
+        bundle = build_css_bundle(theme_css_files(theme))
+        _write(out / bundle.filename, bundle.content.encode())
+        precompress(out / bundle.filename)
+        assets[theme_bundle_name(theme)] = Asset(theme_bundle_name(theme), bundle.filename)
+
+    manifest = AssetManifest(assets)
+    _write(out / MANIFEST_FILENAME, json.dumps(manifest.to_dict(), indent=2).encode(), replace=True)
+    return manifest
+
+
+def write_generated_asset(name: str, data: bytes, directory: str | os.PathLike[str] | None = None) -> Asset:
+    """Write an app-specific asset (such as a generated stylesheet) under a content-hashed name.
+
+    The file is precompressed like the built-in assets, and ``<name>.json``
+    next to it records it as the current version of ``name`` for
+    ``generated_asset_url``.
+
+    Args:
+        name: Logical name, e.g. ``"tailwind.css"``
+        data: File content
+        directory: Output directory (default: ``bundle_dir()``)
+
+    Returns:
+        The written Asset
+    """
+    out = Path(directory) if directory is not None else bundle_dir()
+    asset = Asset(name, fingerprinted_name(name, hashlib.sha256(data).hexdigest()[:12]))
+    _write(out / asset.filename, data)
+    precompress(out / asset.filename)
+    _write(out / f"{name}.json", json.dumps({"filename": asset.filename}).encode(), replace=True)
+    return asset
+
+
+def generated_asset_url(name: str, command: str) -> str:
+    """URL of the current version of a generated asset in ``bundle_dir()``.
+
+    Args:
+        name: Logical name passed to ``write_generated_asset``
+        command: Module that builds it, named in the error message
+
+    The pointer file is stat'ed on every call and re-read only when it was
+    replaced, so a rebuild by another process is picked up without a restart.
+
+    Raises:
+        FileNotFoundError: If it has not been generated
+    """
+    pointer = bundle_dir() / f"{name}.json"
+    try:
+        st = pointer.stat()
+    except OSError:
+        raise FileNotFoundError(
+            f"No {name} in {bundle_dir()}; build it with `python -m {command}` (with the same EIDOS_BUNDLE_DIR)."
+        ) from None
+    # write_generated_asset replaces the pointer, so a rewrite gets a new inode
+    signature = (st.st_ino, st.st_mtime_ns)
+    cached = _generated_urls.get(pointer)
+    if cached is None or cached[0] != signature:
+        cached = _generated_urls[pointer] = (signature, Asset(name, json.loads(pointer.read_text())["filename"]).url)
+    return cached[1]
+
+
+# Pointer file -> (its inode and mtime, URL of the asset it names)
+_generated_urls: dict[Path, tuple[tuple[int, int], str]] = {}
+
+
+def precompress(path: Path) -> list[Path]:
+    """Write compressed variants next to ``path``: ``styles.css.gz`` and ``styles.css.zst``.
+
+    Zstandard variants are written only when a zstd implementation is
+    available (``compression.zstd`` on Python 3.14+, or the ``zstandard``
+    package). Existing variants are kept if they decompress to the file's
+    content, so call this only for files whose name changes with their content.
+
+    Args:
+        path: File to compress; files not in ``COMPRESSIBLE_SUFFIXES`` are skipped
+
+    Returns:
+        Paths of the variants that exist after the call
+    """
+    if path.suffix not in COMPRESSIBLE_SUFFIXES:
+        return []
+    codecs: dict[str, tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]] | None] = {
+        "zstd": _zstd_codec(),
+        "gzip": (lambda data: gzip.compress(data, compresslevel=9, mtime=0), gzip.decompress),
+    }
+    data = path.read_bytes()
+    variants = []
+    for encoding, codec in codecs.items():
+        if codec is None:
+            continue
+        compress, decompress = codec
+        variant = path.with_name(path.name + ENCODING_SUFFIXES[encoding])
+        if not _decompresses_to(variant, decompress, data):
+            _write(variant, compress(data), replace=True)
+        variants.append(variant)
+    return variants
+
+
+def _decompresses_to(variant: Path, decompress: Callable[[bytes], bytes], data: bytes) -> bool:
+    try:
+        return decompress(variant.read_bytes()) == data
+    except (OSError, ValueError, EOFError):
+        return False
+
+
+@functools.cache
+def _zstd_codec() -> tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]] | None:
+    """Compress and decompress functions for Zstandard, if an implementation is available."""
+    try:
+        from compression import zstd  # Python 3.14+
+
+        return functools.partial(zstd.compress, level=19), zstd.decompress
+    except ImportError:
+        pass
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    return zstandard.ZstdCompressor(level=19).compress, zstandard.ZstdDecompressor().decompress
+
+
+def _write(target: Path, data: bytes, replace: bool = False) -> None:
+    """Write ``data`` to ``target`` atomically.
+
+    Unless ``replace`` is set, an existing file is kept when it already holds
+    ``data`` (its content-hashed name says it should), and rewritten otherwise.
+    """
+    if not replace and _holds(target, data):
+        return
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, target)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def _holds(target: Path, data: bytes) -> bool:
+    try:
+        return target.read_bytes() == data
+    except OSError:
+        return False
+
+
+@functools.cache
+def get_manifest() -> AssetManifest:
+    """The asset manifest for this process, built and written on first call."""
+    return build_manifest()
+
+
+def asset_url(name: str) -> str:
+    """Content-hashed URL of an EidosUI asset, e.g. ``asset_url("js/eidos.js")``."""
+    return get_manifest().url(name)
+
+
+def get_css_bundle_url(theme: str | None = None) -> str:
+    """URL of the bundled, minified EidosUI stylesheet.
+
+    Args:
+        theme: Include only this theme's stylesheet (default: all themes)
+    """
+    return asset_url(BUNDLE_NAME if theme is None else theme_bundle_name(theme))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build the EidosUI assets and CSS bundle ahead of time.")
+    parser.add_argument("--out", default=None, help="output directory (default: $EIDOS_BUNDLE_DIR or a temp dir)")
+    args = parser.parse_args()
+
+    manifest = build_manifest(args.out)
+    print(json.dumps(manifest.to_dict(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
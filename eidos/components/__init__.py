@@ -5,17 +5,22 @@ Higher-level components built on top of the base tags.
 
 from .feedback import Feedback
 from .headers import EidosHeaders
+from .icon import Icon, IconSprite
 from .navigation import NavBar
 from .table import DataTable
-from .tabs import AlpineTabs, HTMXTabs
-from .theme import ThemeSwitch
+from .tabs import AlpineTabs, AsyncHTMXTabs, HTMXTabs
+from .theme import ThemeSwitch, theme_from_request
 
 __all__ = [
     "DataTable",
     "NavBar",
     "EidosHeaders",
+    "Icon",
+    "IconSprite",
     "AlpineTabs",
     "HTMXTabs",
+    "AsyncHTMXTabs",
     "ThemeSwitch",
+    "theme_from_request",
     "Feedback",
 ]
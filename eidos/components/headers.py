@@ -1,17 +1,133 @@
+import functools
+import html
+from collections.abc import Iterable
+from dataclasses import dataclass
 from typing import Literal, Optional
+from urllib.parse import urlsplit
 
-from air import Link, Meta, Script, Tag
+from air import Link, Meta, Noscript, Raw, Script, Style, Tag
 from airpine import RawJS
 
+from ..assets import THEME_FILES, asset_url, get_css_bundle_url, theme_css_files
+from ..purge import CRITICAL_CLASSES, critical_css, get_purged_css_url
+from ..tailwind import get_tailwind_css_url
+from ..vendor import get_vendored_assets
+from .theme import THEME_COOKIE
 
-def get_css_urls() -> list[str]:
-    """Return list of CSS URLs for EidosUI."""
-    return [
-        "/eidos/css/styles.css",
-        "/eidos/css/themes/eidos-variables.css",
-        "/eidos/css/themes/light.css",
-        "/eidos/css/themes/dark.css",
-    ]
+TAILWIND_URL = "https://cdn.tailwindcss.com"
+LUCIDE_URL = "https://unpkg.com/lucide@latest"
+ALPINE_URL = "https://cdn.jsdelivr.net/npm/alpinejs@3.x.x/dist/cdn.min.js"
+
+
+# Turns the preloaded EidosUI stylesheets into stylesheets; script-created links
+# do not block rendering, unlike switching the rel of the parsed ones
+DEFERRED_STYLESHEETS_JS = """
+document.querySelectorAll('link[data-eidos-deferred]').forEach(function (link) {
+    var sheet = link.cloneNode();
+    sheet.rel = 'stylesheet';
+    sheet.removeAttribute('as');
+    sheet.removeAttribute('data-eidos-deferred');
+    link.replaceWith(sheet);
+});
+"""
+
+
+def get_css_urls(theme: str | None = None) -> list[str]:
+    """Return list of content-hashed CSS URLs for EidosUI, from the asset manifest.
+
+    Args:
+        theme: Include only this theme's stylesheet (default: all themes)
+    """
+    return [asset_url(name) for name in theme_css_files(theme)]
+
+
+def _stylesheet_urls(bundle_css: bool, purge_css: bool, theme: str | None = None) -> list[str]:
+    """EidosUI stylesheets to link: the purged bundle, the full bundle, or the individual files."""
+    if purge_css:
+        return [get_purged_css_url()]
+    return [get_css_bundle_url(theme)] if bundle_css else get_css_urls(theme)
+
+
+def _stylesheet_links(bundle_css: bool, purge_css: bool, theme: str | None) -> list[tuple[str, dict[str, str]]]:
+    """Stylesheet URLs, each with the ``data-eidos-<theme>`` URLs theme.js swaps to when the theme changes.
+
+    Only a server-rendered theme links theme-specific stylesheets, so otherwise there is nothing to swap.
+    """
+    urls = _stylesheet_urls(bundle_css, purge_css, theme)
+    if theme is None:
+        return [(url, {}) for url in urls]
+    per_theme = {name: _stylesheet_urls(bundle_css, purge_css, name) for name in THEME_FILES}
+    links = []
+    for index, url in enumerate(urls):
+        alternates = {f"data_eidos_{name}": theme_urls[index] for name, theme_urls in per_theme.items()}
+        links.append((url, alternates if len(set(alternates.values())) > 1 else {}))
+    return links
+
+
+@dataclass(frozen=True)
+class ResourceHint:
+    """A ``preconnect``, ``dns-prefetch`` or ``preload`` hint for one URL."""
+
+    rel: Literal["preconnect", "dns-prefetch", "preload"]
+    href: str
+    as_: str | None = None
+
+    def to_tag(self) -> Tag:
+        """The hint as a ``<link>`` element."""
+        return Link(rel=self.rel, href=self.href, as_=self.as_)
+
+    def to_header(self) -> str:
+        """The hint as one value of an HTTP ``Link`` header."""
+        value = f"<{self.href}>; rel={self.rel}"
+        return f"{value}; as={self.as_}" if self.as_ else value
+
+
+def get_resource_hints(
+    include_tailwind: bool = True,
+    include_lucide: bool = True,
+    include_alpine: bool = True,
+    include_eidos_js: bool = True,
+    include_theme_switcher: bool = True,
+    bundle_css: bool = True,
+    vendored: bool = False,
+    static_tailwind: bool = False,
+    purge_css: bool = False,
+    theme: Literal["light", "dark"] | None = None,
+) -> list[ResourceHint]:
+    """Resource hints for the assets ``EidosHeaders`` loads with the same flags.
+
+    Third-party origins get ``preconnect`` (and ``dns-prefetch`` for browsers
+    without preconnect support); local stylesheets and scripts get ``preload``.
+    Vendored libraries are same-origin, so they need no connection hints.
+
+    Returns:
+        Hints in the order the browser should act on them
+    """
+    scripts = []
+    if include_tailwind and not static_tailwind:
+        scripts.append(TAILWIND_URL)
+    if include_lucide:
+        scripts.append(LUCIDE_URL)
+    if include_alpine:
+        scripts.append(ALPINE_URL)
+    origins = [] if vendored else list(dict.fromkeys(f"{url.scheme}://{url.netloc}" for url in map(urlsplit, scripts)))
+
+    hints = [ResourceHint("preconnect", origin) for origin in origins]
+    hints += [ResourceHint("dns-prefetch", origin) for origin in origins]
+    css_urls = _stylesheet_urls(bundle_css, purge_css, theme)
+    if include_tailwind and static_tailwind:
+        css_urls.append(get_tailwind_css_url())
+    hints += [ResourceHint("preload", url, as_="style") for url in css_urls]
+    if include_theme_switcher:
+        hints.append(ResourceHint("preload", asset_url("js/theme.js"), as_="script"))
+    if include_eidos_js:
+        hints.append(ResourceHint("preload", asset_url("js/eidos.js"), as_="script"))
+    return hints
+
+
+def link_header(hints: list[ResourceHint]) -> str:
+    """Combine hints into the value of a single HTTP ``Link`` header."""
+    return ", ".join(hint.to_header() for hint in hints)
 
 
 def EidosHeaders(
@@ -21,9 +137,22 @@ def EidosHeaders(
     include_eidos_js: bool = True,
     include_theme_switcher: bool = True,
     force_theme: Optional[Literal["light", "dark"]] = None,
-) -> list[Tag]:
+    bundle_css: bool = True,
+    resource_hints: bool = True,
+    vendored: bool = False,
+    static_tailwind: bool = False,
+    purge_css: bool = False,
+    inline_critical: bool = False,
+    critical_classes: Iterable[str] | None = None,
+    theme: Literal["light", "dark"] | None = None,
+    nonce: str | None = None,
+) -> list[Raw]:
     """Complete EidosUI headers with EidosUI JavaScript support.
 
+    The tags depend only on the flags and the URLs of the generated
+    stylesheets, so each combination is rendered once and the same
+    pre-serialized tags are returned on later calls.
+
     Args:
         include_tailwind: Include Tailwind CSS CDN
         include_lucide: Include Lucide Icons CDN
@@ -31,14 +160,127 @@ def EidosHeaders(
         include_eidos_js: Include EidosUI JavaScript (navigation, future features)
         include_theme_switcher: Include theme switching functionality
         force_theme: Force a specific theme ("light" or "dark"), ignoring user preference
+        bundle_css: Link the single minified, content-hashed CSS bundle instead
+            of the individual stylesheets from ``get_css_urls()``
+        resource_hints: Include ``preconnect``/``dns-prefetch`` links for the CDN
+            origins and ``preload`` links for the local CSS and JS (see
+            ``get_resource_hints``; ``EarlyHintsMiddleware`` sends the same hints
+            as HTTP headers)
+        vendored: Load pinned copies of Tailwind, Lucide and Alpine from the
+            app (see ``eidos.vendor``) with integrity hashes, instead of the CDNs
+        static_tailwind: Link the utility stylesheet generated by
+            ``eidos.tailwind`` instead of running Tailwind in the browser
+        purge_css: Link the bundle built by ``eidos.purge``, with only the
+            ``styles.css`` rules the app's classes need
+        inline_critical: Inline the CSS for the above-the-fold components in a
+            ``<style>`` block and load the stylesheets without blocking rendering
+        critical_classes: Classes of the page's above-the-fold components, e.g.
+            collected with ``track_classes()`` while rendering the layout
+            (default: ``eidos.purge.CRITICAL_CLASSES``: NavBar, headings, buttons);
+            the extracted CSS is cached per set of classes
+        theme: Theme the page is rendered in on the server, usually from
+            ``theme_from_request``; the app sets ``data-theme`` on ``<html>``.
+            Only this theme's stylesheet is linked, no inline theme script is
+            needed, and ``ThemeSwitch`` stores the choice in a cookie
+        nonce: Content-Security-Policy nonce added to every ``<script>`` and
+            ``<style>`` tag; applied to the cached tags per call, so it can
+            change per request
+
+    Example:
+        Head(*EidosHeaders(nonce=request.state.csp_nonce))
+
+        theme = theme_from_request(request)
+        Html(Head(*EidosHeaders(theme=theme)), Body(...), data_theme=theme)
     """
-    headers = [
+    # Part of the cache key, so rebuilding a generated stylesheet relinks it
+    generated_css_urls = (
+        get_purged_css_url() if purge_css else None,
+        get_tailwind_css_url() if include_tailwind and static_tailwind else None,
+    )
+    tags = _render_headers(
+        include_tailwind,
+        include_lucide,
+        include_alpine,
+        include_eidos_js,
+        include_theme_switcher,
+        force_theme,
+        bundle_css,
+        resource_hints,
+        vendored,
+        static_tailwind,
+        purge_css,
+        (frozenset(critical_classes) if critical_classes is not None else CRITICAL_CLASSES)
+        if inline_critical
+        else None,
+        theme,
+        generated_css_urls,
+    )
+    if nonce is None:
+        return list(tags)
+    attribute = f' nonce="{html.escape(nonce)}"'
+    return [_with_attribute(tag, attribute) for tag in tags]
+
+
+def _with_attribute(tag: Raw, attribute: str) -> Raw:
+    """Insert ``attribute`` into a serialized ``<script>`` or ``<style>`` tag; leave others alone."""
+    markup = str(tag)
+    for name in ("<script", "<style"):
+        if markup.startswith(name):
+            return Raw(name + attribute + markup[len(name) :])
+    return tag
+
+
+# Bounded: with inline_critical, each page layout adds an entry
+@functools.lru_cache(maxsize=128)
+def _render_headers(
+    include_tailwind: bool,
+    include_lucide: bool,
+    include_alpine: bool,
+    include_eidos_js: bool,
+    include_theme_switcher: bool,
+    force_theme: Literal["light", "dark"] | None,
+    bundle_css: bool,
+    resource_hints: bool,
+    vendored: bool,
+    static_tailwind: bool,
+    purge_css: bool,
+    critical_classes: frozenset[str] | None,
+    theme: Literal["light", "dark"] | None,
+    generated_css_urls: tuple[str | None, str | None],
+) -> tuple[Raw, ...]:
+    """Build the header tags for one flag combination and serialize each to ``Raw``.
+
+    ``generated_css_urls`` (the purged and Tailwind stylesheet URLs) only keys the cache.
+    """
+    headers: list[Tag] = [
         Meta(charset="UTF-8"),
         Meta(name="viewport", content="width=device-width, initial-scale=1.0"),
     ]
 
-    # Theme init (before other scripts to prevent FOUC)
-    if force_theme:
+    # Resource hints first, so connections and fetches start before anything blocks
+    if resource_hints:
+        hints = get_resource_hints(
+            include_tailwind=include_tailwind,
+            include_lucide=include_lucide,
+            include_alpine=include_alpine,
+            include_eidos_js=include_eidos_js,
+            include_theme_switcher=include_theme_switcher,
+            bundle_css=bundle_css,
+            vendored=vendored,
+            static_tailwind=static_tailwind,
+            purge_css=purge_css,
+            theme=theme,
+        )
+        if critical_classes is not None:
+            # The deferred stylesheets are preloaded by their own links below
+            deferred = set(_stylesheet_urls(bundle_css, purge_css, theme))
+            hints = [hint for hint in hints if hint.href not in deferred]
+        headers.extend(hint.to_tag() for hint in hints)
+
+    # Theme init (before other scripts to prevent FOUC), unless the server rendered data-theme
+    if theme is not None:
+        pass
+    elif force_theme:
         theme_init = RawJS(f"""
 (function() {{
     document.documentElement.setAttribute('data-theme', '{force_theme}');
@@ -57,33 +299,52 @@ def EidosHeaders(
 """)
         headers.append(Script(str(theme_init)))
 
+    # Critical CSS before the blocking library scripts, so the first paint does not wait on them
+    if critical_classes is not None:
+        headers.append(Style(critical_css(critical_classes, theme)))
+        for css_url, alternates in _stylesheet_links(bundle_css, purge_css, theme):
+            headers.append(Link(rel="preload", href=css_url, as_="style", data_eidos_deferred="", **alternates))
+            headers.append(Noscript(Link(rel="stylesheet", href=css_url)))
+        # A script rather than onload handlers, which a nonce-based CSP blocks
+        headers.append(Script(DEFERRED_STYLESHEETS_JS))
+
+    # Vendored libraries are looked up only when used, so their files are optional otherwise
+    vendor = get_vendored_assets() if vendored else {}
+
+    def library(key: str, cdn_url: str, **attrs: bool) -> Tag:
+        if key in vendor:
+            return Script(src=vendor[key].url, integrity=vendor[key].integrity, **attrs)
+        return Script(src=cdn_url, **attrs)
+
     # Core libraries
-    if include_tailwind:
-        headers.append(Script(src="https://cdn.tailwindcss.com"))
+    if include_tailwind and not static_tailwind:
+        headers.append(library("tailwind", TAILWIND_URL))
 
     if include_lucide:
-        headers.append(Script(src="https://unpkg.com/lucide@latest"))
+        headers.append(library("lucide", LUCIDE_URL))
 
     # EidosUI CSS
-    for css_url in get_css_urls():
-        headers.append(Link(rel="stylesheet", href=css_url))
+    if critical_classes is None:
+        for css_url, alternates in _stylesheet_links(bundle_css, purge_css, theme):
+            headers.append(Link(rel="stylesheet", href=css_url, **alternates))
+
+    # Generated utilities after the EidosUI CSS, so they override it as the CDN's would
+    if include_tailwind and static_tailwind:
+        headers.append(Link(rel="stylesheet", href=get_tailwind_css_url()))
 
     # Theme switcher (before Alpine)
     if include_theme_switcher:
-        headers.append(Script(src="/eidos/js/theme.js", defer=True))
+        # data-cookie switches theme.js from localStorage to the cookie theme_from_request reads
+        cookie = {"data_cookie": THEME_COOKIE} if theme is not None else {}
+        headers.append(Script(src=asset_url("js/theme.js"), defer=True, **cookie))
 
     # EidosUI JavaScript (before Alpine)
     if include_eidos_js:
-        headers.append(Script(src="/eidos/js/eidos.js", defer=True))
+        headers.append(Script(src=asset_url("js/eidos.js"), defer=True))
 
     # Alpine.js (must load after theme.js and eidos.js)
     if include_alpine:
-        headers.append(
-            Script(
-                src="https://cdn.jsdelivr.net/npm/alpinejs@3.x.x/dist/cdn.min.js",
-                defer=True,
-            )
-        )
+        headers.append(library("alpine", ALPINE_URL, defer=True))
 
     # Lucide initialization
     if include_lucide:
@@ -98,4 +359,4 @@ if (document.readyState === 'loading') {
 """)
         headers.append(Script(str(lucide_init)))
 
-    return headers
+    return tuple(Raw(str(tag)) for tag in headers)
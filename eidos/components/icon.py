@@ -0,0 +1,145 @@
+"""Server-rendered SVG icons for EidosUI"""
+
+import functools
+import os
+import re
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any
+
+from air import Raw, Tag, svg
+
+from ..utils import stringify
+
+#: Icons shipped with EidosUI (a subset of Lucide, ISC licensed)
+ICON_DIR = Path(__file__).parent.parent / "icons"
+
+#: Prefix of the sprite's symbol ids: ``<use href="#eidos-icon-menu">``
+SYMBOL_PREFIX = "eidos-icon-"
+
+SVG_NAMESPACE = "http://www.w3.org/2000/svg"
+
+# Searched in order, so directories added later take precedence over the built-in icons
+_icon_dirs: list[Path] = [ICON_DIR]
+
+# Icons used while collect_icons() is active, in order of first use
+_collected: ContextVar[dict[str, None] | None] = ContextVar("eidos_icons", default=None)
+
+RE_ICON_NAME = re.compile(r"[a-z0-9]+(?:-[a-z0-9]+)*")
+RE_SVG_BODY = re.compile(r"<svg\b[^>]*>(.*)</svg>", re.DOTALL)
+RE_BETWEEN_TAGS = re.compile(r">\s+<")
+
+
+def add_icon_directory(directory: str | os.PathLike[str]) -> None:
+    """Make the ``<name>.svg`` files in ``directory`` available to ``Icon``.
+
+    Any 24x24 stroke icon set works, for example the ``icons`` directory of
+    the ``lucide-static`` package. Its icons take precedence over the
+    built-in ones with the same name.
+    """
+    _icon_dirs.insert(0, Path(directory))
+    icon_body.cache_clear()
+
+
+@functools.cache
+def icon_body(name: str) -> str:
+    """Inner markup of the icon ``name`` (its paths, without the ``<svg>`` element).
+
+    Read from disk once per process.
+
+    Raises:
+        ValueError: If no icon directory has ``<name>.svg``
+    """
+    if RE_ICON_NAME.fullmatch(name):
+        for directory in _icon_dirs:
+            path = directory / f"{name}.svg"
+            if path.is_file():
+                match = RE_SVG_BODY.search(path.read_text(encoding="utf-8"))
+                if match:
+                    return RE_BETWEEN_TAGS.sub("><", match.group(1).strip())
+    searched = ", ".join(str(directory) for directory in _icon_dirs)
+    raise ValueError(f"Unknown icon {name!r}: no {name}.svg in {searched}")
+
+
+def Icon(
+    name: str,
+    class_: str | list[str] | None = None,
+    size: int | str = 24,
+    stroke_width: float | str = 2,
+    label: str | None = None,
+    **kwargs: Any,
+) -> Tag:
+    """Inline SVG icon, rendered on the server.
+
+    Inside ``collect_icons()`` the icon is a ``<use>`` reference to a symbol
+    that ``IconSprite()`` renders once per page; otherwise the paths are
+    inlined. Either way no icon library or client-side script is needed.
+
+    Args:
+        name: Icon name, e.g. ``"menu"``; see ``ICON_DIR`` and ``add_icon_directory``
+        class_: CSS classes for the ``<svg>`` element
+        size: Width and height in pixels, unless set by CSS classes
+        stroke_width: Stroke width in icon units (of 24)
+        label: Accessible name; without one the icon is hidden from screen readers
+        **kwargs: Additional attributes for the ``<svg>`` element
+
+    Example:
+        Icon("menu", class_="w-6 h-6")
+        Button(Icon("search", size=16), "Search")
+    """
+    body = icon_body(name)
+    collected = _collected.get()
+    if collected is not None:
+        collected[name] = None
+        content: Tag = svg.Use(href=f"#{SYMBOL_PREFIX}{name}")
+    else:
+        content = Raw(body)
+
+    accessibility = {"role": "img", "aria_label": label} if label else {"aria_hidden": "true"}
+    return svg.Svg(
+        content,
+        xmlns=SVG_NAMESPACE,
+        width=str(size),
+        height=str(size),
+        viewBox="0 0 24 24",
+        fill="none",
+        stroke="currentColor",
+        stroke_width=str(stroke_width),
+        stroke_linecap="round",
+        stroke_linejoin="round",
+        class_=stringify(class_) or None,
+        **accessibility,
+        **kwargs,
+    )
+
+
+@contextmanager
+def collect_icons() -> Iterator[None]:
+    """Render icons as references to one sprite per page instead of inline paths.
+
+    Icons created while active are recorded, and ``IconSprite()`` (created
+    last, inside the same block) renders the symbols they refer to.
+
+    Example:
+        with collect_icons():
+            page = Body(NavBar(...), content, IconSprite())
+    """
+    token = _collected.set({})
+    try:
+        yield
+    finally:
+        _collected.reset(token)
+
+
+def IconSprite(*names: str) -> Tag:
+    """Hidden ``<svg>`` with one ``<symbol>`` per icon, for icons rendered with ``<use>``.
+
+    Args:
+        *names: Icons to include (default: those used so far inside ``collect_icons()``)
+    """
+    if not names:
+        names = tuple(_collected.get() or ())
+    symbols = [svg.Symbol(Raw(icon_body(name)), id=f"{SYMBOL_PREFIX}{name}", viewBox="0 0 24 24") for name in names]
+    return svg.Svg(*symbols, xmlns=SVG_NAMESPACE, style="display:none", aria_hidden="true")
@@ -1,11 +1,12 @@
 from typing import Any, Final
 from uuid import uuid4
 
-from air import A, Div, I, Tag
+from air import A, Div, Tag
 from airpine import Alpine
 
 from ..tags import *
 from ..utils import stringify
+from .icon import Icon
 
 
 class ScrollspyT:
@@ -42,8 +43,8 @@ def NavBar(
 
     # Mobile toggle button with hamburger/close icon
     mobile_icon = A(
-        I(**Alpine.x.show("!open"), data_lucide="menu", class_="w-6 h-6"),
-        I(**Alpine.x.show("open") | Alpine.x.cloak(), data_lucide="x", class_="w-6 h-6"),
+        Icon("menu", class_="w-6 h-6", **Alpine.x.show("!open")),
+        Icon("x", class_="w-6 h-6", **(Alpine.x.show("open") | Alpine.x.cloak())),
         class_="md:hidden cursor-pointer p-2 eidos-navbar-toggle rounded-lg transition-colors",
         role="button",
         aria_label="Toggle navigation",
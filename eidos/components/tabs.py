@@ -1,11 +1,22 @@
+import hashlib
+import inspect
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from air import Button, Div, Tag
 from airpine import Alpine
+from starlette.requests import Request
+from starlette.responses import HTMLResponse, Response
 
 from .. import styles
 from ..utils import stringify
 
+#: Renders the panel of a tab from its URL; ``None`` leaves it to be fetched after load
+PanelResolver = Callable[[str], Tag | str | None]
+AsyncPanelResolver = Callable[[str], Awaitable[Tag | str | None]]
+
+TabSpec = tuple[str, str, Tag | None] | tuple[str, str]
+
 
 def AlpineTabs(
     *tabs: tuple[str, Tag],
@@ -69,19 +80,35 @@ def AlpineTabs(
 
 
 def HTMXTabs(
-    *tabs: tuple[str, str, Tag | None] | tuple[str, str],
+    *tabs: TabSpec,
     selected: int = 0,
     class_: str = "",
     panel_id: str = "tab-content",
+    prefetch: bool = False,
+    cache_panels: bool = False,
+    resolver: PanelResolver | None = None,
     **kwargs: Any,
 ) -> Tag:
     """HTMX-based tabs with server-side content switching.
 
+    ``prefetch`` and ``cache_panels`` are handled by ``eidos.js``
+    (``EidosHeaders(include_eidos_js=True)``); without it the tabs fetch on
+    every click as usual.
+
     Args:
         *tabs: Variable number of (label, url) or (label, url, content) tuples
         selected: Index of the initially selected tab (0-based)
         class_: Additional classes for the container
         panel_id: ID for the tab content panel (default: "tab-content")
+        prefetch: Fetch a tab's content when the pointer enters or focus
+            reaches its button, so it is usually there by the time of the click
+        cache_panels: Keep fetched panels in the page, so revisiting a tab
+            shows it instantly; it is then revalidated with ``If-None-Match``,
+            which ``panel_response`` answers with ``304`` when unchanged
+        resolver: Renders the selected panel from its URL when no content is
+            given for it, usually the function behind that URL's route, so the
+            page arrives with the panel instead of fetching it after load.
+            For async resolvers, use ``AsyncHTMXTabs``
 
     Returns:
         Tag: Complete tabs component with HTMX interactivity
@@ -91,7 +118,18 @@ def HTMXTabs(
             ("General", "/settings/general", Div(P("General settings"))),
             ("Security", "/settings/security"),
             ("Advanced", "/settings/advanced"),
-            selected=0
+            selected=0,
+            prefetch=True,
+            cache_panels=True,
+        )
+
+        # Render whichever tab is selected inline, with the routes' own functions
+        panels = {"/settings/general": general, "/settings/security": security}
+        HTMXTabs(
+            ("General", "/settings/general"),
+            ("Security", "/settings/security"),
+            selected=1,
+            resolver=lambda url: panels[url](),
         )
     """
     tab_buttons = []
@@ -99,7 +137,7 @@ def HTMXTabs(
 
     for i, tab in enumerate(tabs):
         label, url = tab[0], tab[1]
-        content = tab[2] if len(tab) > 2 else None
+        content = _tab_content(tab)
         is_selected = i == selected
 
         if is_selected and content:
@@ -117,25 +155,99 @@ def HTMXTabs(
         )
         tab_buttons.append(tab_button)
 
+    if not initial_content and resolver is not None and tabs:
+        resolved = resolver(tabs[selected][1])
+        if inspect.isawaitable(resolved):
+            if inspect.iscoroutine(resolved):
+                resolved.close()
+            raise TypeError("HTMXTabs resolver returned an awaitable; use `await AsyncHTMXTabs(...)` instead")
+        initial_content = resolved
+
     tab_list = Div(
         *tab_buttons,
         role="tablist",
         class_=styles.tabs.list,
     )
 
+    # Fetched after load only when the selected panel could not be rendered inline
+    fallback = (
+        {}
+        if initial_content
+        else {"hx_get": tabs[selected][1], "hx_trigger": "load delay:100ms", "hx_swap": "innerHTML"}
+    )
     tab_panel = Div(
         initial_content if initial_content else "",
         id=panel_id,
         role="tabpanel",
         class_=stringify(styles.tabs.panel, styles.tabs.panel_active),
-        hx_get=tabs[selected][1] if not initial_content else None,
-        hx_trigger="load delay:100ms" if not initial_content else None,
-        hx_swap="innerHTML" if not initial_content else None,
+        **fallback,
     )
 
+    # Read by eidos.js, e.g. data-eidos-tabs="prefetch cache"
+    modes = " ".join(mode for mode, enabled in (("prefetch", prefetch), ("cache", cache_panels)) if enabled)
+    if modes:
+        kwargs["data_eidos_tabs"] = modes
+
     return Div(
         tab_list,
         tab_panel,
         class_=stringify(styles.tabs.container, class_),
         **kwargs,
     )
+
+
+async def AsyncHTMXTabs(
+    *tabs: TabSpec,
+    resolver: AsyncPanelResolver | PanelResolver,
+    selected: int = 0,
+    **kwargs: Any,
+) -> Tag:
+    """``HTMXTabs`` with the selected panel rendered inline by an async ``resolver``.
+
+    Args:
+        *tabs: Variable number of (label, url) or (label, url, content) tuples
+        resolver: Async (or sync) function rendering a panel from its URL;
+            ``None`` leaves the panel to be fetched after load
+        selected: Index of the initially selected tab (0-based)
+        **kwargs: Passed to ``HTMXTabs``
+
+    Example:
+        async def panel(url: str) -> Tag:
+            return await render_settings(url.rsplit("/", 1)[-1])
+
+        Body(await AsyncHTMXTabs(("General", "/settings/general"), ("Security", "/settings/security"), resolver=panel))
+    """
+    content: Tag | str | None = None
+    if tabs and not _tab_content(tabs[selected]):
+        resolved = resolver(tabs[selected][1])
+        content = await resolved if inspect.isawaitable(resolved) else resolved
+    return HTMXTabs(*tabs, selected=selected, resolver=lambda url: content, **kwargs)
+
+
+def _tab_content(tab: TabSpec) -> Tag | None:
+    return tab[2] if len(tab) > 2 else None
+
+
+def panel_response(request: Request, content: Tag | str) -> Response:
+    """Response for an ``HTMXTabs`` panel, with an ``ETag`` so unchanged panels cost a ``304``.
+
+    Tabs with ``cache_panels=True`` revalidate panels they have shown before
+    with ``If-None-Match``; when the rendered content is the same, the
+    response has no body.
+
+    Args:
+        request: The panel request
+        content: The rendered panel
+
+    Example:
+        @app.get("/settings/general")
+        def general(request: Request):
+            return panel_response(request, Div(P("General settings")))
+    """
+    body = str(content)
+    etag = f'"{hashlib.sha256(body.encode()).hexdigest()[:16]}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache", "Vary": "HX-Request"}
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(",")) or if_none_match.strip() == "*":
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(body, headers=headers)
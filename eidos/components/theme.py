@@ -4,15 +4,41 @@ from typing import Literal
 
 from air import Button
 from airpine import Alpine
+from starlette.requests import Request
 
 from ..utils import stringify
 
+#: Cookie the theme switcher stores the chosen theme in, when the theme is rendered on the server
+THEME_COOKIE = "eidos-theme"
+
+
+def theme_from_request(request: Request) -> Literal["light", "dark"]:
+    """The theme to render a page in, for ``EidosHeaders(theme=...)`` and ``Html(data_theme=...)``.
+
+    Reads the ``THEME_COOKIE`` set by ``ThemeSwitch``; before the user has
+    chosen, falls back to the ``Sec-CH-Prefers-Color-Scheme`` client hint
+    (sent by Chromium browsers once the app asks for it with
+    ``Accept-CH: Sec-CH-Prefers-Color-Scheme``), then to ``"light"``.
+
+    Example:
+        @app.page
+        def index(request: Request):
+            theme = theme_from_request(request)
+            return Html(Head(*EidosHeaders(theme=theme)), Body(NavBar(ThemeSwitch(theme=theme))), data_theme=theme)
+    """
+    for value in (request.cookies.get(THEME_COOKIE), request.headers.get("sec-ch-prefers-color-scheme")):
+        choice = (value or "").strip('"')
+        if choice in ("light", "dark"):
+            return "dark" if choice == "dark" else "light"
+    return "light"
+
 
 def ThemeSwitch(
     light_icon: str = "☀️",
     dark_icon: str = "🌙",
     class_: str = "",
     variant: Literal["icon", "text"] = "icon",
+    theme: Literal["light", "dark"] | None = None,
     **props,
 ):
     """Theme switcher button that toggles between light and dark themes.
@@ -21,7 +47,8 @@ def ThemeSwitch(
 
     Features:
     - Respects system color scheme preference as default
-    - Persists user's choice in localStorage
+    - Persists user's choice in localStorage, or in the ``THEME_COOKIE`` cookie
+      when the page's theme is rendered on the server with ``EidosHeaders(theme=...)``
     - Updates the data-theme attribute on document root
     - Changes button icon/text based on current theme
 
@@ -30,6 +57,8 @@ def ThemeSwitch(
         dark_icon: Icon/text shown in dark mode (default: 🌙)
         class_: Additional CSS classes
         variant: Display variant - "icon" for just icons, "text" for labels
+        theme: Theme the page is rendered in, if known on the server; the
+            button then shows the right icon before Alpine starts
         **props: Additional button props
 
     Example:
@@ -59,8 +88,9 @@ def ThemeSwitch(
     else:
         x_text_expr = "$store.theme.getText()"
 
+    dark = theme == "dark"
     return Button(
-        f"{dark_icon}" if variant == "icon" else "Dark Mode",
+        (light_icon if dark else dark_icon) if variant == "icon" else ("Light Mode" if dark else "Dark Mode"),
         class_=button_class,
         type="button",
         **(
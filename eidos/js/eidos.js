@@ -48,3 +48,85 @@ if (document.readyState === 'loading') {
 } else {
     initScrollspy();
 }
+
+// HTMXTabs(prefetch=True, cache_panels=True): panels fetched ahead of the
+// click and kept per URL, so switching tabs does not wait on the server
+const tabPanels = new Map();      // url -> {html, etag}
+const pendingPanels = new Map();  // url -> Promise of the entry
+const prefetchedTabs = new WeakSet();
+
+function tabModes(button) {
+    const tabs = button.closest('[data-eidos-tabs]');
+    return tabs ? tabs.dataset.eidosTabs.split(' ') : [];
+}
+
+function fetchPanel(url) {
+    if (pendingPanels.has(url)) return pendingPanels.get(url);
+    const cached = tabPanels.get(url);
+    const headers = { 'HX-Request': 'true' };
+    if (cached && cached.etag) headers['If-None-Match'] = cached.etag;
+    const pending = fetch(url, { headers, cache: 'no-store', credentials: 'same-origin' })
+        .then(async response => {
+            if (response.status === 304 && cached) return cached;
+            if (!response.ok) throw new Error(`${response.status} ${url}`);
+            const entry = { html: await response.text(), etag: response.headers.get('ETag') };
+            tabPanels.set(url, entry);
+            return entry;
+        })
+        .finally(() => pendingPanels.delete(url));
+    pendingPanels.set(url, pending);
+    return pending;
+}
+
+function swapPanel(target, html) {
+    if (window.htmx && htmx.swap) {
+        htmx.swap(target, html, { swapStyle: 'innerHTML' });
+    } else {
+        target.innerHTML = html;
+        if (window.htmx) htmx.process(target);
+    }
+}
+
+function showTab(button) {
+    const url = button.getAttribute('hx-get');
+    const target = document.querySelector(button.getAttribute('hx-target'));
+    button.closest('[role="tablist"]').querySelectorAll('[role="tab"]').forEach(tab => {
+        tab.setAttribute('aria-selected', tab === button ? 'true' : 'false');
+        tab.classList.toggle('eidos-tab-active', tab === button);
+    });
+
+    const caching = tabModes(button).includes('cache');
+    const cached = tabPanels.get(url);
+    if (!caching) tabPanels.delete(url);  // a prefetched panel is used once
+    if (cached) {
+        swapPanel(target, cached.html);
+        if (!caching) return;
+    }
+    // Fetch the panel, or revalidate the cached one (a 304 keeps it)
+    fetchPanel(url).then(entry => {
+        if (!caching) tabPanels.delete(url);
+        if (entry !== cached && button.getAttribute('aria-selected') === 'true') swapPanel(target, entry.html);
+    }).catch(() => {
+        // Let htmx request it, and handle the error, as it would without caching
+        if (!cached && window.htmx) htmx.ajax('GET', url, { target, swap: 'innerHTML' });
+    });
+}
+
+document.addEventListener('htmx:beforeRequest', (event) => {
+    const button = event.detail.elt;
+    if (!button.matches('[data-eidos-tabs] [role="tab"][hx-get]')) return;
+    event.preventDefault();
+    showTab(button);
+});
+
+function prefetchTab(event) {
+    const button = event.target.closest && event.target.closest('[data-eidos-tabs] [role="tab"][hx-get]');
+    if (!button || prefetchedTabs.has(button) || !tabModes(button).includes('prefetch')) return;
+    prefetchedTabs.add(button);
+    const url = button.getAttribute('hx-get');
+    if (!tabPanels.has(url)) fetchPanel(url).catch(() => prefetchedTabs.delete(button));
+}
+
+document.addEventListener('mouseover', prefetchTab);
+document.addEventListener('focusin', prefetchTab);
+document.addEventListener('touchstart', prefetchTab, { passive: true });
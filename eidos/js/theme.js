@@ -1,9 +1,42 @@
 // EidosUI Theme Switcher using Alpine.js
+
+// Set by EidosHeaders(theme=...): the server renders data-theme from this cookie
+const themeCookie = document.currentScript && document.currentScript.dataset.cookie;
+
+// Replace each theme-specific stylesheet with the new theme's, then switch
+// data-theme once they have loaded so the page never renders unstyled
+function swapThemeStylesheets(theme) {
+    const root = document.documentElement;
+    const links = [...document.querySelectorAll(`link[data-eidos-${theme}]`)]
+        .filter(link => link.getAttribute('href') !== link.getAttribute(`data-eidos-${theme}`));
+    let pending = links.length;
+    if (!pending) {
+        root.setAttribute('data-theme', theme);
+        return;
+    }
+    links.forEach(link => {
+        const next = link.cloneNode();
+        next.removeAttribute('onload');
+        next.rel = 'stylesheet';
+        next.href = link.getAttribute(`data-eidos-${theme}`);
+        next.onload = next.onerror = () => {
+            link.remove();
+            if (--pending === 0) root.setAttribute('data-theme', theme);
+        };
+        link.after(next);
+    });
+}
+
 document.addEventListener('alpine:init', () => {
     Alpine.store('theme', {
         current: 'light',
         
         init() {
+            const rendered = document.documentElement.getAttribute('data-theme');
+            if (themeCookie && (rendered === 'light' || rendered === 'dark')) {
+                this.current = rendered;
+                return;
+            }
             const saved = localStorage.getItem('eidos-theme-preference');
             this.current = (saved === 'light' || saved === 'dark')
                 ? saved
@@ -17,6 +50,11 @@ document.addEventListener('alpine:init', () => {
         },
         
         apply() {
+            if (themeCookie) {
+                document.cookie = `${themeCookie}=${this.current}; path=/; max-age=31536000; samesite=lax`;
+                swapThemeStylesheets(this.current);
+                return;
+            }
             document.documentElement.setAttribute('data-theme', this.current);
             localStorage.setItem('eidos-theme-preference', this.current);
         },
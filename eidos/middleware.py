@@ -0,0 +1,106 @@
+"""ASGI middleware for EidosUI apps"""
+
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from starlette.datastructures import MutableHeaders
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .components.headers import ResourceHint, get_resource_hints, link_header
+from .components.theme import theme_from_request
+
+EARLY_HINT_EXTENSION = "http.response.early_hint"
+
+
+class EarlyHintsMiddleware:
+    """Announce the assets of ``EidosHeaders`` before the page is rendered.
+
+    For ``GET`` requests that accept HTML, the resource hints are sent as a
+    ``103 Early Hints`` response when the server supports it (the
+    ``http.response.early_hint`` ASGI extension, e.g. Hypercorn), so the
+    browser can connect to the CDNs and fetch the stylesheet while the app is
+    still rendering. Every HTML response also gets the hints in a ``Link``
+    header, which proxies such as Cloudflare turn into Early Hints themselves.
+
+    The hints are computed per request with ``get_resource_hints``, the same
+    source ``EidosHeaders`` uses, so rebuilt stylesheets and the theme chosen
+    by the request are followed.
+
+    Example:
+        from eidos.middleware import EarlyHintsMiddleware
+
+        app.add_middleware(EarlyHintsMiddleware)
+        # Pass the same flags as EidosHeaders when they differ from the defaults
+        app.add_middleware(EarlyHintsMiddleware, include_alpine=False)
+        # Pages rendered with EidosHeaders(theme=theme_from_request(request)), and a tenant theme
+        app.add_middleware(
+            EarlyHintsMiddleware,
+            server_theme=True,
+            extra_hints=lambda request: [ResourceHint("preload", compile_theme(tenant(request)).url, as_="style")],
+        )
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        hints: list[ResourceHint] | None = None,
+        server_theme: bool = False,
+        extra_hints: Callable[[Request], Iterable[ResourceHint]] | None = None,
+        **flags: Any,
+    ):
+        """Initialize the middleware.
+
+        Args:
+            app: The ASGI app to wrap
+            hints: Fixed hints to send instead of ``get_resource_hints(**flags)``
+            server_theme: Pages pass ``theme=theme_from_request(request)`` to
+                ``EidosHeaders``; hint that theme's stylesheets
+            extra_hints: Hints for stylesheets only some requests link, such as
+                a tenant's ``ThemeCSS``; called per HTML request
+            **flags: The ``EidosHeaders`` flags the app uses, passed to ``get_resource_hints``
+        """
+        self.app = app
+        self.fixed_hints = hints
+        self.server_theme = server_theme
+        self.extra_hints = extra_hints
+        self.flags = flags
+
+    def hints(self, request: Request) -> list[ResourceHint]:
+        """The hints for the page ``request`` renders."""
+        if self.fixed_hints is not None:
+            hints = list(self.fixed_hints)
+        else:
+            flags = self.flags | {"theme": theme_from_request(request)} if self.server_theme else self.flags
+            hints = get_resource_hints(**flags)
+        if self.extra_hints is not None:
+            hints.extend(self.extra_hints(request))
+        return hints
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+        request = Request(scope)
+        if "text/html" not in request.headers.get("accept", ""):
+            await self.app(scope, receive, send)
+            return
+        hints = self.hints(request)
+        if not hints:
+            await self.app(scope, receive, send)
+            return
+
+        if EARLY_HINT_EXTENSION in scope.get("extensions", {}):
+            links = [hint.to_header().encode("latin-1") for hint in hints]
+            await send({"type": EARLY_HINT_EXTENSION, "links": links})
+
+        link = link_header(hints)
+
+        async def send_with_link(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                if headers.get("content-type", "").startswith("text/html"):
+                    headers.append("Link", link)
+            await send(message)
+
+        await self.app(scope, receive, send_with_link)
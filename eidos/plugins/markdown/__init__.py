@@ -11,11 +11,77 @@ Basic usage:
 
     # In your content
     Markdown("# Hello World\\n\\nThis is **markdown**!")
+
+Python-Markdown is imported, and the default renderer built, on first use.
+Call ``warmup()`` at startup to do it eagerly.
 """
 
-from .components import Markdown, MarkdownCSS
-from .renderer import MarkdownRenderer
+import importlib
+from typing import TYPE_CHECKING, Any
+
+from .components import Markdown, MarkdownCSS, warmup
+from .frontmatter import ContentIndex, PageMeta, parse_front_matter, read_front_matter
+
+if TYPE_CHECKING:
+    from .cache import MarkdownFileCache
+    from .extensions.headings import Heading, HeadingsExtension
+    from .extensions.highlight import HighlightExtension, set_highlighter
+    from .extensions.images import ImageExtension, image_size
+    from .extensions.sanitize import DEFAULT_POLICY, SanitizeExtension, SanitizePolicy
+    from .renderer import MarkdownRenderer, RenderResult, get_renderer
+
+# Names that need Python-Markdown, imported from their module on first access
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "MarkdownFileCache": ".cache",
+    "Heading": ".extensions.headings",
+    "HeadingsExtension": ".extensions.headings",
+    "HighlightExtension": ".extensions.highlight",
+    "set_highlighter": ".extensions.highlight",
+    "ImageExtension": ".extensions.images",
+    "image_size": ".extensions.images",
+    "DEFAULT_POLICY": ".extensions.sanitize",
+    "SanitizeExtension": ".extensions.sanitize",
+    "SanitizePolicy": ".extensions.sanitize",
+    "MarkdownRenderer": ".renderer",
+    "RenderResult": ".renderer",
+    "get_renderer": ".renderer",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
 
-__all__ = ["Markdown", "MarkdownCSS", "MarkdownRenderer"]
+__all__ = [
+    "Markdown",
+    "MarkdownCSS",
+    "warmup",
+    "MarkdownRenderer",
+    "MarkdownFileCache",
+    "ContentIndex",
+    "PageMeta",
+    "parse_front_matter",
+    "read_front_matter",
+    "get_renderer",
+    "RenderResult",
+    "Heading",
+    "HeadingsExtension",
+    "SanitizePolicy",
+    "SanitizeExtension",
+    "DEFAULT_POLICY",
+    "HighlightExtension",
+    "set_highlighter",
+    "ImageExtension",
+    "image_size",
+]
 
 __version__ = "0.1.0"
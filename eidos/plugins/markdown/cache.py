@@ -0,0 +1,141 @@
+"""Persistent on-disk cache of rendered markdown files"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Literal, overload
+
+from .frontmatter import parse_front_matter
+from .renderer import MarkdownRenderer, RenderResult
+
+# Bump when the entry format or what gets rendered changes, to ignore old entries
+CACHE_VERSION = "3"
+
+
+class MarkdownFileCache:
+    """Render markdown files through a persistent on-disk cache.
+
+    Each file is looked up by its resolved path, modification time and size
+    combined with the renderer's ``config_key``. When the stat signature
+    changes but the content did not (a fresh checkout, a ``touch``), the entry
+    is recovered from a content-addressed copy instead of being re-rendered.
+
+    Front matter at the top of a file is stripped before rendering; read it
+    with ``read_front_matter`` or index it with ``ContentIndex``.
+
+    Entries are written to a temporary file and atomically renamed into place,
+    so several worker processes can share one cache directory safely.
+
+    Example:
+        cache = MarkdownFileCache("/var/cache/docs-md")
+        cache.warm("docs/")                     # at startup
+        html = cache.render_file("docs/index.md")
+    """
+
+    def __init__(self, cache_dir: str | os.PathLike[str], renderer: MarkdownRenderer | None = None):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory to store rendered entries in (created if missing)
+            renderer: Renderer used on cache misses (defaults to ``MarkdownRenderer()``)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.renderer = renderer or MarkdownRenderer()
+        # path -> (stat key, entry); avoids touching the disk for repeat hits
+        self._memory: dict[Path, tuple[str, dict[str, Any]]] = {}
+
+    @overload
+    def render_file(self, path: str | os.PathLike[str], structured: Literal[False] = False) -> str: ...
+
+    @overload
+    def render_file(self, path: str | os.PathLike[str], structured: Literal[True]) -> RenderResult: ...
+
+    def render_file(self, path: str | os.PathLike[str], structured: bool = False) -> str | RenderResult:
+        """Return the rendered HTML for a markdown file, rendering only on a miss.
+
+        Args:
+            path: Path to the markdown file
+            structured: Return the cached ``RenderResult`` (headings, word count,
+                reading time) instead of just the HTML
+
+        Returns:
+            HTML string as produced by ``MarkdownRenderer.render`` with
+            ``structured=True`` (so headings carry their ids), or a RenderResult
+        """
+        entry = self._entry(Path(path))
+        if structured:
+            return RenderResult.from_dict(entry)
+        html: str = entry["html"]
+        return html
+
+    def warm(self, directory: str | os.PathLike[str], pattern: str = "**/*.md") -> int:
+        """Render every matching file under ``directory`` into the cache.
+
+        Args:
+            directory: Root directory to scan
+            pattern: Glob pattern relative to ``directory``
+
+        Returns:
+            Number of files processed
+        """
+        count = 0
+        for path in sorted(Path(directory).glob(pattern)):
+            if path.is_file():
+                self._entry(path)
+                count += 1
+        return count
+
+    def clear(self) -> None:
+        """Remove all cached entries from memory and disk."""
+        self._memory.clear()
+        for entry in self.cache_dir.glob("*.json"):
+            entry.unlink(missing_ok=True)
+
+    def _entry(self, path: Path) -> dict[str, Any]:
+        path = path.resolve()
+        st = path.stat()
+        config = self.renderer.config_key
+        stat_key = _digest("stat", CACHE_VERSION, str(path), str(st.st_mtime_ns), str(st.st_size), config)
+
+        cached = self._memory.get(path)
+        if cached and cached[0] == stat_key:
+            return cached[1]
+
+        entry = self._read(stat_key)
+        if entry is None:
+            source = path.read_text(encoding="utf-8")
+            content_key = _digest("content", CACHE_VERSION, source, config)
+            entry = self._read(content_key)
+            if entry is None:
+                _, body = parse_front_matter(source)
+                entry = self.renderer.render(body, structured=True).to_dict()
+                self._write(content_key, entry)
+            self._write(stat_key, entry)
+
+        self._memory[path] = (stat_key, entry)
+        return entry
+
+    def _read(self, key: str) -> dict[str, Any] | None:
+        try:
+            with open(self.cache_dir / f"{key}.json", encoding="utf-8") as f:
+                entry: dict[str, Any] = json.load(f)
+                return entry
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, key: str, entry: dict[str, Any]) -> None:
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, prefix=".tmp-", suffix=".json")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp, self.cache_dir / f"{key}.json")
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+
+def _digest(*parts: str) -> str:
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
@@ -1,26 +1,58 @@
 """Markdown components for EidosUI"""
 
+from typing import TYPE_CHECKING
+
 import air
 
-from .renderer import MarkdownRenderer
+from ...assets import asset_url
+
+if TYPE_CHECKING:
+    from .renderer import MarkdownRenderer
+
+# Shared renderer for the default configuration, created on first use so that
+# importing the plugin does not import Python-Markdown
+_renderer: "MarkdownRenderer | None" = None
+
+
+def _get_renderer() -> "MarkdownRenderer":
+    global _renderer
+    if _renderer is None:
+        from .renderer import get_renderer
 
-# Global renderer instance for reuse
-_renderer = MarkdownRenderer()
+        _renderer = get_renderer()
+    return _renderer
 
 
-def Markdown(content: str, class_: str | None = None, **kwargs) -> air.Div:
+def warmup() -> None:
+    """Import Python-Markdown and build the default renderer now.
+
+    The plugin defers both until the first ``Markdown()`` call. Services that
+    prefer to pay that cost at startup, rather than on the first request that
+    renders markdown, can call this once while booting.
+    """
+    _get_renderer().render("")
+
+
+def Markdown(content: str, class_: str | None = None, as_tags: bool = False, **kwargs) -> air.Div:
     """Main markdown component that renders markdown content with theme integration.
 
     Args:
         content: Markdown text to render
         class_: Additional CSS classes to apply
+        as_tags: Build air tags from the markdown element tree instead of
+            wrapping an HTML string in ``air.Raw``, so the result can be
+            inspected, diffed or cached block by block
         **kwargs: Additional attributes to pass to the wrapper div
 
     Returns:
-        air.Div containing the rendered markdown HTML
+        air.Div containing the rendered markdown
     """
+    if as_tags:
+        blocks = _get_renderer().render_tags(content)
+        return air.Div(air.Div(*blocks, class_="eidos-md"), class_=class_, **kwargs)
+
     # Render the markdown content
-    html_content = _renderer.render(content)
+    html_content = _get_renderer().render(content)
 
     return air.Div(air.Raw(html_content), class_=class_, **kwargs)
 
@@ -32,10 +64,10 @@ def MarkdownCSS() -> air.Link:
     markdown styling is available.
 
     Returns:
-        air.Link element pointing to the markdown CSS file
+        air.Link element pointing to the content-hashed markdown CSS file
     """
     return air.Link(
         rel="stylesheet",
-        href="/eidos/plugins/markdown/css/markdown.css",
+        href=asset_url("plugins/markdown/css/markdown.css"),
         type="text/css",
     )
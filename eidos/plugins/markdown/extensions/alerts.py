@@ -1,11 +1,12 @@
 """GitHub-style alerts extension for markdown"""
 
 import re
-import xml.etree.ElementTree as etree
+from copy import deepcopy
 from re import Pattern
 from xml.etree.ElementTree import Element, SubElement
 
 from markdown import Markdown
+from markdown.blockparser import BlockParser
 from markdown.blockprocessors import BlockProcessor
 from markdown.extensions import Extension
 
@@ -14,7 +15,7 @@ class AlertBlockProcessor(BlockProcessor):
     """Process GitHub-style alert blocks"""
 
     # Pattern to match > [!TYPE] at the start of a blockquote
-    RE_ALERT: Pattern[str] = re.compile(r"^> \[!(NOTE|TIP|IMPORTANT|WARNING|CAUTION)\]", re.MULTILINE)
+    RE_ALERT: Pattern[str] = re.compile(r"^> \[!(NOTE|TIP|IMPORTANT|WARNING|CAUTION)\]")
 
     # Alert type configurations
     ALERT_TYPES: dict[str, dict[str, str]] = {
@@ -41,9 +42,35 @@ class AlertBlockProcessor(BlockProcessor):
         },
     }
 
+    # Cheap check that rules out almost every block before RE_ALERT runs
+    PREFIX: str = "> [!"
+
+    # Quote marker (and one optional space) at the start of each line
+    RE_QUOTE_MARKER: Pattern[str] = re.compile(r"^> ?", re.MULTILINE)
+
+    def __init__(self, parser: BlockParser):
+        super().__init__(parser)
+        # Header subtrees are identical for every alert of a type, so build
+        # them once and deep-copy them into each alert
+        self.headers: dict[str, Element] = {
+            alert_type: self._build_header(config) for alert_type, config in self.ALERT_TYPES.items()
+        }
+
+    @staticmethod
+    def _build_header(config: dict[str, str]) -> Element:
+        header = Element("div", {"class": "eidos-alert-header"})
+
+        icon_span = SubElement(header, "span", {"class": "eidos-alert-icon"})
+        icon_span.text = config["icon"]
+
+        title_span = SubElement(header, "span", {"class": "eidos-alert-title"})
+        title_span.text = config["title"]
+
+        return header
+
     def test(self, parent: Element, block: str) -> bool:
         """Test if the block is a GitHub-style alert"""
-        return bool(self.RE_ALERT.match(block))
+        return block.startswith(self.PREFIX) and self.RE_ALERT.match(block) is not None
 
     def run(self, parent: Element, blocks: list[str]) -> bool:
         """Process the alert block"""
@@ -52,64 +79,27 @@ class AlertBlockProcessor(BlockProcessor):
         # Extract alert type
         match = self.RE_ALERT.match(block)
         if not match:
+            blocks.insert(0, block)
             return False
 
         alert_type = match.group(1)
-        alert_config = self.ALERT_TYPES.get(alert_type, self.ALERT_TYPES["NOTE"])
-
-        # Create the alert container
-        alert_div = SubElement(parent, "div")
-        alert_div.set("class", alert_config["class"])
-
-        # Add the header with icon and title
-        header = SubElement(alert_div, "div")
-        header.set("class", "eidos-alert-header")
-
-        icon_span = SubElement(header, "span")
-        icon_span.set("class", "eidos-alert-icon")
-        icon_span.text = alert_config["icon"]
-
-        title_span = SubElement(header, "span")
-        title_span.set("class", "eidos-alert-title")
-        title_span.text = alert_config["title"]
-
-        content_div = SubElement(alert_div, "div")
-        content_div.set("class", "eidos-alert-content")
-
-        # Remove the alert marker and process the remaining content
-        content = self.RE_ALERT.sub("", block)
-
-        lines = content.split("\n")
-        processed_lines = []
-
-        for line in lines:
-            # Remove leading '>' from each line
-            if line.startswith(">"):
-                line = line[1:].lstrip()
-            processed_lines.append(line)
-
-        content_text = "\n".join(processed_lines).strip()
-
-        # Parse the content as markdown
-        if content_text:
-            temp_element = etree.Element("div")
-            self.parser.parseBlocks(temp_element, [content_text])
-
-            for child in temp_element:
-                content_div.append(child)
-
-            if len(content_div) == 0:
-                p = SubElement(content_div, "p")
-                p.text = content_text
-
-        # Continue processing subsequent blocks that might be part of the alert
-        while blocks and blocks[0].startswith(">"):
-            continuation = blocks.pop(0)
-            continuation_text = continuation[1:].lstrip() if continuation.startswith(">") else continuation
-
-            if continuation_text:
-                p = SubElement(content_div, "p")
-                p.text = continuation_text
+        if alert_type not in self.ALERT_TYPES:
+            alert_type = "NOTE"
+
+        # Create the alert container with a copy of the prebuilt header
+        alert_div = SubElement(parent, "div", {"class": self.ALERT_TYPES[alert_type]["class"]})
+        alert_div.append(deepcopy(self.headers[alert_type]))
+        content_div = SubElement(alert_div, "div", {"class": "eidos-alert-content"})
+
+        # Subsequent quoted blocks are part of the alert too, up to the next alert
+        chunks = [block[match.end() :]]
+        while blocks and blocks[0].startswith(">") and not self.test(parent, blocks[0]):
+            chunks.append(blocks.pop(0))
+
+        # Strip the quote markers and parse the whole body as markdown in one pass
+        content = "\n\n".join(self.RE_QUOTE_MARKER.sub("", chunk) for chunk in chunks).strip()
+        if content:
+            self.parser.parseChunk(content_div, content)
 
         return True
 
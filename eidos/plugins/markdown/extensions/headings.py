@@ -0,0 +1,134 @@
+"""Heading anchors, table of contents and word count, collected during conversion"""
+
+import html
+import re
+from dataclasses import dataclass, field
+from typing import Any
+from xml.etree.ElementTree import Element
+
+from markdown import Markdown
+from markdown.extensions import Extension
+from markdown.extensions.toc import render_inner_html, slugify, strip_tags, unique
+from markdown.treeprocessors import Treeprocessor
+from markdown.util import HTML_PLACEHOLDER_RE
+
+HEADING_TAGS: dict[str, int] = {f"h{level}": level for level in range(1, 7)}
+
+RE_WORD = re.compile(r"\S+")
+
+
+@dataclass
+class Heading:
+    """A heading in a rendered document, with the headings nested below it."""
+
+    level: int
+    text: str
+    id: str
+    children: list["Heading"] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Plain-data form, suitable for JSON."""
+        return {
+            "level": self.level,
+            "text": self.text,
+            "id": self.id,
+            "children": [child.to_dict() for child in self.children],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Heading":
+        """Rebuild a heading (and its children) from ``to_dict`` output."""
+        return cls(
+            level=data["level"],
+            text=data["text"],
+            id=data["id"],
+            children=[cls.from_dict(child) for child in data["children"]],
+        )
+
+
+def nest_headings(flat: list[Heading]) -> list[Heading]:
+    """Turn a flat, document-ordered list of headings into a tree by level."""
+    roots: list[Heading] = []
+    stack: list[Heading] = []
+    for heading in flat:
+        while stack and stack[-1].level >= heading.level:
+            stack.pop()
+        (stack[-1].children if stack else roots).append(heading)
+        stack.append(heading)
+    return roots
+
+
+def _count_words(text: str) -> int:
+    # Stashed blocks (fenced code, raw HTML) appear as placeholders; skip them
+    return len(RE_WORD.findall(HTML_PLACEHOLDER_RE.sub(" ", text)))
+
+
+class HeadingsTreeprocessor(Treeprocessor):
+    """Collect headings and count words in one walk over the element tree.
+
+    Only runs for conversions that set ``eidos_structured`` on the markdown
+    instance, whose results are stored on it as ``eidos_headings`` (a nested
+    list of ``Heading``) and ``eidos_word_count``, or when ``anchors`` is set.
+    Ids are written to the headings in both cases.
+    """
+
+    def __init__(self, md: Markdown, anchors: bool = False):
+        super().__init__(md)
+        self.anchors = anchors
+
+    def run(self, root: Element) -> None:
+        self.structured = getattr(self.md, "eidos_structured", False)
+        if not (self.structured or self.anchors):
+            return  # Plain renders skip the walk entirely
+        self.flat: list[Heading] = []
+        self.used_ids: set[str] = set()
+        self.words = 0
+        self._walk(root, in_pre=False)
+
+        self.md.eidos_headings = nest_headings(self.flat)
+        self.md.eidos_word_count = self.words
+
+    def _walk(self, el: Element, in_pre: bool) -> None:
+        if el.tag in HEADING_TAGS:
+            self._collect_heading(el)
+
+        in_pre = in_pre or el.tag == "pre"
+        count = self.structured and not in_pre
+        if el.text and count:
+            self.words += _count_words(el.text)
+        for child in el:
+            self._walk(child, in_pre)
+            if child.tail and count:
+                self.words += _count_words(child.tail)
+
+    def _collect_heading(self, el: Element) -> None:
+        text = html.unescape(strip_tags(render_inner_html(el, self.md)))
+        heading_id = el.get("id") or unique(slugify(text, "-") or "section", self.used_ids)
+        self.used_ids.add(heading_id)
+        el.set("id", heading_id)
+        el.set("data-scrollspy-target", "true")
+        self.flat.append(Heading(level=HEADING_TAGS[el.tag], text=text, id=heading_id))
+
+
+class HeadingsExtension(Extension):
+    """Collect a heading tree and word count, optionally adding heading anchors.
+
+    Enabled by default in ``MarkdownRenderer``, but it only does work for
+    structured renders, which also add the ids so the ones in the heading tree
+    resolve. Pass ``HeadingsExtension(anchors=True)`` to give every heading a
+    slug ``id`` that navigation and scrollspy can target in plain renders too.
+    """
+
+    def __init__(self, **kwargs: Any):
+        self.config = {
+            "anchors": [False, "Add slug ids to headings"],
+        }
+        super().__init__(**kwargs)
+
+    def extendMarkdown(self, md: Markdown) -> None:
+        """Add the headings processor to the markdown instance"""
+        md.treeprocessors.register(
+            HeadingsTreeprocessor(md, self.getConfig("anchors")),
+            "eidos_headings",
+            15,  # Priority - after inline processing, before prettify
+        )
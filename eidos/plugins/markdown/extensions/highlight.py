@@ -0,0 +1,174 @@
+"""Cached syntax highlighting for fenced code blocks"""
+
+import hashlib
+import html
+from collections.abc import Callable
+from typing import Any
+
+from markdown import Markdown
+from markdown.extensions import Extension
+from markdown.extensions.fenced_code import FencedBlockPreprocessor
+from markdown.preprocessors import Preprocessor
+
+from ....utils import LRUCache, qualified_name
+
+# A highlighter takes (code, language) and returns the inner HTML for the
+# <code> element, or None if it cannot highlight that language
+Highlighter = Callable[[str, str], str | None]
+
+# Pygments token types mapped to eidos-hl-* classes, most specific first.
+# The classes are styled in markdown.css with the theme's color variables.
+TOKEN_CLASSES: list[tuple[str, str]] = [
+    ("Comment", "cm"),
+    ("Keyword", "kw"),
+    ("Name.Builtin", "bi"),
+    ("Name.Function", "fn"),
+    ("Name.Class", "fn"),
+    ("Name.Decorator", "attr"),
+    ("Name.Attribute", "attr"),
+    ("Name.Tag", "tag"),
+    ("Literal.String", "str"),
+    ("Literal.Number", "num"),
+    ("Operator", "op"),
+    ("Generic.Inserted", "ins"),
+    ("Generic.Deleted", "del"),
+]
+
+
+def pygments_highlighter(code: str, lang: str) -> str | None:
+    """Tokenize with Pygments and emit theme-aware ``eidos-hl-*`` spans.
+
+    Returns None when Pygments is not installed or has no lexer for ``lang``.
+    """
+    try:
+        from pygments.lexers import get_lexer_by_name
+        from pygments.util import ClassNotFound
+    except ImportError:
+        return None
+
+    try:
+        lexer = get_lexer_by_name(lang, stripnl=False, ensurenl=False)
+    except ClassNotFound:
+        return None
+
+    # Merge runs of tokens that map to the same class into one span
+    runs: list[tuple[str | None, str]] = []
+    for token_type, value in lexer.get_tokens(code):
+        css_class = _token_class(str(token_type))
+        if runs and runs[-1][0] == css_class:
+            runs[-1] = (css_class, runs[-1][1] + value)
+        else:
+            runs.append((css_class, value))
+
+    return "".join(
+        f'<span class="eidos-hl-{css_class}">{html.escape(text, quote=False)}</span>'
+        if css_class
+        else html.escape(text, quote=False)
+        for css_class, text in runs
+    )
+
+
+def _token_class(token_type: str) -> str | None:
+    # str(Token.Keyword.Constant) == "Token.Keyword.Constant"
+    name = token_type.removeprefix("Token.")
+    for prefix, css_class in TOKEN_CLASSES:
+        if name == prefix or name.startswith(prefix + "."):
+            return css_class
+    return None
+
+
+_highlighter: Highlighter = pygments_highlighter
+
+# Highlighted output keyed by (highlighter, language, sha256 of code); shared by all renderers
+highlight_cache: LRUCache[str] = LRUCache(maxsize=1024)
+
+
+def default_highlighter(code: str, lang: str) -> str | None:
+    """Delegate to the highlighter registered with ``set_highlighter``."""
+    return _highlighter(code, lang)
+
+
+def set_highlighter(highlighter: Highlighter) -> None:
+    """Replace the default highlighter used by ``HighlightExtension``.
+
+    Call this at import time, before rendering, to plug in a different
+    tokenizer/formatter. The highlight cache is cleared.
+
+    Args:
+        highlighter: Callable taking (code, language) and returning the inner
+            HTML of the ``<code>`` element, or None to leave the block as is
+    """
+    global _highlighter
+    _highlighter = highlighter
+    highlight_cache.clear()
+
+
+class HighlightPreprocessor(Preprocessor):
+    """Highlight fenced code blocks that declare a language.
+
+    Runs just before the ``fenced_code`` preprocessor and stashes highlighted
+    blocks, so the rest are left for ``fenced_code`` to handle as usual.
+    """
+
+    def __init__(self, md: Markdown, highlighter: Highlighter = default_highlighter):
+        super().__init__(md)
+        self.highlighter = highlighter
+
+    def run(self, lines: list[str]) -> list[str]:
+        text = "\n".join(lines)
+        index = 0
+        while match := FencedBlockPreprocessor.FENCED_BLOCK_RE.search(text, index):
+            lang = match.group("lang")
+            highlighted = None
+            if lang and not match.group("attrs") and not match.group("hl_lines"):
+                highlighted = self.highlight(match.group("code"), lang)
+
+            if highlighted is None:
+                index = match.end()
+                continue
+
+            block = f'<pre class="eidos-highlight"><code class="language-{lang}">{highlighted}</code></pre>'
+            placeholder = self.md.htmlStash.store(block)
+            text = f"{text[: match.start()]}\n{placeholder}\n{text[match.end() :]}"
+            index = match.start() + 1 + len(placeholder)
+
+        return text.split("\n")
+
+    def highlight(self, code: str, lang: str) -> str | None:
+        """Return highlighted HTML for ``code``, using the shared cache.
+
+        Only module-level highlighters are cached, since a closure or lambda
+        shares its name with others that may highlight differently.
+        """
+        name = qualified_name(self.highlighter)
+        if name is None:
+            return self.highlighter(code, lang) or None
+        key = (name, lang.lower(), hashlib.sha256(code.encode()).hexdigest())
+        cached = highlight_cache.get(key)
+        if cached is None:
+            # "" also records languages the highlighter declined
+            cached = self.highlighter(code, lang) or ""
+            highlight_cache.set(key, cached)
+        return cached or None
+
+
+class HighlightExtension(Extension):
+    """Add cached, theme-aware syntax highlighting to fenced code blocks.
+
+    Example:
+        MarkdownRenderer(extensions=[HighlightExtension()])
+    """
+
+    def __init__(self, **kwargs: Any):
+        self.config = {
+            "highlighter": [default_highlighter, "Callable (code, lang) -> HTML or None"],
+        }
+        super().__init__(**kwargs)
+
+    def extendMarkdown(self, md: Markdown) -> None:
+        """Add the highlight preprocessor to the markdown instance"""
+        md.preprocessors.register(
+            HighlightPreprocessor(md, self.getConfig("highlighter")),
+            "eidos_highlight",
+            27,  # Priority - after whitespace normalization, before fenced_code
+        )
@@ -0,0 +1,144 @@
+"""Lazy-loading images with intrinsic dimensions read from local files"""
+
+import os
+import struct
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+from urllib.parse import unquote, urlsplit
+from xml.etree.ElementTree import Element
+
+from markdown import Markdown
+from markdown.extensions import Extension
+from markdown.treeprocessors import Treeprocessor
+
+
+def image_size(path: str | os.PathLike[str]) -> tuple[int, int] | None:
+    """Return ``(width, height)`` of a PNG, GIF, JPEG or WebP file, or None.
+
+    Only the file header is read. Results are cached by path and modification
+    time, so an edited image is measured again.
+    """
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+    return _read_size(os.fspath(path), mtime_ns)
+
+
+@lru_cache(maxsize=4096)
+def _read_size(path: str, mtime_ns: int) -> tuple[int, int] | None:
+    try:
+        with open(path, "rb") as f:
+            head = f.read(32)
+            if head.startswith(b"\x89PNG\r\n\x1a\n") and head[12:16] == b"IHDR":
+                width, height = struct.unpack(">II", head[16:24])
+                return width, height
+            if head[:6] in (b"GIF87a", b"GIF89a"):
+                width, height = struct.unpack("<HH", head[6:10])
+                return width, height
+            if head.startswith(b"RIFF") and head[8:12] == b"WEBP":
+                return _webp_size(head + f.read(8))
+            if head.startswith(b"\xff\xd8"):
+                f.seek(2)
+                return _jpeg_size(f)
+    except (OSError, struct.error):
+        pass
+    return None
+
+
+def _webp_size(head: bytes) -> tuple[int, int] | None:
+    chunk = head[12:16]
+    if chunk == b"VP8 ":
+        width, height = struct.unpack("<HH", head[26:30])
+        return width & 0x3FFF, height & 0x3FFF
+    if chunk == b"VP8L":
+        bits = int.from_bytes(head[21:25], "little")
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    if chunk == b"VP8X":
+        return int.from_bytes(head[24:27], "little") + 1, int.from_bytes(head[27:30], "little") + 1
+    return None
+
+
+def _jpeg_size(f: Any) -> tuple[int, int] | None:
+    # Walk the segments until a start-of-frame marker (SOF0-SOF15, minus DHT/JPG/DAC)
+    while True:
+        marker = f.read(2)
+        if len(marker) < 2 or marker[0] != 0xFF:
+            return None
+        code = marker[1]
+        if code in (0xD8, 0x01) or 0xD0 <= code <= 0xD7:
+            continue
+        (length,) = struct.unpack(">H", f.read(2))
+        if 0xC0 <= code <= 0xCF and code not in (0xC4, 0xC8, 0xCC):
+            height, width = struct.unpack(">xHH", f.read(5))
+            return width, height
+        f.seek(length - 2, os.SEEK_CUR)
+
+
+class ImageTreeprocessor(Treeprocessor):
+    """Add lazy-loading attributes and, for local files, width and height to images."""
+
+    def __init__(self, md: Markdown, root: str, url_prefix: str):
+        super().__init__(md)
+        self.root = Path(root) if root else None
+        self.url_prefix = url_prefix
+
+    def run(self, root: Element) -> None:
+        for img in root.iter("img"):
+            img.attrib.setdefault("loading", "lazy")
+            img.attrib.setdefault("decoding", "async")
+
+            if "width" in img.attrib or "height" in img.attrib:
+                continue
+            path = self.local_path(img.get("src", ""))
+            size = image_size(path) if path else None
+            if size:
+                img.set("width", str(size[0]))
+                img.set("height", str(size[1]))
+
+    def local_path(self, src: str) -> Path | None:
+        """Map an image URL to a file under ``root``, or None for remote images."""
+        if self.root is None:
+            return None
+        url = urlsplit(src)
+        if url.scheme or url.netloc or not url.path:
+            return None
+        path = unquote(url.path)
+        if path.startswith(self.url_prefix):
+            path = path[len(self.url_prefix) :]
+        elif path.startswith("/"):
+            return None
+
+        candidate = (self.root / path).resolve()
+        if not candidate.is_relative_to(self.root.resolve()):
+            return None
+        return candidate
+
+
+class ImageExtension(Extension):
+    """Lazy-load images and set intrinsic dimensions to prevent layout shift.
+
+    Every image gets ``loading="lazy"`` and ``decoding="async"``. Images whose
+    URL maps to a file under ``root`` also get ``width`` and ``height``, read
+    from the file header.
+
+    Example:
+        # ![Logo](/static/logo.png) -> <img ... width="120" height="40">
+        MarkdownRenderer(extensions=[ImageExtension(root="static", url_prefix="/static/")])
+    """
+
+    def __init__(self, **kwargs: Any):
+        self.config = {
+            "root": ["", "Directory that local image URLs are served from (empty: skip dimensions)"],
+            "url_prefix": ["/", "URL prefix that maps to root; relative URLs resolve against root too"],
+        }
+        super().__init__(**kwargs)
+
+    def extendMarkdown(self, md: Markdown) -> None:
+        """Add the image processor to the markdown instance"""
+        md.treeprocessors.register(
+            ImageTreeprocessor(md, self.getConfig("root"), self.getConfig("url_prefix")),
+            "eidos_images",
+            12,  # Priority - after inline processing, before sanitizing
+        )
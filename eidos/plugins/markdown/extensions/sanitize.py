@@ -0,0 +1,201 @@
+"""Allowlist sanitization of the element tree for untrusted markdown"""
+
+import hashlib
+import html
+import json
+import re
+from collections.abc import Iterable, Mapping
+from re import Pattern
+from typing import Any
+from xml.etree.ElementTree import Element
+
+from markdown import Markdown
+from markdown.extensions import Extension
+from markdown.treeprocessors import Treeprocessor
+
+# Browsers ignore ASCII whitespace and control characters inside a URL scheme
+# ("java\tscript:"), so strip them before looking for one
+RE_URL_NOISE = re.compile(r"[\x00-\x20\x7f]+")
+RE_URL_SCHEME = re.compile(r"^([a-zA-Z][a-zA-Z0-9+.-]*):")
+
+
+class SanitizePolicy:
+    """A compiled tag/attribute/URL-scheme allowlist.
+
+    Elements not in ``tags`` are unwrapped (their text and children are kept),
+    except for ``drop_tags`` which are removed with their content. Attributes
+    are kept only if allowed for every tag (``"*"``) or for that tag, and URL
+    attributes only if they are relative or use an allowed scheme.
+
+    Example:
+        policy = SanitizePolicy(tags=DEFAULT_POLICY.tags - {"img"})
+        MarkdownRenderer(safe=True, policy=policy)
+    """
+
+    def __init__(
+        self,
+        tags: Iterable[str],
+        attributes: Mapping[str, Iterable[str]],
+        url_schemes: Iterable[str] = ("http", "https", "mailto"),
+        url_attributes: Iterable[str] = ("href", "src"),
+        drop_tags: Iterable[str] = ("script", "style"),
+        style_pattern: str | None = r"^text-align: (left|right|center);?$",
+    ):
+        """Compile the policy.
+
+        Args:
+            tags: Allowed element names
+            attributes: Allowed attribute names per element name, ``"*"`` for all elements
+            url_schemes: Schemes allowed in URL attributes (relative URLs are always allowed)
+            url_attributes: Attributes whose values are URLs
+            drop_tags: Disallowed elements removed together with their content
+            style_pattern: Regex a ``style`` value must fully match to be kept
+                (the default allows the table extension's alignment)
+        """
+        self.tags = frozenset(tags)
+        self.attributes = {tag: frozenset(names) for tag, names in attributes.items()}
+        self.url_schemes = frozenset(scheme.lower() for scheme in url_schemes)
+        self.url_attributes = frozenset(url_attributes)
+        self.drop_tags = frozenset(drop_tags)
+        self.style_re: Pattern[str] | None = re.compile(style_pattern) if style_pattern else None
+        self._global_attributes = self.attributes.get("*", frozenset())
+        self._allowed_cache: dict[str, frozenset[str]] = {}
+
+        spec = {
+            "tags": sorted(self.tags),
+            "attributes": {tag: sorted(names) for tag, names in sorted(self.attributes.items())},
+            "url_schemes": sorted(self.url_schemes),
+            "url_attributes": sorted(self.url_attributes),
+            "drop_tags": sorted(self.drop_tags),
+            "style_pattern": style_pattern,
+        }
+        self.fingerprint = hashlib.sha256(json.dumps(spec).encode()).hexdigest()[:16]
+
+    def __repr__(self) -> str:
+        # Stable across processes, so it can be part of a renderer's config_key
+        return f"SanitizePolicy({self.fingerprint})"
+
+    def allowed_attributes(self, tag: str) -> frozenset[str]:
+        """Attribute names allowed on ``tag``."""
+        allowed = self._allowed_cache.get(tag)
+        if allowed is None:
+            allowed = self._allowed_cache[tag] = self._global_attributes | self.attributes.get(tag, frozenset())
+        return allowed
+
+    def allows_url(self, url: str) -> bool:
+        """Whether ``url`` is relative or uses an allowed scheme.
+
+        Character references are decoded first (repeatedly, as a value can be
+        escaped more than once on its way to the browser), so ``&#106;avascript:``
+        and ``javascript&colon;`` are seen as the ``javascript:`` they become.
+        """
+        while (decoded := html.unescape(url)) != url:
+            url = decoded
+        match = RE_URL_SCHEME.match(RE_URL_NOISE.sub("", url))
+        return match is None or match.group(1).lower() in self.url_schemes
+
+    def allows_value(self, name: str, value: str) -> bool:
+        """Whether an allowed attribute's value is acceptable."""
+        if name in self.url_attributes:
+            return self.allows_url(value)
+        if name == "style":
+            return self.style_re is not None and self.style_re.match(value) is not None
+        return True
+
+
+DEFAULT_POLICY = SanitizePolicy(
+    tags=(
+        "p br hr h1 h2 h3 h4 h5 h6 strong em b i del sup sub abbr code pre blockquote "
+        "ul ol li dl dt dd table thead tbody tr th td a img div span"
+    ).split(),
+    attributes={
+        "*": ["class", "id", "title", "data-scrollspy-target"],
+        "a": ["href"],
+        "img": ["src", "alt", "width", "height", "loading", "decoding"],
+        "ol": ["start"],
+        "th": ["align", "style"],
+        "td": ["align", "style"],
+    },
+)
+
+
+class SanitizeTreeprocessor(Treeprocessor):
+    """Enforce a ``SanitizePolicy`` on the element tree before serialization."""
+
+    def __init__(self, md: Markdown, policy: SanitizePolicy):
+        super().__init__(md)
+        self.policy = policy
+
+    def run(self, root: Element) -> None:
+        self._clean_children(root)
+
+    def _clean_children(self, parent: Element) -> None:
+        policy = self.policy
+        index = 0
+        while index < len(parent):
+            child = parent[index]
+            tag = child.tag if isinstance(child.tag, str) else ""
+
+            if tag not in policy.tags:
+                # Unwrap (or drop) the element, then re-check whatever took its place.
+                # Comments and processing instructions have no string tag and are dropped.
+                if not tag or tag in policy.drop_tags:
+                    _replace(parent, index, [], None, child.tail)
+                else:
+                    _replace(parent, index, list(child), child.text, child.tail)
+                continue
+
+            allowed = policy.allowed_attributes(tag)
+            for name, value in list(child.attrib.items()):
+                if name not in allowed or not policy.allows_value(name, value):
+                    del child.attrib[name]
+
+            self._clean_children(child)
+            index += 1
+
+
+def _replace(parent: Element, index: int, children: list[Element], text: str | None, tail: str | None) -> None:
+    """Replace ``parent[index]`` with ``children``, keeping the surrounding text."""
+    if text:
+        _append_text(parent, index, text)
+    if children:
+        last = children[-1]
+        last.tail = (last.tail or "") + (tail or "")
+    elif tail:
+        _append_text(parent, index, tail)
+    parent[index : index + 1] = children
+
+
+def _append_text(parent: Element, index: int, text: str) -> None:
+    """Append ``text`` after whatever precedes ``parent[index]``."""
+    if index == 0:
+        parent.text = (parent.text or "") + text
+    else:
+        previous = parent[index - 1]
+        previous.tail = (previous.tail or "") + text
+
+
+class SanitizeExtension(Extension):
+    """Render untrusted markdown safely.
+
+    Raw HTML in the source is escaped instead of passed through, and the
+    element tree is filtered against an allowlist policy before it is
+    serialized, so no separate HTML-parsing pass is needed. Enabled by
+    ``MarkdownRenderer(safe=True)``.
+    """
+
+    def __init__(self, **kwargs: Any):
+        self.config = {
+            "policy": [DEFAULT_POLICY, "SanitizePolicy to enforce"],
+        }
+        super().__init__(**kwargs)
+
+    def extendMarkdown(self, md: Markdown) -> None:
+        """Disable raw HTML and add the sanitizer to the markdown instance"""
+        md.preprocessors.deregister("html_block", strict=False)
+        md.inlinePatterns.deregister("html", strict=False)
+        md.treeprocessors.register(
+            SanitizeTreeprocessor(md, self.getConfig("policy")),
+            "eidos_sanitize",
+            5,  # Priority - after inline processing and headings, before unescaping
+        )
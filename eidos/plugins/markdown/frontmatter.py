@@ -0,0 +1,251 @@
+"""Front matter parsing and an incremental metadata index for markdown content"""
+
+import datetime
+import os
+import re
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+FENCE = "---"
+CLOSING_FENCES = ("---", "...")
+
+RE_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+RE_INT = re.compile(r"^-?\d+$")
+
+
+def parse_front_matter(text: str) -> tuple[dict[str, Any], str]:
+    """Split YAML-style front matter from a markdown document.
+
+    Front matter is a block at the very top of the file, fenced by ``---``
+    lines. A YAML subset is supported: ``key: value`` pairs, inline
+    (``[a, b]``) and block (``- item``) lists, quoted strings, booleans,
+    integers and ``YYYY-MM-DD`` dates.
+
+    Args:
+        text: Full markdown document
+
+    Returns:
+        Tuple of (metadata dict, body without the front matter). Documents
+        without front matter return an empty dict and the text unchanged.
+
+    Example:
+        >>> parse_front_matter("---\\ntitle: Hi\\ntags: [a, b]\\n---\\n# Body")
+        ({'title': 'Hi', 'tags': ['a', 'b']}, '# Body')
+    """
+    lines = text.split("\n")
+    if not lines or lines[0].rstrip() != FENCE:
+        return {}, text
+    for index, line in enumerate(lines[1:], start=1):
+        if line.rstrip() in CLOSING_FENCES:
+            return _parse_block(lines[1:index]), "\n".join(lines[index + 1 :])
+    return {}, text
+
+
+def read_front_matter(path: str | os.PathLike[str]) -> dict[str, Any]:
+    """Read only the front matter of a markdown file, without reading the body.
+
+    Args:
+        path: Path to the markdown file
+
+    Returns:
+        Metadata dict (empty if the file has no front matter)
+    """
+    with open(path, encoding="utf-8") as f:
+        if f.readline().rstrip() != FENCE:
+            return {}
+        block: list[str] = []
+        for line in f:
+            if line.rstrip() in CLOSING_FENCES:
+                return _parse_block(block)
+            block.append(line.rstrip("\n"))
+    return {}
+
+
+def _parse_block(lines: list[str]) -> dict[str, Any]:
+    meta: dict[str, Any] = {}
+    key = None
+    for line in lines:
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        if stripped.startswith("- ") and key is not None:
+            # Block list item belonging to the previous key
+            if not isinstance(meta[key], list):
+                meta[key] = []
+            meta[key].append(_parse_value(stripped[2:]))
+            continue
+        if ":" in stripped:
+            key, _, raw = stripped.partition(":")
+            key = key.strip()
+            meta[key] = _parse_value(raw) if raw.strip() else []
+    # Keys with no value and no list items are empty strings, not empty lists
+    return {k: ("" if v == [] else v) for k, v in meta.items()}
+
+
+def _parse_value(raw: str) -> Any:
+    value = raw.strip()
+    if value.startswith("[") and value.endswith("]"):
+        return [_parse_value(item) for item in value[1:-1].split(",") if item.strip()]
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+        return value[1:-1]
+    # Only true/false: YAML 1.1's yes/no would turn a tag or title "no" into False
+    lowered = value.lower()
+    if lowered == "true":
+        return True
+    if lowered == "false":
+        return False
+    if lowered in ("null", "~"):
+        return None
+    if RE_INT.match(value):
+        return int(value)
+    if RE_DATE.match(value):
+        try:
+            return datetime.date.fromisoformat(value)
+        except ValueError:
+            pass
+    return value
+
+
+@dataclass
+class PageMeta:
+    """Front matter of one markdown file, with the common fields pulled out."""
+
+    path: Path
+    title: str
+    date: datetime.date | None = None
+    tags: tuple[str, ...] = ()
+    draft: bool = False
+    meta: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_front_matter(cls, path: Path, meta: dict[str, Any]) -> "PageMeta":
+        """Build a PageMeta from parsed front matter."""
+        date = meta.get("date")
+        if isinstance(date, datetime.datetime):
+            date = date.date()
+        tags = meta.get("tags") or ()
+        if isinstance(tags, str):
+            tags = [tag.strip() for tag in tags.split(",")]
+        return cls(
+            path=path,
+            title=str(meta.get("title") or path.stem.replace("-", " ").replace("_", " ").title()),
+            date=date if isinstance(date, datetime.date) else None,
+            tags=tuple(str(tag) for tag in tags if tag),
+            # yes/no stay strings in meta, but still mean what they say here
+            draft=meta.get("draft") is True or str(meta.get("draft")).lower() == "yes",
+            meta=meta,
+        )
+
+
+class ContentIndex:
+    """In-memory index of front matter for every markdown file in a directory.
+
+    Only front matter is read, never the body. ``refresh()`` re-reads just the
+    files whose modification time or size changed and drops deleted files, so
+    it is cheap enough to call before serving a listing page.
+
+    Example:
+        index = ContentIndex("content/posts")
+        index.refresh()
+        recent = index.pages()[:10]
+        python_posts = index.by_tag("python")
+        this_year = index.by_date(start=datetime.date(2025, 1, 1))
+    """
+
+    def __init__(self, directory: str | os.PathLike[str], pattern: str = "**/*.md"):
+        """Create an index and scan the directory once.
+
+        Args:
+            directory: Root directory of the content
+            pattern: Glob pattern relative to ``directory``
+        """
+        self.directory = Path(directory)
+        self.pattern = pattern
+        # Pages and the tag index, replaced together by refresh() so readers never see a partial update
+        self._index: tuple[dict[Path, PageMeta], dict[str, set[Path]]] = ({}, {})
+        self._stats: dict[Path, tuple[int, int]] = {}
+        self._lock = threading.Lock()
+        self.refresh()
+
+    def refresh(self) -> set[Path]:
+        """Bring the index up to date with the directory.
+
+        Returns:
+            Paths that were added, changed or removed
+        """
+        with self._lock:
+            pages = dict(self._index[0])
+            stats = dict(self._stats)
+            changed = set()
+            seen = set()
+            for path in self.directory.glob(self.pattern):
+                try:
+                    st = path.stat()
+                except OSError:
+                    continue
+                seen.add(path)
+                signature = (st.st_mtime_ns, st.st_size)
+                if stats.get(path) == signature:
+                    continue
+                pages[path] = PageMeta.from_front_matter(path, read_front_matter(path))
+                stats[path] = signature
+                changed.add(path)
+
+            for path in set(pages) - seen:
+                del pages[path]
+                del stats[path]
+                changed.add(path)
+
+            if changed:
+                tags: dict[str, set[Path]] = {}
+                for path, page in pages.items():
+                    for tag in page.tags:
+                        tags.setdefault(tag, set()).add(path)
+                self._index = (pages, tags)
+                self._stats = stats
+            return changed
+
+    def get(self, path: str | os.PathLike[str]) -> PageMeta | None:
+        """Metadata for one file, or None if it is not indexed."""
+        return self._index[0].get(Path(path))
+
+    def pages(self, include_drafts: bool = False) -> list[PageMeta]:
+        """All pages, newest first (undated pages last, by title)."""
+        return self._sorted(self._index[0].values(), include_drafts)
+
+    def by_tag(self, tag: str, include_drafts: bool = False) -> list[PageMeta]:
+        """Pages with ``tag``, newest first."""
+        pages, tags = self._index
+        return self._sorted((pages[path] for path in tags.get(tag, ())), include_drafts)
+
+    def by_date(
+        self,
+        start: datetime.date | None = None,
+        end: datetime.date | None = None,
+        include_drafts: bool = False,
+    ) -> list[PageMeta]:
+        """Dated pages with ``start <= date <= end``, newest first."""
+        return self._sorted(
+            (
+                page
+                for page in self._index[0].values()
+                if page.date and (start is None or page.date >= start) and (end is None or page.date <= end)
+            ),
+            include_drafts,
+        )
+
+    def tags(self) -> dict[str, int]:
+        """Every tag with its number of pages (drafts included)."""
+        return {tag: len(paths) for tag, paths in sorted(self._index[1].items())}
+
+    @staticmethod
+    def _sorted(pages: Any, include_drafts: bool) -> list[PageMeta]:
+        selected = [page for page in pages if include_drafts or not page.draft]
+        selected.sort(key=lambda page: page.title)
+        selected.sort(key=lambda page: page.date or datetime.date.min, reverse=True)
+        return selected
+
+    def __len__(self) -> int:
+        return len(self._index[0])
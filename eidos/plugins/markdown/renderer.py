@@ -1,58 +1,205 @@
 """Core markdown rendering with theme integration"""
 
+import hashlib
+import json
+import math
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any, Literal, overload
+
 import markdown
 
+from ...utils import qualified_name
 from .extensions.alerts import AlertExtension
+from .extensions.headings import Heading, HeadingsExtension
+from .extensions.sanitize import DEFAULT_POLICY, SanitizeExtension, SanitizePolicy
+from .tree import Child, render_tree, tree_to_tags
+
+WORDS_PER_MINUTE = 200
+
+
+def default_extensions() -> list[str | markdown.Extension]:
+    """Extensions every renderer enables in addition to the ones it is given."""
+    return [
+        "fenced_code",
+        "tables",
+        "nl2br",
+        "sane_lists",
+        AlertExtension(),  # GitHub-style alerts
+        HeadingsExtension(),  # Heading tree and word count for RenderResult
+    ]
+
+
+@dataclass
+class RenderResult:
+    """Structured output of a single ``MarkdownRenderer.render`` call."""
+
+    html: str
+    headings: list[Heading] = field(default_factory=list)
+    word_count: int = 0
+
+    @property
+    def reading_time(self) -> int:
+        """Estimated reading time in whole minutes."""
+        return math.ceil(self.word_count / WORDS_PER_MINUTE)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Plain-data form, suitable for JSON."""
+        return {
+            "html": self.html,
+            "headings": [heading.to_dict() for heading in self.headings],
+            "word_count": self.word_count,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "RenderResult":
+        """Rebuild a result from ``to_dict`` output."""
+        return cls(
+            html=data["html"],
+            headings=[Heading.from_dict(heading) for heading in data["headings"]],
+            word_count=data["word_count"],
+        )
 
 
 class MarkdownRenderer:
     """Core markdown rendering with theme integration.
 
+    ``markdown.Markdown`` instances are built lazily and kept in a small pool,
+    so a renderer can be shared between threads and adding extensions only
+    costs one rebuild on the next render, however many are added. Use
+    ``get_renderer`` to share one renderer between all call sites that use the
+    same configuration.
+
     Warning:
-        This renderer outputs raw HTML without sanitization to support advanced
-        features like forms, embeds, and custom styling. Never use with untrusted
-        user content without additional sanitization.
+        By default this renderer outputs raw HTML without sanitization to support
+        advanced features like forms, embeds, and custom styling. Never use it with
+        untrusted user content unless ``safe=True``.
     """
 
     extensions: list[str | markdown.Extension]
-    md: markdown.Markdown
 
-    def __init__(self, extensions: list[str | markdown.Extension] | None = None):
+    #: Maximum number of idle ``markdown.Markdown`` instances kept for reuse
+    max_pool_size: int = 8
+
+    def __init__(
+        self,
+        extensions: Iterable[str | markdown.Extension] | None = None,
+        safe: bool = False,
+        policy: SanitizePolicy | None = None,
+        defaults: bool = True,
+    ):
         """Initialize the renderer with optional extensions.
 
         Args:
-            extensions: List of markdown extension names or instances to enable
+            extensions: Markdown extension names or instances to enable. The
+                default extensions are added after these, except for defaults
+                whose class is already given (e.g. ``HeadingsExtension(anchors=True)``);
+                the iterable itself is not modified.
+            safe: Escape raw HTML and enforce an allowlist on the output, for
+                rendering untrusted content
+            policy: Allowlist to enforce when ``safe`` is True (default: ``DEFAULT_POLICY``)
+            defaults: Add ``default_extensions()``; pass False to use exactly
+                ``extensions``, e.g. to measure the cost of one default
+        """
+        self.extensions = []
+        self._frozen = False
+        self._lock = threading.Lock()
+        self._pool: list[markdown.Markdown] = []
+        self._generation = 0
+        self._config_key: str | None = None
+        self._md: markdown.Markdown | None = None
+        extensions = list(extensions or [])
+        if safe:
+            extensions.append(SanitizeExtension(policy=policy or DEFAULT_POLICY))
+        given = {type(ext) for ext in extensions if not isinstance(ext, str)}
+        if defaults:
+            extensions += [ext for ext in default_extensions() if type(ext) not in given]
+        self._add(extensions)
+
+    @property
+    def md(self) -> markdown.Markdown:
+        """A ``markdown.Markdown`` instance for the current configuration."""
+        if self._md is None:
+            self._md = self._build()
+        return self._md
+
+    @property
+    def config_key(self) -> str:
+        """Stable hash of the renderer configuration.
+
+        Two renderers with the same extensions (and extension configs) share a
+        key, so it can be used to key caches of rendered output.
         """
-        self.extensions = extensions or []
-        # Add some useful default extensions
-        default_extensions = [
-            "fenced_code",
-            "tables",
-            "nl2br",
-            "sane_lists",
-            AlertExtension(),  # GitHub-style alerts
-        ]
-        self.extensions.extend(default_extensions)
-
-        self.md = markdown.Markdown(extensions=self.extensions)
-
-    def render(self, markdown_text: str) -> str:
+        if self._config_key is None:
+            canonical = json.dumps([_extension_key(ext) for ext in self.extensions])
+            self._config_key = hashlib.sha256(canonical.encode()).hexdigest()[:16]
+        return self._config_key
+
+    @overload
+    def render(self, markdown_text: str, structured: Literal[False] = False) -> str: ...
+
+    @overload
+    def render(self, markdown_text: str, structured: Literal[True]) -> RenderResult: ...
+
+    def render(self, markdown_text: str, structured: bool = False) -> str | RenderResult:
         """Convert markdown to themed HTML.
 
         Args:
             markdown_text: Raw markdown text to render
+            structured: Return a ``RenderResult`` with the heading tree, word
+                count and reading time collected in the same conversion pass;
+                its HTML carries the heading ids, as if anchors were enabled
 
         Returns:
-            HTML string wrapped with eidos-md class for styling
+            HTML string wrapped with eidos-md class for styling, or a
+            RenderResult holding that HTML when ``structured`` is True
         """
-        # Reset markdown processor state to prevent contamination between renders
-        # This is required by Python-Markdown when reusing instances, especially
-        # with stateful extensions like footnotes or custom parsers
-        self.md.reset()
+        generation, md = self._acquire()
+        try:
+            # Reset markdown processor state to prevent contamination between renders
+            # This is required by Python-Markdown when reusing instances, especially
+            # with stateful extensions like footnotes or custom parsers
+            md.reset()
+            md.eidos_structured = structured
+            html_content = md.convert(markdown_text)
+            headings = getattr(md, "eidos_headings", [])
+            word_count = getattr(md, "eidos_word_count", 0)
+        finally:
+            self._release(generation, md)
+
+        html = f'<div class="eidos-md">{html_content}</div>'
+        if structured:
+            return RenderResult(html=html, headings=headings, word_count=word_count)
+        return html
+
+    def render_tags(self, markdown_text: str) -> list[Child]:
+        """Convert markdown to air tags, one per top-level block.
 
-        html_content = self.md.convert(markdown_text)
+        The element tree Python-Markdown builds is turned into air tags
+        directly instead of being serialized, so each block can be cached,
+        diffed, swapped or streamed on its own. Stashed HTML (raw HTML,
+        highlighted code) becomes ``air.Raw``, and postprocessors added by
+        extensions run on each piece of text separately.
 
-        return f'<div class="eidos-md">{html_content}</div>'
+        Args:
+            markdown_text: Raw markdown text to render
+
+        Returns:
+            List of top-level blocks, without the ``eidos-md`` wrapper
+
+        Example:
+            blocks = renderer.render_tags("# Title\n\nBody")
+            # [air.H1("Title"), air.P("Body")]
+        """
+        generation, md = self._acquire()
+        try:
+            md.reset()
+            md.eidos_structured = False
+            root = render_tree(md, markdown_text)
+            return [] if root is None else tree_to_tags(md, root)
+        finally:
+            self._release(generation, md)
 
     def add_extension(self, extension: str | markdown.Extension) -> None:
         """Add a markdown extension.
@@ -60,6 +207,123 @@ class MarkdownRenderer:
         Args:
             extension: Name of the markdown extension to add
         """
-        if extension not in self.extensions:
-            self.extensions.append(extension)
-            self.md = markdown.Markdown(extensions=self.extensions)
+        self.add_extensions(extension)
+
+    def add_extensions(self, *extensions: str | markdown.Extension) -> None:
+        """Add several markdown extensions at once.
+
+        The underlying ``markdown.Markdown`` is rebuilt once, on the next
+        render, rather than once per extension.
+
+        Args:
+            *extensions: Names or instances of the extensions to add
+
+        Raises:
+            RuntimeError: If the renderer is shared (returned by ``get_renderer``)
+        """
+        if self._frozen:
+            raise RuntimeError(
+                "Shared renderers from get_renderer() cannot be modified; "
+                "call get_renderer() with the full extension list instead"
+            )
+        self._add(extensions)
+
+    def _add(self, extensions: Iterable[str | markdown.Extension]) -> None:
+        known = {_extension_key(ext) for ext in self.extensions}
+        added = False
+        for extension in extensions:
+            key = _extension_key(extension)
+            if key not in known:
+                known.add(key)
+                self.extensions.append(extension)
+                added = True
+
+        if added:
+            with self._lock:
+                self._generation += 1
+                self._pool.clear()
+                self._config_key = None
+                self._md = None
+
+    def _build(self) -> markdown.Markdown:
+        return markdown.Markdown(extensions=[_fresh(ext) for ext in self.extensions])
+
+    def _acquire(self) -> tuple[int, markdown.Markdown]:
+        with self._lock:
+            generation = self._generation
+            if self._pool:
+                return generation, self._pool.pop()
+        return generation, self._build()
+
+    def _release(self, generation: int, md: markdown.Markdown) -> None:
+        with self._lock:
+            if generation == self._generation and len(self._pool) < self.max_pool_size:
+                self._pool.append(md)
+
+
+_shared_renderers: dict[str, MarkdownRenderer] = {}
+_shared_lock = threading.Lock()
+
+
+def get_renderer(
+    extensions: Iterable[str | markdown.Extension] | None = None,
+    safe: bool = False,
+    policy: SanitizePolicy | None = None,
+) -> MarkdownRenderer:
+    """Return the shared renderer for an extension configuration.
+
+    Call sites asking for the same extensions (compared by name, or by class
+    and config for extension instances) get the same renderer, and therefore
+    share its pool of ``markdown.Markdown`` instances. Shared renderers cannot
+    be modified with ``add_extension``.
+
+    Args:
+        extensions: Markdown extension names or instances, as for ``MarkdownRenderer``
+        safe: Sanitize the output, as for ``MarkdownRenderer``
+        policy: Allowlist to enforce when ``safe`` is True
+
+    Returns:
+        The shared MarkdownRenderer for this configuration
+
+    Example:
+        renderer = get_renderer(["toc", "footnotes"])
+        html = renderer.render("# Title")
+    """
+    renderer = MarkdownRenderer(extensions, safe=safe, policy=policy)
+    key = renderer.config_key
+    with _shared_lock:
+        shared = _shared_renderers.get(key)
+        if shared is None:
+            renderer._frozen = True
+            shared = _shared_renderers[key] = renderer
+    return shared
+
+
+def _extension_key(extension: str | markdown.Extension) -> str:
+    """Canonical string for an extension name or instance, including its config."""
+    if isinstance(extension, str):
+        return extension
+    cls = type(extension)
+    configs = json.dumps(extension.getConfigs(), sort_keys=True, default=_config_value)
+    return f"{cls.__module__}.{cls.__qualname__}:{configs}"
+
+
+def _config_value(value: Any) -> str:
+    """JSON fallback for config values; callables (such as a highlighter) by name, as their repr has an address.
+
+    Callables without a stable name (closures, lambdas, instances) are keyed by
+    identity, so renderers configured with different ones are never shared.
+    """
+    if not callable(value):
+        return repr(value)
+    return qualified_name(value) or f"{type(value).__qualname__}@{id(value):x}"
+
+
+def _fresh(extension: str | markdown.Extension) -> str | markdown.Extension:
+    """Copy an extension instance so pooled Markdown objects don't share its state."""
+    if isinstance(extension, str):
+        return extension
+    try:
+        return type(extension)(**extension.getConfigs())
+    except TypeError:
+        return extension
@@ -0,0 +1,142 @@
+"""Conversion of Python-Markdown's element tree into air tags"""
+
+import html
+import re
+from typing import TypeAlias
+from xml.etree.ElementTree import Element
+
+import air
+import air.tags
+from markdown import Markdown
+from markdown.postprocessors import AndSubstitutePostprocessor, RawHtmlPostprocessor
+from markdown.serializers import to_xhtml_string
+from markdown.util import AMP_SUBSTITUTE, HTML_PLACEHOLDER_RE
+
+# Tag classes that wrap content rather than render an element of their name
+WRAPPER_TAGS = frozenset({"basetag", "children", "fragment", "raw", "tag", "tags"})
+
+# Element name -> air tag class
+AIR_TAGS: dict[str, type[air.BaseTag]] = {
+    name.lower(): cls
+    for name, cls in vars(air.tags).items()
+    if isinstance(cls, type) and issubclass(cls, air.BaseTag) and name.lower() not in WRAPPER_TAGS
+}
+
+RE_WRAPPED_PLACEHOLDER = re.compile(rf"^\s*{HTML_PLACEHOLDER_RE.pattern}\s*$")
+
+Child: TypeAlias = air.BaseTag | str
+
+
+def tree_to_tags(md: Markdown, root: Element) -> list[Child]:
+    """Convert the children of a processed document root into air tags.
+
+    This does what Python-Markdown's serializer and postprocessors do, but
+    builds tags instead of a string: text becomes plain (air-escaped) strings,
+    stashed HTML becomes ``air.Raw``, and elements without an air tag class
+    are serialized into ``air.Raw``. Postprocessors added by extensions (such
+    as footnotes) are run on each piece of text separately.
+
+    Args:
+        md: The markdown instance that produced ``root`` (for its HTML stash)
+        root: Document root after all treeprocessors have run
+
+    Returns:
+        One entry per top-level block (whitespace between blocks is dropped)
+    """
+    converter = _Converter(md)
+    blocks: list[Child] = []
+    for child in _children(root, converter):
+        if isinstance(child, str) and not child.strip():
+            continue
+        blocks.append(child)
+    return blocks
+
+
+def _children(el: Element, converter: "_Converter") -> list[Child]:
+    children: list[Child] = []
+    if el.text:
+        children.extend(converter.text(el.text))
+    for child in el:
+        children.append(converter.element(child))
+        if child.tail:
+            children.extend(converter.text(child.tail))
+    return children
+
+
+class _Converter:
+    def __init__(self, md: Markdown):
+        self.raw_html = md.postprocessors["raw_html"] if "raw_html" in md.postprocessors else None
+        self.postprocessors = [
+            pp for pp in md.postprocessors if not isinstance(pp, RawHtmlPostprocessor | AndSubstitutePostprocessor)
+        ]
+
+    def element(self, el: Element) -> air.BaseTag:
+        tag = el.tag if isinstance(el.tag, str) else ""
+        cls = AIR_TAGS.get(tag)
+
+        # A paragraph holding only a stashed block (raw HTML, highlighted code)
+        if tag == "p" and not len(el) and el.text and RE_WRAPPED_PLACEHOLDER.match(el.text):
+            return air.Raw(self.restore(f"<p>{el.text.strip()}</p>").strip())
+
+        if cls is None:
+            return air.Raw(self.restore(to_xhtml_string(el)))
+
+        attributes = {name: self.attribute(value) for name, value in el.attrib.items()}
+        return cls(*_children(el, self), **attributes)
+
+    def text(self, text: str) -> list[Child]:
+        """Split text into plain strings and ``air.Raw`` for stash placeholders."""
+        parts: list[Child] = []
+        position = 0
+        for match in HTML_PLACEHOLDER_RE.finditer(text):
+            if match.start() > position:
+                parts.append(self.plain(text[position : match.start()]))
+            parts.append(air.Raw(self.restore(match.group(0))))
+            position = match.end()
+        if position < len(text):
+            parts.append(self.plain(text[position:]))
+        return parts
+
+    def attribute(self, value: str) -> str:
+        # air writes attribute values verbatim, so escape them here
+        return html.escape(self.plain(value), quote=True)
+
+    def plain(self, text: str) -> str:
+        """Text as it should display, for air to escape."""
+        # Tree text can hold entities (typed by the author, escaped by the code
+        # processors, or added by postprocessors); decode them so air's
+        # escaping yields the same display
+        return html.unescape(self.postprocess(str(text)).replace(AMP_SUBSTITUTE, "&"))
+
+    def restore(self, markup: str) -> str:
+        """Substitute stashed HTML back into serialized markup."""
+        if self.raw_html is not None:
+            markup = self.raw_html.run(markup)
+        return self.postprocess(markup).replace(AMP_SUBSTITUTE, "&")
+
+    def postprocess(self, text: str) -> str:
+        for pp in self.postprocessors:
+            text = pp.run(text)
+        return text
+
+
+def render_tree(md: Markdown, text: str) -> Element | None:
+    """Run ``md``'s preprocessors, block parser and treeprocessors on ``text``.
+
+    This is the first half of ``Markdown.convert``, stopping before
+    serialization. ``md`` should be freshly reset.
+
+    Returns:
+        The processed document root, or None for blank text
+    """
+    if not text.strip():
+        return None
+    md.lines = text.split("\n")
+    for preprocessor in md.preprocessors:
+        md.lines = preprocessor.run(md.lines)
+    root: Element = md.parser.parseDocument(md.lines).getroot()
+    for treeprocessor in md.treeprocessors:
+        new_root = treeprocessor.run(root)
+        if new_root is not None:
+            root = new_root
+    return root
@@ -0,0 +1,230 @@
+"""Trim ``styles.css`` to the rules an app's classes actually need.
+
+``styles.css`` styles every EidosUI component, and the bundle ships all of it
+even to an app that only renders headings. Given the class tokens an app
+renders (collected with ``eidos.utils.track_classes`` and
+``eidos.tailwind.classes_in_html``), ``purge_css`` keeps only the rules whose
+selectors can match. The theme variables are always kept, since their
+``:root`` and ``[data-theme]`` selectors need no class. ``build_purged_css``
+writes a content-hashed bundle of the result, linked with
+``EidosHeaders(purge_css=True)``, and ``critical_css`` returns it for
+inlining with ``EidosHeaders(inline_critical=True)``::
+
+    python -m eidos.purge crawled-pages/ classes.txt
+"""
+
+import argparse
+import functools
+import re
+from collections.abc import Iterable
+from pathlib import Path
+
+from . import styles
+from .assets import (
+    PACKAGE_DIR,
+    Asset,
+    generated_asset_url,
+    minify_css,
+    theme_css_files,
+    write_generated_asset,
+)
+from .tailwind import classes_from_files
+
+#: Classes added in the browser (Alpine bindings, scroll spy), so never seen in rendered HTML
+DYNAMIC_CLASSES = frozenset({"eidos-active", "eidos-tab-active"})
+
+#: Classes of the components usually above the fold: page body, NavBar, headings and buttons
+CRITICAL_CLASSES = frozenset(
+    {
+        styles.Theme.body,
+        "eidos-navbar",
+        "eidos-navbar-sticky",
+        "eidos-navbar-toggle",
+        "navbar-underline",
+        "navbar-bold",
+        *(getattr(styles.typography, f"h{level}") for level in range(1, 7)),
+        *(value for name, value in vars(styles.Buttons).items() if not name.startswith("_")),
+    }
+)
+
+# Groups whose body is a list of rules, purged recursively
+NESTED_AT_RULES = ("@media", "@supports", "@layer", "@container")
+
+RE_CLASS = re.compile(r"\.(-?[_a-zA-Z][\w-]*)")
+RE_KEYFRAMES = re.compile(r"@(?:-webkit-)?keyframes\s+([\w-]+)")
+
+
+def _blocks(css: str) -> list[tuple[str, str | None]]:
+    """Split minified CSS into top-level ``(prelude, body)`` pairs; statements (``@import``) have no body."""
+    blocks: list[tuple[str, str | None]] = []
+    depth = start = 0
+    prelude = ""
+    quote = ""
+    for index, char in enumerate(css):
+        if quote:
+            quote = "" if char == quote and css[index - 1] != "\\" else quote
+        elif char in "\"'":
+            quote = char
+        elif char == "{":
+            if depth == 0:
+                prelude = css[start:index].strip()
+                start = index + 1
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                blocks.append((prelude, css[start:index]))
+                start = index + 1
+        elif char == ";" and depth == 0:
+            blocks.append((css[start:index].strip(), None))
+            start = index + 1
+    return blocks
+
+
+def _split_selectors(prelude: str) -> list[str]:
+    """Split a selector list on commas outside parentheses and brackets."""
+    selectors = []
+    depth = start = 0
+    for index, char in enumerate(prelude):
+        if char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+        elif char == "," and depth == 0:
+            selectors.append(prelude[start:index])
+            start = index + 1
+    selectors.append(prelude[start:])
+    return [selector.strip() for selector in selectors]
+
+
+def _strip_negations(selector: str) -> str:
+    """Remove ``:not(...)`` arguments: a class there does not have to be present to match."""
+    while (start := selector.find(":not(")) != -1:
+        depth = 0
+        for index in range(start + 4, len(selector)):
+            depth += {"(": 1, ")": -1}.get(selector[index], 0)
+            if depth == 0:
+                selector = selector[:start] + selector[index + 1 :]
+                break
+        else:
+            break
+    return selector
+
+
+def _selector_used(selector: str, classes: frozenset[str]) -> bool:
+    """Whether every class the selector requires is used; selectors without classes always are."""
+    return all(name in classes for name in RE_CLASS.findall(_strip_negations(selector)))
+
+
+def _render(prelude: str, body: str | None) -> str:
+    return f"{prelude};" if body is None else f"{prelude}{{{body}}}"
+
+
+def _purge(css: str, classes: frozenset[str]) -> list[tuple[str, str | None]]:
+    kept: list[tuple[str, str | None]] = []
+    for prelude, body in _blocks(css):
+        if body is not None and prelude.startswith(NESTED_AT_RULES):
+            inner = _purge(body, classes)
+            if inner:
+                kept.append((prelude, "".join(_render(*block) for block in inner)))
+        elif body is None or prelude.startswith("@"):
+            kept.append((prelude, body))
+        else:
+            selectors = [selector for selector in _split_selectors(prelude) if _selector_used(selector, classes)]
+            if selectors:
+                kept.append((",".join(selectors), body))
+    return kept
+
+
+def purge_css(css: str, classes: Iterable[str]) -> str:
+    """Keep only the rules of ``css`` that can match elements using ``classes``.
+
+    A selector is kept when every class it requires is in ``classes`` (or in
+    ``DYNAMIC_CLASSES``); element, attribute and ``:root`` selectors are always
+    kept, as are ``@font-face`` and similar rules. ``@media`` and
+    ``@supports`` blocks are purged recursively and dropped when empty, and
+    ``@keyframes`` are kept only while a remaining rule names them.
+
+    Args:
+        css: Stylesheet source
+        classes: Class tokens the app renders
+
+    Returns:
+        The minified, purged stylesheet; the same for the same classes in any order
+    """
+    used = frozenset(classes) | DYNAMIC_CLASSES
+    kept = _purge(minify_css(css), used)
+    rules = "".join(_render(*block) for block in kept if not RE_KEYFRAMES.match(block[0]))
+    parts = []
+    for prelude, body in kept:
+        keyframes = RE_KEYFRAMES.match(prelude)
+        if keyframes and not re.search(rf"(?<![\w-]){re.escape(keyframes.group(1))}(?![\w-])", rules):
+            continue
+        parts.append(_render(prelude, body))
+    return "".join(parts)
+
+
+def build_purged_css(
+    classes: Iterable[str],
+    safelist: Iterable[str] = (),
+    directory: str | Path | None = None,
+) -> Asset:
+    """Write a bundle of the EidosUI stylesheets with only the rules ``classes`` need.
+
+    Args:
+        classes: Class tokens the app renders
+        safelist: Extra classes to keep, such as ones added by your own JavaScript
+        directory: Output directory (default: ``bundle_dir()``)
+
+    Returns:
+        The written Asset, served by ``get_eidos_static_files`` and found by ``get_purged_css_url``
+    """
+    css = critical_css(frozenset(classes) | frozenset(safelist))
+    asset = write_generated_asset("eidos-purged.css", css.encode(), directory)
+    return asset
+
+
+@functools.lru_cache(maxsize=64)
+def critical_css(classes: frozenset[str] = CRITICAL_CLASSES, theme: str | None = None) -> str:
+    """The rules of ``CSS_FILES`` needed to render ``classes``, including the theme variables.
+
+    Results are cached per set of classes, so each page layout is extracted once.
+
+    Args:
+        classes: Classes of the components rendered above the fold
+        theme: Include only this theme's variables (default: all themes)
+
+    Returns:
+        Minified CSS
+    """
+    return "\n".join(
+        purge_css((PACKAGE_DIR / name).read_text(encoding="utf-8"), classes) for name in theme_css_files(theme)
+    )
+
+
+def get_purged_css_url() -> str:
+    """URL of the bundle last written by ``build_purged_css`` to ``bundle_dir()``.
+
+    Raises:
+        FileNotFoundError: If no purged bundle has been built
+    """
+    return generated_asset_url("eidos-purged.css", "eidos.purge")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build a CSS bundle with only the EidosUI rules an app uses.")
+    parser.add_argument(
+        "inputs",
+        nargs="+",
+        type=Path,
+        help="HTML files, directories of them, or text files of whitespace-separated classes",
+    )
+    parser.add_argument("--safelist", nargs="*", default=[], help="extra classes to keep")
+    parser.add_argument("--out", default=None, help="output directory (default: $EIDOS_BUNDLE_DIR or a temp dir)")
+    args = parser.parse_args()
+
+    print(build_purged_css(classes_from_files(args.inputs), args.safelist, args.out).url)
+
+
+if __name__ == "__main__":
+    main()
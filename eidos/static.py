@@ -0,0 +1,133 @@
+"""Static file serving for EidosUI assets with long-lived caching"""
+
+import mimetypes
+import os
+from pathlib import Path
+from typing import Any
+
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Scope
+
+from .assets import ENCODING_SUFFIXES, AssetManifest, bundle_dir, get_manifest
+from .theming import THEMES_DIR
+from .vendor import VENDORED_LIBRARIES, vendor_dir
+
+#: Cache-Control for content-hashed files: their content never changes under a URL
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class EidosStaticFiles(StaticFiles):
+    """Drop-in ``StaticFiles`` for eidos assets: immutable caching and precompressed files.
+
+    Files listed in the asset manifest are served with
+    ``Cache-Control: public, max-age=31536000, immutable``, so browsers never
+    revalidate them; a new release changes their URLs instead.
+
+    When a file has a precompressed variant next to it (``styles.css.zst``,
+    ``styles.css.gz``, written by ``build_manifest``) and the request's
+    ``Accept-Encoding`` allows it, the variant is sent as-is with
+    ``Content-Encoding`` set, so nothing is compressed per request and the
+    file can still be sent with ``sendfile``. Anything else is served exactly
+    like ``StaticFiles`` would.
+
+    Example:
+        from eidos.static import EidosStaticFiles
+        from eidos.utils import get_eidos_static_files
+
+        for mount_path, directory in get_eidos_static_files().items():
+            app.mount(mount_path, EidosStaticFiles(directory=directory), name=mount_path.strip("/"))
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str] | None = None,
+        manifest: AssetManifest | None = None,
+        **kwargs: Any,
+    ):
+        """Initialize the static files app.
+
+        Args:
+            directory: Directory to serve (default: ``bundle_dir()``, where assets are built)
+            manifest: Manifest of content-hashed files (default: ``get_manifest()``)
+            **kwargs: Passed to ``StaticFiles``
+        """
+        self.manifest = manifest or get_manifest()
+        directory = directory if directory is not None else bundle_dir()
+        self._bundle_dir = bundle_dir().resolve()
+        super().__init__(directory=directory, **kwargs)
+
+    def file_response(
+        self,
+        full_path: str | os.PathLike[str],
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        path = Path(full_path)
+        variants = self.variants(path)
+        accepted, refused = _accepted_encodings(Headers(scope=scope).get("accept-encoding", ""))
+        encoding = next(
+            (name for name in variants if name in accepted or ("*" in accepted and name not in refused)), None
+        )
+
+        if encoding is None:
+            response = super().file_response(full_path, stat_result, scope, status_code)
+        else:
+            variant = variants[encoding]
+            response = super().file_response(variant, variant.stat(), scope, status_code)
+            response.headers["Content-Encoding"] = encoding
+            media_type, _ = mimetypes.guess_type(path.name)
+            if media_type and response.status_code != 304:
+                response.headers["Content-Type"] = _with_charset(media_type)
+
+        if variants:
+            response.headers["Vary"] = "Accept-Encoding"
+        if self.is_fingerprinted(path):
+            response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        return response
+
+    def variants(self, path: Path) -> dict[str, Path]:
+        """Precompressed variants of ``path`` that exist, by encoding, in order of preference."""
+        variants = {}
+        for encoding, suffix in ENCODING_SUFFIXES.items():
+            variant = path.with_name(path.name + suffix)
+            if variant.is_file():
+                variants[encoding] = variant
+        return variants
+
+    def is_fingerprinted(self, path: Path) -> bool:
+        """Whether ``path`` is a content-hashed asset, a compiled theme or a versioned vendored library."""
+        resolved = path.resolve()
+        # Vendored files are named by their pinned version (see eidos.vendor)
+        if resolved.parent == vendor_dir().resolve():
+            return any(resolved.name == library.filename for library in VENDORED_LIBRARIES.values())
+        try:
+            relative = resolved.relative_to(self._bundle_dir)
+        except ValueError:
+            return False
+        # Compiled themes are named by their content too (see eidos.theming)
+        return self.manifest.is_fingerprinted(relative.as_posix()) or relative.parent.as_posix() == THEMES_DIR
+
+
+def _accepted_encodings(header: str) -> tuple[set[str], set[str]]:
+    """Encodings an ``Accept-Encoding`` header allows, and those it refuses with ``q=0``.
+
+    The refused ones matter with a ``*``, which does not cover encodings named with ``q=0``.
+    """
+    accepted: set[str] = set()
+    refused: set[str] = set()
+    for item in header.split(","):
+        name, _, params = item.partition(";")
+        try:
+            quality = float(params.strip().removeprefix("q=")) if params.strip() else 1.0
+        except ValueError:
+            quality = 1.0
+        if name.strip():
+            (accepted if quality > 0 else refused).add(name.strip().lower())
+    return accepted, refused
+
+
+def _with_charset(media_type: str) -> str:
+    return f"{media_type}; charset=utf-8" if media_type.startswith("text/") else media_type
@@ -0,0 +1,794 @@
+"""Static Tailwind utility CSS for the classes an app actually uses.
+
+The Tailwind Play CDN script loaded by ``EidosHeaders`` ships a full JIT
+compiler to every browser and generates CSS on the main thread on each page
+load. This module generates the same utilities ahead of time instead:
+collect the class tokens an app renders (with ``track_classes`` during a test
+run, or ``classes_in_html`` on crawled pages), generate a stylesheet for just
+those, and link it with ``EidosHeaders(static_tailwind=True)``::
+
+    python -m eidos.tailwind crawled-pages/ classes.txt
+
+It covers the commonly used part of Tailwind v3 (preflight, layout, flexbox
+and grid, spacing, sizing, typography, colors, borders, effects and
+transitions) with responsive (``md:``), state (``hover:``) and ``dark:``
+variants and arbitrary values (``w-[22rem]``). Tokens it does not know, such
+as ``eidos-*`` component classes, are skipped; ``build_tailwind_css`` logs a
+warning listing the skipped ones that are not EidosUI classes.
+"""
+
+import argparse
+import logging
+import re
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .assets import Asset, generated_asset_url, write_generated_asset
+from .utils import track_classes
+
+__all__ = [
+    "build_tailwind_css",
+    "classes_from_files",
+    "classes_in_html",
+    "generate_css",
+    "get_tailwind_css_url",
+    "track_classes",
+    "unsupported_classes",
+]
+
+logger = logging.getLogger(__name__)
+
+SCREENS = {"sm": "640px", "md": "768px", "lg": "1024px", "xl": "1280px", "2xl": "1536px"}
+
+PSEUDO_CLASSES = {
+    "hover": ":hover",
+    "focus": ":focus",
+    "focus-visible": ":focus-visible",
+    "focus-within": ":focus-within",
+    "active": ":active",
+    "disabled": ":disabled",
+    "first": ":first-child",
+    "last": ":last-child",
+    "odd": ":nth-child(odd)",
+    "even": ":nth-child(even)",
+}
+
+# Theme switching sets data-theme on <html>, so dark: follows it rather than the OS setting
+PARENT_VARIANTS = {
+    "dark": '[data-theme="dark"] ',
+    "group-hover": ".group:hover ",
+}
+
+# Condensed Tailwind v3 preflight
+PREFLIGHT = (
+    "*,::before,::after{box-sizing:border-box;border-width:0;border-style:solid;border-color:currentColor}"
+    "html{line-height:1.5;-webkit-text-size-adjust:100%;tab-size:4}"
+    "body{margin:0;line-height:inherit}"
+    "hr{height:0;color:inherit;border-top-width:1px}"
+    "h1,h2,h3,h4,h5,h6{font-size:inherit;font-weight:inherit}"
+    "a{color:inherit;text-decoration:inherit}"
+    "b,strong{font-weight:bolder}"
+    "code,kbd,samp,pre{font-family:ui-monospace,SFMono-Regular,Menlo,Monaco,Consolas,monospace;font-size:1em}"
+    "table{text-indent:0;border-color:inherit;border-collapse:collapse}"
+    "button,input,optgroup,select,textarea{font-family:inherit;font-size:100%;font-weight:inherit;"
+    "line-height:inherit;color:inherit;margin:0;padding:0}"
+    "button,select{text-transform:none}"
+    "button,[type='button'],[type='reset'],[type='submit']{-webkit-appearance:button;"
+    "background-color:transparent;background-image:none}"
+    "blockquote,dl,dd,h1,h2,h3,h4,h5,h6,hr,figure,p,pre{margin:0}"
+    "fieldset{margin:0;padding:0}"
+    "ol,ul,menu{list-style:none;margin:0;padding:0}"
+    "textarea{resize:vertical}"
+    "input::placeholder,textarea::placeholder{opacity:1;color:#9ca3af}"
+    "button,[role='button']{cursor:pointer}"
+    ":disabled{cursor:default}"
+    "img,svg,video,canvas,audio,iframe,embed,object{display:block;vertical-align:middle}"
+    "img,video{max-width:100%;height:auto}"
+    "[hidden]{display:none}"
+)
+
+# fmt: off
+_PALETTE_SHADES = ("50", "100", "200", "300", "400", "500", "600", "700", "800", "900", "950")
+_PALETTE_HEX = {
+    "slate": "f8fafc f1f5f9 e2e8f0 cbd5e1 94a3b8 64748b 475569 334155 1e293b 0f172a 020617",
+    "gray": "f9fafb f3f4f6 e5e7eb d1d5db 9ca3af 6b7280 4b5563 374151 1f2937 111827 030712",
+    "zinc": "fafafa f4f4f5 e4e4e7 d4d4d8 a1a1aa 71717a 52525b 3f3f46 27272a 18181b 09090b",
+    "neutral": "fafafa f5f5f5 e5e5e5 d4d4d4 a3a3a3 737373 525252 404040 262626 171717 0a0a0a",
+    "stone": "fafaf9 f5f5f4 e7e5e4 d6d3d1 a8a29e 78716c 57534e 44403c 292524 1c1917 0c0a09",
+    "red": "fef2f2 fee2e2 fecaca fca5a5 f87171 ef4444 dc2626 b91c1c 991b1b 7f1d1d 450a0a",
+    "orange": "fff7ed ffedd5 fed7aa fdba74 fb923c f97316 ea580c c2410c 9a3412 7c2d12 431407",
+    "amber": "fffbeb fef3c7 fde68a fcd34d fbbf24 f59e0b d97706 b45309 92400e 78350f 451a03",
+    "yellow": "fefce8 fef9c3 fef08a fde047 facc15 eab308 ca8a04 a16207 854d0e 713f12 422006",
+    "lime": "f7fee7 ecfccb d9f99d bef264 a3e635 84cc16 65a30d 4d7c0f 3f6212 365314 1a2e05",
+    "green": "f0fdf4 dcfce7 bbf7d0 86efac 4ade80 22c55e 16a34a 15803d 166534 14532d 052e16",
+    "emerald": "ecfdf5 d1fae5 a7f3d0 6ee7b7 34d399 10b981 059669 047857 065f46 064e3b 022c22",
+    "teal": "f0fdfa ccfbf1 99f6e4 5eead4 2dd4bf 14b8a6 0d9488 0f766e 115e59 134e4a 042f2e",
+    "cyan": "ecfeff cffafe a5f3fc 67e8f9 22d3ee 06b6d4 0891b2 0e7490 155e75 164e63 083344",
+    "sky": "f0f9ff e0f2fe bae6fd 7dd3fc 38bdf8 0ea5e9 0284c7 0369a1 075985 0c4a6e 082f49",
+    "blue": "eff6ff dbeafe bfdbfe 93c5fd 60a5fa 3b82f6 2563eb 1d4ed8 1e40af 1e3a8a 172554",
+    "indigo": "eef2ff e0e7ff c7d2fe a5b4fc 818cf8 6366f1 4f46e5 4338ca 3730a3 312e81 1e1b4b",
+    "violet": "f5f3ff ede9fe ddd6fe c4b5fd a78bfa 8b5cf6 7c3aed 6d28d9 5b21b6 4c1d95 2e1065",
+    "purple": "faf5ff f3e8ff e9d5ff d8b4fe c084fc a855f7 9333ea 7e22ce 6b21a8 581c87 3b0764",
+    "fuchsia": "fdf4ff fae8ff f5d0fe f0abfc e879f9 d946ef c026d3 a21caf 86198f 701a75 4a044e",
+    "pink": "fdf2f8 fce7f3 fbcfe8 f9a8d4 f472b6 ec4899 db2777 be185d 9d174d 831843 500724",
+    "rose": "fff1f2 ffe4e6 fecdd3 fda4af fb7185 f43f5e e11d48 be123c 9f1239 881337 4c0519",
+}
+# fmt: on
+
+COLORS: dict[str, str] = {"black": "#000000", "white": "#ffffff"}
+for _name, _hexes in _PALETTE_HEX.items():
+    COLORS.update({f"{_name}-{shade}": f"#{hex_}" for shade, hex_ in zip(_PALETTE_SHADES, _hexes.split(), strict=True)})
+
+SPECIAL_COLORS = {"inherit": "inherit", "current": "currentColor", "transparent": "transparent"}
+
+SPACING = {"0": "0px", "px": "1px"} | {
+    key: f"{float(key) / 4:g}rem"
+    for key in "0.5 1 1.5 2 2.5 3 3.5 4 5 6 7 8 9 10 11 12 14 16 20 24 28 32 36 40 44 48 52 56 60 64 72 80 96".split()
+}
+
+FONT_SIZES = {
+    "xs": ("0.75rem", "1rem"),
+    "sm": ("0.875rem", "1.25rem"),
+    "base": ("1rem", "1.5rem"),
+    "lg": ("1.125rem", "1.75rem"),
+    "xl": ("1.25rem", "1.75rem"),
+    "2xl": ("1.5rem", "2rem"),
+    "3xl": ("1.875rem", "2.25rem"),
+    "4xl": ("2.25rem", "2.5rem"),
+    "5xl": ("3rem", "1"),
+    "6xl": ("3.75rem", "1"),
+    "7xl": ("4.5rem", "1"),
+    "8xl": ("6rem", "1"),
+    "9xl": ("8rem", "1"),
+}
+
+MAX_WIDTHS = {
+    "none": "none",
+    "xs": "20rem",
+    "sm": "24rem",
+    "md": "28rem",
+    "lg": "32rem",
+    "xl": "36rem",
+    "2xl": "42rem",
+    "3xl": "48rem",
+    "4xl": "56rem",
+    "5xl": "64rem",
+    "6xl": "72rem",
+    "7xl": "80rem",
+    "full": "100%",
+    "min": "min-content",
+    "max": "max-content",
+    "fit": "fit-content",
+    "prose": "65ch",
+} | {f"screen-{name}": width for name, width in SCREENS.items()}
+
+RADII = {
+    "none": "0px",
+    "sm": "0.125rem",
+    "": "0.25rem",
+    "md": "0.375rem",
+    "lg": "0.5rem",
+    "xl": "0.75rem",
+    "2xl": "1rem",
+    "3xl": "1.5rem",
+    "full": "9999px",
+}
+
+SHADOWS = {
+    "sm": "0 1px 2px 0 rgb(0 0 0 / 0.05)",
+    "": "0 1px 3px 0 rgb(0 0 0 / 0.1), 0 1px 2px -1px rgb(0 0 0 / 0.1)",
+    "md": "0 4px 6px -1px rgb(0 0 0 / 0.1), 0 2px 4px -2px rgb(0 0 0 / 0.1)",
+    "lg": "0 10px 15px -3px rgb(0 0 0 / 0.1), 0 4px 6px -4px rgb(0 0 0 / 0.1)",
+    "xl": "0 20px 25px -5px rgb(0 0 0 / 0.1), 0 8px 10px -6px rgb(0 0 0 / 0.1)",
+    "2xl": "0 25px 50px -12px rgb(0 0 0 / 0.25)",
+    "inner": "inset 0 2px 4px 0 rgb(0 0 0 / 0.05)",
+    "none": "0 0 #0000",
+}
+
+FONT_WEIGHTS = {
+    "thin": "100",
+    "extralight": "200",
+    "light": "300",
+    "normal": "400",
+    "medium": "500",
+    "semibold": "600",
+    "bold": "700",
+    "extrabold": "800",
+    "black": "900",
+}
+
+FONT_FAMILIES = {
+    "sans": 'ui-sans-serif,system-ui,sans-serif,"Apple Color Emoji","Segoe UI Emoji"',
+    "serif": 'ui-serif,Georgia,Cambria,"Times New Roman",Times,serif',
+    "mono": "ui-monospace,SFMono-Regular,Menlo,Monaco,Consolas,monospace",
+}
+
+LINE_HEIGHTS = {"none": "1", "tight": "1.25", "snug": "1.375", "normal": "1.5", "relaxed": "1.625", "loose": "2"} | {
+    str(n): f"{n / 4:g}rem" for n in range(3, 11)
+}
+
+LETTER_SPACINGS = {
+    "tighter": "-0.05em",
+    "tight": "-0.025em",
+    "normal": "0em",
+    "wide": "0.025em",
+    "wider": "0.05em",
+    "widest": "0.1em",
+}
+
+EASINGS = {
+    "linear": "linear",
+    "in": "cubic-bezier(0.4, 0, 1, 1)",
+    "out": "cubic-bezier(0, 0, 0.2, 1)",
+    "in-out": "cubic-bezier(0.4, 0, 0.2, 1)",
+}
+
+_TRANSITION = "transition-timing-function:cubic-bezier(0.4,0,0.2,1);transition-duration:150ms"
+_COLOR_PROPERTIES = "color,background-color,border-color,text-decoration-color,fill,stroke"
+
+Scale = Callable[[str], str | None]
+
+
+def _arbitrary(value: str) -> str | None:
+    """``[22rem]`` -> ``22rem``; underscores stand for spaces, as in Tailwind."""
+    if len(value) > 2 and value[0] == "[" and value[-1] == "]":
+        return value[1:-1].replace("_", " ")
+    return None
+
+
+def _is_color(value: str) -> bool:
+    return value.startswith(("#", "rgb", "hsl", "color-mix", "var("))
+
+
+def _from(mapping: dict[str, str], arbitrary: bool = True) -> Scale:
+    def scale(value: str) -> str | None:
+        if value in mapping:
+            return mapping[value]
+        css = _arbitrary(value) if arbitrary else None
+        return css if css is not None and not _is_color(css) else None
+
+    return scale
+
+
+def _fraction(value: str) -> str | None:
+    numerator, slash, denominator = value.partition("/")
+    if slash and numerator.isdigit() and denominator.isdigit() and int(denominator):
+        return f"{int(numerator) / int(denominator) * 100:g}%"
+    return None
+
+
+def _spacing(value: str) -> str | None:
+    return _from(SPACING)(value)
+
+
+def _size(extra: dict[str, str]) -> Scale:
+    def scale(value: str) -> str | None:
+        return _spacing(value) or _fraction(value) or _from(extra, arbitrary=False)(value)
+
+    return scale
+
+
+def _color(value: str) -> str | None:
+    name, slash, alpha = value.partition("/")
+    if name in SPECIAL_COLORS and not slash:
+        return SPECIAL_COLORS[name]
+    css = COLORS.get(name)
+    if css is None:
+        css = _arbitrary(name)
+        if css is None or not _is_color(css):
+            return None
+    if not slash:
+        return css
+    if not alpha.isdigit() or not css.startswith("#") or len(css) != 7:
+        return None
+    red, green, blue = (int(css[i : i + 2], 16) for i in (1, 3, 5))
+    return f"rgb({red} {green} {blue} / {int(alpha) / 100:g})"
+
+
+def _font_size(value: str) -> str | None:
+    if value in FONT_SIZES:
+        size, line_height = FONT_SIZES[value]
+        return f"font-size:{size};line-height:{line_height}"
+    css = _arbitrary(value)
+    return f"font-size:{css}" if css is not None and not _is_color(css) else None
+
+
+@dataclass(frozen=True)
+class _Rule:
+    """Utilities ``<prefix>-<value>`` setting ``properties`` to ``scale(value)``.
+
+    A bare ``<prefix>`` (``border``, ``rounded``) is looked up with the value ``""``.
+    """
+
+    prefix: str
+    properties: tuple[str, ...]
+    scale: Scale
+    negative: bool = False
+    selector_suffix: str = ""
+    template: str = ""  # declarations with "{}" for the value, used instead of properties
+
+    def declarations(self, value: str, negate: bool) -> str | None:
+        css = self.scale(value)
+        if css is None or (negate and not self.negative):
+            return None
+        if negate:
+            css = css[1:] if css.startswith("-") else f"-{css}"
+        if self.template:
+            return self.template.replace("{}", css)
+        return ";".join(f"{prop}:{css}" for prop in self.properties)
+
+
+@dataclass(frozen=True)
+class _Static:
+    """Utilities with no value part, such as ``flex`` or ``sr-only``."""
+
+    utilities: dict[str, str] = field(default_factory=dict)
+
+
+def _sides(prefix: str, properties: str, scale: Scale, negative: bool = False) -> list[_Rule]:
+    """``p``, ``px``, ``py``, ``pt``... rules for a box property (``padding``, ``margin``)."""
+    return [
+        _Rule(prefix, (properties,), scale, negative),
+        _Rule(f"{prefix}x", (f"{properties}-left", f"{properties}-right"), scale, negative),
+        _Rule(f"{prefix}y", (f"{properties}-top", f"{properties}-bottom"), scale, negative),
+        _Rule(f"{prefix}t", (f"{properties}-top",), scale, negative),
+        _Rule(f"{prefix}r", (f"{properties}-right",), scale, negative),
+        _Rule(f"{prefix}b", (f"{properties}-bottom",), scale, negative),
+        _Rule(f"{prefix}l", (f"{properties}-left",), scale, negative),
+    ]
+
+
+_INSET = _size({"full": "100%", "auto": "auto"})
+_WIDTHS = {"auto": "auto", "full": "100%", "screen": "100vw", "min": "min-content", "max": "max-content"}
+_HEIGHTS = {"auto": "auto", "full": "100%", "screen": "100vh", "min": "min-content", "max": "max-content"}
+_BORDER_WIDTHS = {"": "1px", "0": "0px", "2": "2px", "4": "4px", "8": "8px"}
+
+# In cascade order: a later utility overrides an earlier one (px-2 beats p-4)
+UTILITIES: list[_Rule | _Static] = [
+    _Static(
+        {
+            "sr-only": "position:absolute;width:1px;height:1px;padding:0;margin:-1px;overflow:hidden;"
+            "clip:rect(0,0,0,0);white-space:nowrap;border-width:0",
+            "pointer-events-none": "pointer-events:none",
+            "pointer-events-auto": "pointer-events:auto",
+            "visible": "visibility:visible",
+            "invisible": "visibility:hidden",
+            "static": "position:static",
+            "fixed": "position:fixed",
+            "absolute": "position:absolute",
+            "relative": "position:relative",
+            "sticky": "position:sticky",
+        }
+    ),
+    _Rule("inset", ("inset",), _INSET, negative=True),
+    _Rule("inset-x", ("left", "right"), _INSET, negative=True),
+    _Rule("inset-y", ("top", "bottom"), _INSET, negative=True),
+    _Rule("top", ("top",), _INSET, negative=True),
+    _Rule("right", ("right",), _INSET, negative=True),
+    _Rule("bottom", ("bottom",), _INSET, negative=True),
+    _Rule("left", ("left",), _INSET, negative=True),
+    _Rule("z", ("z-index",), _from({"auto": "auto"} | {str(n): str(n) for n in range(0, 60, 10)})),
+    _Rule(
+        "order",
+        ("order",),
+        _from({"first": "-9999", "last": "9999", "none": "0"} | {str(n): str(n) for n in range(1, 13)}),
+    ),
+    _Rule(
+        "col-span",
+        ("grid-column",),
+        lambda v: "1 / -1" if v == "full" else (f"span {v} / span {v}" if v.isdigit() else None),
+    ),
+    _Rule(
+        "row-span",
+        ("grid-row",),
+        lambda v: "1 / -1" if v == "full" else (f"span {v} / span {v}" if v.isdigit() else None),
+    ),
+    *_sides("m", "margin", _from(SPACING | {"auto": "auto"}), negative=True),
+    _Static(
+        {
+            "block": "display:block",
+            "inline-block": "display:inline-block",
+            "inline": "display:inline",
+            "flex": "display:flex",
+            "inline-flex": "display:inline-flex",
+            "table": "display:table",
+            "grid": "display:grid",
+            "inline-grid": "display:inline-grid",
+            "contents": "display:contents",
+            "hidden": "display:none",
+        }
+    ),
+    _Static(
+        {
+            "aspect-auto": "aspect-ratio:auto",
+            "aspect-square": "aspect-ratio:1 / 1",
+            "aspect-video": "aspect-ratio:16 / 9",
+        }
+    ),
+    _Rule("size", ("width", "height"), _size(_WIDTHS)),
+    _Rule("h", ("height",), _size(_HEIGHTS)),
+    _Rule("max-h", ("max-height",), _size({"full": "100%", "screen": "100vh", "none": "none"})),
+    _Rule("min-h", ("min-height",), _from({"0": "0px", "full": "100%", "screen": "100vh"})),
+    _Rule("w", ("width",), _size(_WIDTHS)),
+    _Rule("min-w", ("min-width",), _from({"0": "0px", "full": "100%", "min": "min-content", "max": "max-content"})),
+    _Rule("max-w", ("max-width",), _from(MAX_WIDTHS)),
+    _Static(
+        {
+            "flex-1": "flex:1 1 0%",
+            "flex-auto": "flex:1 1 auto",
+            "flex-initial": "flex:0 1 auto",
+            "flex-none": "flex:none",
+            "shrink": "flex-shrink:1",
+            "shrink-0": "flex-shrink:0",
+            "grow": "flex-grow:1",
+            "grow-0": "flex-grow:0",
+        }
+    ),
+    _Rule("basis", ("flex-basis",), _size({"auto": "auto", "full": "100%"})),
+    _Static(
+        {
+            "cursor-auto": "cursor:auto",
+            "cursor-default": "cursor:default",
+            "cursor-pointer": "cursor:pointer",
+            "cursor-wait": "cursor:wait",
+            "cursor-text": "cursor:text",
+            "cursor-move": "cursor:move",
+            "cursor-not-allowed": "cursor:not-allowed",
+            "select-none": "user-select:none",
+            "select-text": "user-select:text",
+            "select-all": "user-select:all",
+            "list-none": "list-style-type:none",
+            "list-disc": "list-style-type:disc",
+            "list-decimal": "list-style-type:decimal",
+            "list-inside": "list-style-position:inside",
+        }
+    ),
+    _Rule(
+        "grid-cols",
+        ("grid-template-columns",),
+        lambda v: "none" if v == "none" else (f"repeat({v}, minmax(0, 1fr))" if v.isdigit() else _arbitrary(v)),
+    ),
+    _Rule(
+        "grid-rows",
+        ("grid-template-rows",),
+        lambda v: "none" if v == "none" else (f"repeat({v}, minmax(0, 1fr))" if v.isdigit() else _arbitrary(v)),
+    ),
+    _Static(
+        {
+            "flex-row": "flex-direction:row",
+            "flex-row-reverse": "flex-direction:row-reverse",
+            "flex-col": "flex-direction:column",
+            "flex-col-reverse": "flex-direction:column-reverse",
+            "flex-wrap": "flex-wrap:wrap",
+            "flex-wrap-reverse": "flex-wrap:wrap-reverse",
+            "flex-nowrap": "flex-wrap:nowrap",
+            "place-items-center": "place-items:center",
+            "content-center": "align-content:center",
+            "content-start": "align-content:flex-start",
+            "content-end": "align-content:flex-end",
+            "content-between": "align-content:space-between",
+            "items-start": "align-items:flex-start",
+            "items-end": "align-items:flex-end",
+            "items-center": "align-items:center",
+            "items-baseline": "align-items:baseline",
+            "items-stretch": "align-items:stretch",
+            "justify-start": "justify-content:flex-start",
+            "justify-end": "justify-content:flex-end",
+            "justify-center": "justify-content:center",
+            "justify-between": "justify-content:space-between",
+            "justify-around": "justify-content:space-around",
+            "justify-evenly": "justify-content:space-evenly",
+            "justify-items-center": "justify-items:center",
+            "justify-items-stretch": "justify-items:stretch",
+        }
+    ),
+    _Rule("gap", ("gap",), _spacing),
+    _Rule("gap-x", ("column-gap",), _spacing),
+    _Rule("gap-y", ("row-gap",), _spacing),
+    _Rule("space-x", ("margin-left",), _spacing, negative=True, selector_suffix=" > :not([hidden]) ~ :not([hidden])"),
+    _Rule("space-y", ("margin-top",), _spacing, negative=True, selector_suffix=" > :not([hidden]) ~ :not([hidden])"),
+    _Static(
+        {
+            "self-auto": "align-self:auto",
+            "self-start": "align-self:flex-start",
+            "self-end": "align-self:flex-end",
+            "self-center": "align-self:center",
+            "self-stretch": "align-self:stretch",
+            "overflow-auto": "overflow:auto",
+            "overflow-hidden": "overflow:hidden",
+            "overflow-visible": "overflow:visible",
+            "overflow-scroll": "overflow:scroll",
+            "overflow-x-auto": "overflow-x:auto",
+            "overflow-y-auto": "overflow-y:auto",
+            "overflow-x-hidden": "overflow-x:hidden",
+            "overflow-y-hidden": "overflow-y:hidden",
+            "truncate": "overflow:hidden;text-overflow:ellipsis;white-space:nowrap",
+            "whitespace-normal": "white-space:normal",
+            "whitespace-nowrap": "white-space:nowrap",
+            "whitespace-pre": "white-space:pre",
+            "whitespace-pre-wrap": "white-space:pre-wrap",
+            "break-words": "overflow-wrap:break-word",
+            "break-all": "word-break:break-all",
+        }
+    ),
+    _Rule("rounded", ("border-radius",), _from(RADII)),
+    _Rule("rounded-t", ("border-top-left-radius", "border-top-right-radius"), _from(RADII)),
+    _Rule("rounded-r", ("border-top-right-radius", "border-bottom-right-radius"), _from(RADII)),
+    _Rule("rounded-b", ("border-bottom-right-radius", "border-bottom-left-radius"), _from(RADII)),
+    _Rule("rounded-l", ("border-top-left-radius", "border-bottom-left-radius"), _from(RADII)),
+    _Rule("border", ("border-width",), _from(_BORDER_WIDTHS)),
+    _Rule("border-x", ("border-left-width", "border-right-width"), _from(_BORDER_WIDTHS)),
+    _Rule("border-y", ("border-top-width", "border-bottom-width"), _from(_BORDER_WIDTHS)),
+    _Rule("border-t", ("border-top-width",), _from(_BORDER_WIDTHS)),
+    _Rule("border-r", ("border-right-width",), _from(_BORDER_WIDTHS)),
+    _Rule("border-b", ("border-bottom-width",), _from(_BORDER_WIDTHS)),
+    _Rule("border-l", ("border-left-width",), _from(_BORDER_WIDTHS)),
+    _Static(
+        {
+            "border-solid": "border-style:solid",
+            "border-dashed": "border-style:dashed",
+            "border-dotted": "border-style:dotted",
+            "border-none": "border-style:none",
+        }
+    ),
+    _Rule("border", ("border-color",), _color),
+    _Rule("bg", ("background-color",), _color),
+    _Static(
+        {
+            "object-contain": "object-fit:contain",
+            "object-cover": "object-fit:cover",
+            "object-center": "object-position:center",
+        }
+    ),
+    *_sides("p", "padding", _spacing),
+    _Static(
+        {
+            "text-left": "text-align:left",
+            "text-center": "text-align:center",
+            "text-right": "text-align:right",
+            "text-justify": "text-align:justify",
+            "align-top": "vertical-align:top",
+            "align-middle": "vertical-align:middle",
+            "align-bottom": "vertical-align:bottom",
+        }
+    ),
+    _Rule("font", ("font-family",), _from(FONT_FAMILIES, arbitrary=False)),
+    _Rule("text", (), _font_size, template="{}"),
+    _Rule("font", ("font-weight",), _from(FONT_WEIGHTS, arbitrary=False)),
+    _Static(
+        {
+            "uppercase": "text-transform:uppercase",
+            "lowercase": "text-transform:lowercase",
+            "capitalize": "text-transform:capitalize",
+            "normal-case": "text-transform:none",
+            "italic": "font-style:italic",
+            "not-italic": "font-style:normal",
+        }
+    ),
+    _Rule("leading", ("line-height",), _from(LINE_HEIGHTS)),
+    _Rule("tracking", ("letter-spacing",), _from(LETTER_SPACINGS)),
+    _Rule("text", ("color",), _color),
+    _Static(
+        {
+            "underline": "text-decoration-line:underline",
+            "line-through": "text-decoration-line:line-through",
+            "no-underline": "text-decoration-line:none",
+            "antialiased": "-webkit-font-smoothing:antialiased;-moz-osx-font-smoothing:grayscale",
+        }
+    ),
+    _Rule("opacity", ("opacity",), lambda v: f"{int(v) / 100:g}" if v.isdigit() else _arbitrary(v)),
+    _Rule("shadow", ("box-shadow",), _from(SHADOWS, arbitrary=False)),
+    _Static(
+        {
+            "transition": "transition-property:color,background-color,border-color,text-decoration-color,fill,"
+            f"stroke,opacity,box-shadow,transform,filter,backdrop-filter;{_TRANSITION}",
+            "transition-all": f"transition-property:all;{_TRANSITION}",
+            "transition-colors": f"transition-property:{_COLOR_PROPERTIES};{_TRANSITION}",
+            "transition-opacity": f"transition-property:opacity;{_TRANSITION}",
+            "transition-shadow": f"transition-property:box-shadow;{_TRANSITION}",
+            "transition-transform": f"transition-property:transform;{_TRANSITION}",
+            "transition-none": "transition-property:none",
+        }
+    ),
+    _Rule("duration", ("transition-duration",), lambda v: f"{v}ms" if v.isdigit() else _arbitrary(v)),
+    _Rule("ease", ("transition-timing-function",), _from(EASINGS, arbitrary=False)),
+]
+
+
+@dataclass(frozen=True)
+class _Utility:
+    selector: str
+    declarations: str
+    media: str
+    order: tuple[int, int, int, str]
+
+
+def _split_variants(token: str) -> list[str]:
+    """Split ``md:hover:w-[calc(1px+2px)]`` on colons outside brackets."""
+    parts = []
+    depth = start = 0
+    for index, char in enumerate(token):
+        if char == "[":
+            depth += 1
+        elif char == "]":
+            depth -= 1
+        elif char == ":" and depth == 0:
+            parts.append(token[start:index])
+            start = index + 1
+    parts.append(token[start:])
+    return parts
+
+
+def escape_class(token: str) -> str:
+    """Escape a class token for use in a CSS selector: ``md:w-1/2`` -> ``md\\:w-1\\/2``."""
+    escaped = []
+    for index, char in enumerate(token):
+        if char.isascii() and (char.isalnum() or char in "-_"):
+            escaped.append(f"\\3{char} " if index == 0 and char.isdigit() else char)
+        else:
+            escaped.append(f"\\{char}")
+    return "".join(escaped)
+
+
+def _declarations(utility: str) -> tuple[int, str, str] | None:
+    """Rule index, declarations and selector suffix for a bare utility, if known."""
+    negate = utility.startswith("-")
+    name = utility[1:] if negate else utility
+    matches = []
+    for index, rule in enumerate(UTILITIES):
+        if isinstance(rule, _Static):
+            if not negate and name in rule.utilities:
+                return index, rule.utilities[name], ""
+        elif name == rule.prefix or name.startswith(f"{rule.prefix}-"):
+            declarations = rule.declarations(name[len(rule.prefix) + 1 :], negate)
+            if declarations is not None:
+                matches.append((len(rule.prefix), index, declarations, rule.selector_suffix))
+    if not matches:
+        return None
+    # The longest prefix wins: "px-4" is padding-x, not padding with value "x-4"
+    _, index, declarations, suffix = max(matches, key=lambda match: (match[0], -match[1]))
+    return index, declarations, suffix
+
+
+def _utility(token: str) -> _Utility | None:
+    *variants, utility = _split_variants(token)
+    important = utility.startswith("!")
+    found = _declarations(utility.removeprefix("!"))
+    if found is None:
+        return None
+    index, declarations, suffix = found
+    if important:
+        declarations = ";".join(f"{declaration}!important" for declaration in declarations.split(";"))
+
+    screen = 0
+    pseudo = prefix = ""
+    for variant in variants:
+        if variant in SCREENS and not screen:
+            screen = list(SCREENS).index(variant) + 1
+        elif variant in PSEUDO_CLASSES:
+            pseudo += PSEUDO_CLASSES[variant]
+        elif variant in PARENT_VARIANTS:
+            prefix = PARENT_VARIANTS[variant] + prefix
+        else:
+            return None
+    media = f"@media (min-width: {list(SCREENS.values())[screen - 1]})" if screen else ""
+    selector = f"{prefix}.{escape_class(token)}{pseudo}{suffix}"
+    return _Utility(selector, declarations, media, (screen, len(variants), index, token))
+
+
+def generate_css(classes: Iterable[str], preflight: bool = True) -> str:
+    """Generate a stylesheet for the Tailwind utilities among ``classes``.
+
+    Args:
+        classes: Class tokens; unknown ones (component classes, typos) are skipped
+        preflight: Include Tailwind's base reset, as the Play CDN does
+
+    Returns:
+        The stylesheet, identical for the same set of classes in any order
+
+    Example:
+        >>> print(generate_css(["flex", "md:gap-4", "eidos-btn"], preflight=False))
+        .flex{display:flex}
+        @media (min-width: 768px){.md\\:gap-4{gap:1rem}}
+    """
+    utilities = sorted(
+        (utility for utility in map(_utility, set(classes)) if utility is not None),
+        key=lambda utility: utility.order,
+    )
+    blocks: dict[str, list[str]] = {}
+    for utility in utilities:
+        blocks.setdefault(utility.media, []).append(f"{utility.selector}{{{utility.declarations}}}")
+
+    lines = [PREFLIGHT] if preflight else []
+    for media, rules in blocks.items():
+        lines.append(f"{media}{{{''.join(rules)}}}" if media else "\n".join(rules))
+    return "\n".join(lines)
+
+
+def unsupported_classes(classes: Iterable[str]) -> set[str]:
+    """Tokens among ``classes`` that ``generate_css`` skips, other than EidosUI's own classes.
+
+    Example:
+        >>> sorted(unsupported_classes(["flex", "eidos-btn", "backdrop-blur", "group"]))
+        ['backdrop-blur']
+    """
+    return {
+        token for token in classes if token != "group" and not token.startswith("eidos-") and _utility(token) is None
+    }
+
+
+RE_CLASS_ATTRIBUTE = re.compile(r"""\sclass\s*=\s*(?:"([^"]*)"|'([^']*)')""", re.IGNORECASE)
+# Alpine class bindings: :class="{'eidos-tab-active': active}" or x-bind:class="open ? 'block' : 'hidden'"
+RE_BOUND_CLASS = re.compile(r"""\s(?:x-bind)?:class\s*=\s*"([^"]*)\"""", re.IGNORECASE)
+RE_QUOTED = re.compile(r"'([^']*)'")
+
+
+def classes_in_html(html: str) -> set[str]:
+    """Class tokens used in rendered HTML, including Alpine ``:class`` bindings."""
+    classes: set[str] = set()
+    for match in RE_CLASS_ATTRIBUTE.finditer(html):
+        classes.update((match.group(1) or match.group(2) or "").split())
+    for match in RE_BOUND_CLASS.finditer(html):
+        for quoted in RE_QUOTED.findall(match.group(1).replace("&#x27;", "'").replace("&#39;", "'")):
+            classes.update(quoted.split())
+    return classes
+
+
+def build_tailwind_css(classes: Iterable[str], directory: str | Path | None = None) -> Asset:
+    """Generate the utility stylesheet and write it under a content-hashed name.
+
+    The file goes next to the other built assets, so ``get_eidos_static_files``
+    already serves it, and ``get_tailwind_css_url`` finds it.
+
+    Args:
+        classes: Class tokens used by the app
+        directory: Output directory (default: ``bundle_dir()``)
+
+    Returns:
+        The written Asset; unsupported classes are logged as a warning
+    """
+    classes = set(classes)
+    skipped = unsupported_classes(classes)
+    if skipped:
+        logger.warning("Skipped %d unsupported Tailwind classes: %s", len(skipped), " ".join(sorted(skipped)))
+    asset = write_generated_asset("tailwind.css", generate_css(classes).encode(), directory)
+    return asset
+
+
+def get_tailwind_css_url() -> str:
+    """URL of the stylesheet last written by ``build_tailwind_css`` to ``bundle_dir()``.
+
+    Raises:
+        FileNotFoundError: If no stylesheet has been built
+    """
+    return generated_asset_url("tailwind.css", "eidos.tailwind")
+
+
+def classes_from_files(paths: Iterable[Path]) -> set[str]:
+    """Class tokens from HTML files, directories of them, and text files listing classes."""
+    classes: set[str] = set()
+    for path in paths:
+        files = sorted(path.rglob("*.htm*")) if path.is_dir() else [path]
+        for file in files:
+            text = file.read_text(encoding="utf-8")
+            classes |= set(text.split()) if file.suffix == ".txt" else classes_in_html(text)
+    return classes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate static Tailwind utility CSS from used classes.")
+    parser.add_argument(
+        "inputs",
+        nargs="+",
+        type=Path,
+        help="HTML files, directories of them, or text files of whitespace-separated classes",
+    )
+    parser.add_argument("--out", default=None, help="output directory (default: $EIDOS_BUNDLE_DIR or a temp dir)")
+    args = parser.parse_args()
+
+    print(build_tailwind_css(classes_from_files(args.inputs), args.out).url)
+
+
+if __name__ == "__main__":
+    main()
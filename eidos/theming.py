@@ -0,0 +1,195 @@
+"""Compile per-tenant themes into cached, content-hashed stylesheets.
+
+A ``ThemeSpec`` overrides the CSS variables of ``eidos-variables.css``,
+``light.css`` and ``dark.css``: the palette, radii, fonts or any other
+variable. ``compile_theme`` turns it into a small stylesheet, written once
+under a content-hashed name in ``bundle_dir()/themes`` so every worker can
+serve it, and remembered in a bounded in-memory cache so a page only pays for
+the compilation the first time a spec is seen. Pages link it by URL with
+``ThemeCSS``, after ``EidosHeaders``::
+
+    acme = ThemeSpec(colors={"primary": "#e11d48"}, radii={"md": "0"}, fonts={"base": "Inter, sans-serif"})
+    Head(*EidosHeaders(), ThemeCSS(acme))
+"""
+
+import functools
+import hashlib
+import os
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+
+from air import Link, Tag
+
+from .assets import BUNDLE_URL_PREFIX, PACKAGE_DIR, THEME_FILES, _write, bundle_dir, precompress
+from .utils import LRUCache
+
+#: Subdirectory of ``bundle_dir()`` compiled themes are written to
+THEMES_DIR = "themes"
+
+#: Stylesheets whose variables a ThemeSpec can override
+VARIABLE_FILES = ("css/themes/eidos-variables.css", *THEME_FILES.values())
+
+RE_VARIABLE = re.compile(r"(--[\w-]+)\s*:")
+RE_NAME = re.compile(r"[a-z0-9]+(?:-[a-z0-9]+)*")
+RE_HEX_COLOR = re.compile(r"#([0-9a-fA-F]{3}|[0-9a-fA-F]{6})")
+# Anything that could end the declaration or rule it is placed in
+RE_UNSAFE_VALUE = re.compile(r"[{};<>\\\n\r]|/\*")
+
+
+@dataclass(frozen=True)
+class ThemeSpec:
+    """Overrides of the EidosUI CSS variables for one tenant.
+
+    Names are given without their prefix, and values are any CSS value.
+
+    Args:
+        colors: Light (default) palette, e.g. ``{"primary": "#e11d48"}`` for
+            ``--color-primary``; the ``-rgb`` variant of a hex color is derived
+        dark_colors: Palette used with ``data-theme="dark"``
+        radii: Border radii, e.g. ``{"md": "0.25rem"}`` for ``--radius-md``
+        fonts: Font families, e.g. ``{"base": "Inter, sans-serif"}`` for
+            ``--font-family-base`` (also ``heading`` and ``mono``)
+        variables: Any other variable, by full name, e.g. ``{"--space-md": "1.25rem"}``
+    """
+
+    colors: Mapping[str, str] = field(default_factory=dict)
+    dark_colors: Mapping[str, str] = field(default_factory=dict)
+    radii: Mapping[str, str] = field(default_factory=dict)
+    fonts: Mapping[str, str] = field(default_factory=dict)
+    variables: Mapping[str, str] = field(default_factory=dict)
+
+    def key(self) -> tuple[tuple[tuple[str, str], ...], ...]:
+        """Hashable form of the spec, equal for specs with the same overrides."""
+        return tuple(tuple(sorted(getattr(self, f.name).items())) for f in fields(self))
+
+
+@dataclass(frozen=True)
+class CompiledTheme:
+    """A compiled theme: its stylesheet and content-hashed file name."""
+
+    css: str
+    digest: str
+
+    @property
+    def filename(self) -> str:
+        """File name in ``bundle_dir()``, e.g. ``themes/1a2b3c4d5e6f.css``."""
+        return f"{THEMES_DIR}/{self.digest}.css"
+
+    @property
+    def url(self) -> str:
+        """URL the theme is served at when ``bundle_dir()`` is mounted by ``get_eidos_static_files``."""
+        return f"{BUNDLE_URL_PREFIX}/{self.filename}"
+
+
+#: Compiled themes by output directory and ``ThemeSpec.key()``; bounded, since specs can come from tenant data
+theme_cache: LRUCache[CompiledTheme] = LRUCache(maxsize=1024)
+
+
+@functools.cache
+def theme_variables() -> frozenset[str]:
+    """Names of the CSS variables a ThemeSpec can override."""
+    return frozenset(
+        name
+        for path in VARIABLE_FILES
+        for name in RE_VARIABLE.findall((PACKAGE_DIR / path).read_text(encoding="utf-8"))
+    )
+
+
+def _declarations(prefix: str, values: Mapping[str, str]) -> dict[str, str]:
+    """Validated ``{"--<prefix><name>": value}`` declarations.
+
+    Raises:
+        ValueError: For unknown variables and values that are not a single CSS value
+    """
+    declarations = {}
+    for name, value in values.items():
+        variable = f"{prefix}{name}" if prefix else name
+        if not (variable.startswith("--") and RE_NAME.fullmatch(variable[2:])) or variable not in theme_variables():
+            raise ValueError(f"Unknown theme variable {variable!r}")
+        value = str(value).strip()
+        if not value or RE_UNSAFE_VALUE.search(value):
+            raise ValueError(f"Invalid value for {variable}: {value!r}")
+        declarations[variable] = value
+    return declarations
+
+
+def _with_rgb(colors: dict[str, str]) -> dict[str, str]:
+    """Add the ``-rgb`` variants the stylesheets use for translucent colors, from hex colors."""
+    derived = {}
+    for variable, value in colors.items():
+        match = RE_HEX_COLOR.fullmatch(value)
+        rgb = f"{variable}-rgb"
+        if match and rgb in theme_variables() and rgb not in colors:
+            digits = match.group(1) if len(match.group(1)) == 6 else "".join(c * 2 for c in match.group(1))
+            derived[rgb] = ", ".join(str(int(digits[i : i + 2], 16)) for i in (0, 2, 4))
+    return colors | derived
+
+
+def _rule(selector: str, declarations: dict[str, str]) -> str:
+    return f"{selector}{{{';'.join(f'{name}:{value}' for name, value in declarations.items())}}}"
+
+
+def theme_css(spec: ThemeSpec) -> str:
+    """The stylesheet for ``spec``, without caching or writing it.
+
+    Raises:
+        ValueError: For unknown variables and values that are not a single CSS value
+    """
+    root = _declarations("--radius-", spec.radii) | _declarations("--font-family-", spec.fonts)
+    root |= _declarations("", spec.variables)
+    light = _with_rgb(_declarations("--color-", spec.colors))
+    dark = _with_rgb(_declarations("--color-", spec.dark_colors))
+
+    # At least the specificity of light.css and dark.css, so linking after them is
+    # enough to win; the light palette also covers pages without a data-theme,
+    # but must not match <html data-theme="dark">
+    rules = []
+    if root:
+        rules.append(_rule(":root", root))
+    if light:
+        rules.append(_rule(':root:not([data-theme="dark"]),[data-theme="light"]', light))
+    if dark:
+        rules.append(_rule('[data-theme="dark"]', dark))
+    return "\n".join(rules)
+
+
+def compile_theme(spec: ThemeSpec, directory: str | os.PathLike[str] | None = None) -> CompiledTheme:
+    """Compile ``spec`` and write it under a content-hashed name, once per spec.
+
+    The result is kept in ``theme_cache``, so later calls with an equal spec
+    and directory return it without compiling. Files already written are reused
+    if their content matches, so several worker processes can compile the same
+    theme.
+
+    Args:
+        spec: The tenant's overrides
+        directory: Output directory (default: ``bundle_dir()``)
+
+    Returns:
+        The CompiledTheme; link it with ``ThemeCSS``
+
+    Raises:
+        ValueError: For unknown variables and values that are not a single CSS value
+    """
+    out = (Path(directory) if directory is not None else bundle_dir()).resolve()
+    key = (out, spec.key())
+    compiled = theme_cache.get(key)
+    if compiled is None:
+        css = theme_css(spec)
+        compiled = CompiledTheme(css=css, digest=hashlib.sha256(css.encode()).hexdigest()[:12])
+        path = out / compiled.filename
+        _write(path, css.encode())
+        precompress(path)
+        theme_cache.set(key, compiled)
+    return compiled
+
+
+def ThemeCSS(spec: ThemeSpec) -> Tag:
+    """Link to the compiled stylesheet of ``spec``; place it after ``EidosHeaders``.
+
+    Example:
+        Head(*EidosHeaders(), ThemeCSS(tenant.theme))
+    """
+    return Link(rel="stylesheet", href=compile_theme(spec).url)
@@ -1,6 +1,20 @@
 """Core utility functions for EidosUI."""
 
+import inspect
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Any, Generic, TypeVar
+
+from .assets import BUNDLE_URL_PREFIX, bundle_dir, get_manifest
+from .vendor import VENDOR_URL_PREFIX, get_vendored_assets, vendor_dir
+
+V = TypeVar("V")
+
+# Sets receiving every class emitted by stringify, while track_classes() is active
+_class_trackers: list[set[str]] = []
 
 
 def stringify(*classes: str | list[str] | None) -> str:
@@ -33,18 +47,51 @@ def stringify(*classes: str | list[str] | None) -> str:
         elif isinstance(class_, str) and class_.strip():
             result.append(class_.strip())
 
-    return " ".join(result)
+    joined = " ".join(result)
+    for tracker in _class_trackers:
+        tracker.update(joined.split())
+    return joined
 
 
-def get_eidos_static_files(markdown: bool = False) -> dict[str, str]:
+@contextmanager
+def track_classes() -> Iterator[set[str]]:
+    """
+    Collect every class token emitted through ``stringify`` while active.
+
+    Used to find the utility classes an app actually renders, for example to
+    generate a minimal stylesheet with ``eidos.tailwind``. Classes written
+    directly into templates do not pass through ``stringify``; collect those
+    from the rendered HTML with ``eidos.tailwind.classes_in_html``.
+
+    Example:
+        >>> with track_classes() as classes:
+        ...     stringify("flex", "gap-2")
+        >>> sorted(classes)
+        ["flex", "gap-2"]
+    """
+    classes: set[str] = set()
+    _class_trackers.append(classes)
+    try:
+        yield classes
+    finally:
+        _class_trackers.remove(classes)
+
+
+def get_eidos_static_files(markdown: bool = False, vendored: bool = False) -> dict[str, str]:
     """
     Get a dictionary mapping URL paths to static file directories.
 
     This provides a safe way to mount only specific static assets
-    without exposing Python source files.
+    without exposing Python source files. The content-hashed assets and CSS
+    bundle linked by ``EidosHeaders`` are built (if needed) and their
+    directory included; mount it with ``eidos.static.EidosStaticFiles`` to
+    serve them with immutable caching.
 
     Args:
         markdown: Whether to include markdown plugin CSS (default: False)
+        vendored: Whether to include the pinned third-party libraries used by
+            ``EidosHeaders(vendored=True)`` (default: False). Their integrity
+            hashes are computed here, so missing files fail at startup.
 
     Returns:
         Dict mapping mount paths to directory paths
@@ -68,8 +115,78 @@ def get_eidos_static_files(markdown: bool = False) -> dict[str, str]:
         "/eidos/js": str(base_path / "js"),
     }
 
+    # Build the assets now so their directory exists when it is mounted
+    get_manifest()
+    static_files[BUNDLE_URL_PREFIX] = str(bundle_dir())
+
+    if vendored:
+        get_vendored_assets()
+        static_files[VENDOR_URL_PREFIX] = str(vendor_dir())
+
     # Only include markdown CSS if requested
     if markdown:
         static_files["/eidos/plugins/markdown/css"] = str(base_path / "plugins" / "markdown" / "css")
 
     return static_files
+
+
+def qualified_name(obj: Any) -> str | None:
+    """``module.QualName`` of a module-level function or class, or None for anything else.
+
+    Unlike ``repr`` or ``id``, it is the same in every process, so it can be
+    part of cache keys that outlive one. Lambdas and closures share their
+    name (``make.<locals>.f``) with every other one the same code creates, and
+    bound methods and callable instances carry state the name does not
+    describe, so they have none.
+    """
+    if not (inspect.isfunction(obj) or inspect.isclass(obj)):
+        return None
+    if "<locals>" in obj.__qualname__ or obj.__name__ == "<lambda>":
+        return None
+    return f"{obj.__module__}.{obj.__qualname__}"
+
+
+class LRUCache(Generic[V]):
+    """
+    Small thread-safe least-recently-used cache with a fixed number of entries.
+
+    Args:
+        maxsize: Maximum number of entries kept; the least recently used entry
+            is evicted when a new one would exceed it
+
+    Example:
+        >>> cache = LRUCache[str](maxsize=2)
+        >>> cache.set("a", "1")
+        >>> cache.get("a")
+        "1"
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, V] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> V | None:
+        """Return the cached value for ``key`` (marking it as recently used), or None."""
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                return None
+            return self._data[key]
+
+    def set(self, key: Hashable, value: V) -> None:
+        """Store ``value`` under ``key``, evicting the oldest entry if full."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -0,0 +1,176 @@
+"""Pinned, locally served copies of the third-party libraries EidosHeaders loads.
+
+By default ``EidosHeaders`` loads Tailwind, Lucide and Alpine from public
+CDNs. With ``EidosHeaders(vendored=True)`` it loads the exact versions listed
+in ``VENDORED_LIBRARIES`` from the app itself instead, each with a
+subresource integrity hash, so pages work without internet access and do not
+wait on third-party DNS and TLS. Download the files once (for example while
+building a container image) with::
+
+    EIDOS_VENDOR_DIR=/app/eidos-vendor python -m eidos.vendor
+
+and mount them with ``get_eidos_static_files(vendored=True)``. Downloads are
+checked against the SHA-384 pinned for each library, so a compromised CDN
+cannot slip a different file in at build time.
+"""
+
+import argparse
+import base64
+import functools
+import hashlib
+import os
+import urllib.request
+from dataclasses import dataclass
+from pathlib import Path
+
+from .assets import _write, bundle_dir, precompress
+
+#: URL path the vendor directory is mounted at by ``get_eidos_static_files``
+VENDOR_URL_PREFIX = "/eidos/vendor"
+
+
+@dataclass(frozen=True)
+class VendoredLibrary:
+    """A third-party library pinned to one version, and where to download it.
+
+    ``integrity`` is the expected subresource integrity value of the file
+    (``sha384-...``), taken from the publisher rather than from a download.
+    A library without one cannot be vendored.
+    """
+
+    name: str
+    version: str
+    source: str
+    integrity: str | None = None
+
+    @property
+    def filename(self) -> str:
+        """Versioned file name in the vendor directory, e.g. ``alpinejs-3.14.8.js``."""
+        return f"{self.name}-{self.version}.js"
+
+
+#: Libraries EidosHeaders can serve locally, by the EidosHeaders flag that includes them.
+#: Set ``integrity`` from the publisher's SRI value (e.g. jsDelivr's) when bumping a version;
+#: until it is set, the library cannot be vendored.
+VENDORED_LIBRARIES = {
+    "tailwind": VendoredLibrary("tailwindcss", "3.4.16", "https://cdn.tailwindcss.com/3.4.16"),
+    "lucide": VendoredLibrary("lucide", "0.468.0", "https://unpkg.com/lucide@0.468.0/dist/umd/lucide.min.js"),
+    "alpine": VendoredLibrary("alpinejs", "3.14.8", "https://cdn.jsdelivr.net/npm/alpinejs@3.14.8/dist/cdn.min.js"),
+}
+
+
+@dataclass(frozen=True)
+class VendoredAsset:
+    """A downloaded library: the URL it is served at and its integrity hash."""
+
+    library: VendoredLibrary
+    url: str
+    integrity: str
+
+
+def vendor_dir() -> Path:
+    """Directory vendored libraries are downloaded to and served from.
+
+    Set ``EIDOS_VENDOR_DIR`` to use a fixed directory (for example one
+    prepared at build time); otherwise ``vendor`` under ``bundle_dir()`` is
+    used. Never the installed package, which may be read-only or shared.
+    """
+    return Path(os.environ.get("EIDOS_VENDOR_DIR") or bundle_dir() / "vendor")
+
+
+def sri_hash(data: bytes) -> str:
+    """Subresource integrity value for ``data``, e.g. ``sha384-...``."""
+    return "sha384-" + base64.b64encode(hashlib.sha384(data).digest()).decode()
+
+
+def verify(library: VendoredLibrary, data: bytes) -> str:
+    """Check ``data`` against the integrity pinned for ``library``.
+
+    Args:
+        library: The library the file should be
+        data: File content
+
+    Returns:
+        The pinned integrity value
+
+    Raises:
+        ValueError: If there is no pin, or the content does not match it
+    """
+    if library.integrity is None:
+        raise ValueError(
+            f"No integrity pinned for {library.filename}; set it in VENDORED_LIBRARIES from the publisher's SRI value"
+        )
+    integrity = sri_hash(data)
+    if integrity != library.integrity:
+        raise ValueError(f"{library.filename} does not match its pinned integrity: {integrity} != {library.integrity}")
+    return library.integrity
+
+
+def download(directory: str | os.PathLike[str] | None = None, force: bool = False) -> list[Path]:
+    """Download every library in ``VENDORED_LIBRARIES``, verifying each against its pin.
+
+    Nothing is written for a file that fails verification.
+
+    Args:
+        directory: Output directory (default: ``vendor_dir()``)
+        force: Download files that already exist again
+
+    Returns:
+        Paths of the vendored files
+
+    Raises:
+        ValueError: If a library has no pin, or a download does not match it
+    """
+    out = Path(directory) if directory is not None else vendor_dir()
+    paths = []
+    for library in VENDORED_LIBRARIES.values():
+        path = out / library.filename
+        if force or not path.exists():
+            with urllib.request.urlopen(library.source, timeout=30) as response:
+                data = response.read()
+            verify(library, data)
+            _write(path, data, replace=True)
+            precompress(path)
+        paths.append(path)
+    return paths
+
+
+@functools.cache
+def get_vendored_assets() -> dict[str, VendoredAsset]:
+    """Vendored libraries with their URLs and pinned integrity hashes, checked once per process.
+
+    The script tags carry the pins, so browsers also refuse a file changed after this check.
+
+    Raises:
+        FileNotFoundError: If a library has not been downloaded
+        ValueError: If a library has no pin, or its file does not match it
+    """
+    directory = vendor_dir()
+    missing = [lib.filename for lib in VENDORED_LIBRARIES.values() if not (directory / lib.filename).is_file()]
+    if missing:
+        raise FileNotFoundError(
+            f"Vendored libraries not found in {directory}: {', '.join(missing)}. "
+            "Download them with `python -m eidos.vendor`."
+        )
+    return {
+        key: VendoredAsset(
+            library=library,
+            url=f"{VENDOR_URL_PREFIX}/{library.filename}",
+            integrity=verify(library, (directory / library.filename).read_bytes()),
+        )
+        for key, library in VENDORED_LIBRARIES.items()
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Download the pinned libraries for EidosHeaders(vendored=True).")
+    parser.add_argument("--out", default=None, help="output directory (default: $EIDOS_VENDOR_DIR or a temp dir)")
+    parser.add_argument("--force", action="store_true", help="download files that already exist again")
+    args = parser.parse_args()
+
+    for path in download(args.out, force=args.force):
+        print(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Tests for the Icon component and icon sprites."""
+
+import pytest
+
+from eidos.components import Icon, IconSprite, NavBar, icon
+from eidos.components.icon import add_icon_directory, collect_icons, icon_body
+
+
+def test_icon_inlines_svg():
+    """Test that an icon is rendered on the server with its paths inline."""
+    html = Icon("x", class_="w-6 h-6").render()
+    assert html.startswith("<svg ")
+    assert '<path d="M18 6 6 18" /><path d="m6 6 12 12" /></svg>' in html
+    assert 'class="w-6 h-6"' in html and 'aria-hidden="true"' in html
+    assert 'role="img" aria-label="Close"' in Icon("x", label="Close").render()
+
+
+def test_unknown_icon():
+    """Test that unknown names (and paths) are rejected."""
+    with pytest.raises(ValueError, match="Unknown icon 'nope'"):
+        Icon("nope")
+    with pytest.raises(ValueError, match="Unknown icon"):
+        icon_body("../x")
+
+
+def test_sprite_collects_used_icons():
+    """Test that inside collect_icons() icons reference one symbol each in the sprite."""
+    with collect_icons():
+        icons = [Icon("menu"), Icon("x"), Icon("menu")]
+        sprite = IconSprite().render()
+    assert all('<use href="#eidos-icon-' in icon.render() for icon in icons)
+    assert sprite.count("<symbol") == 2
+    assert '<symbol viewBox="0 0 24 24" id="eidos-icon-menu">' in sprite
+    assert "<use" not in Icon("menu").render()
+
+
+def test_custom_icon_directory(tmp_path, monkeypatch):
+    """Test that added directories provide icons in addition to the built-in ones."""
+    monkeypatch.setattr(icon, "_icon_dirs", list(icon._icon_dirs))
+    (tmp_path / "dot.svg").write_text('<svg viewBox="0 0 24 24">\n  <circle cx="12" cy="12" r="1" />\n</svg>')
+    add_icon_directory(tmp_path)
+    assert icon_body("dot") == '<circle cx="12" cy="12" r="1" />'
+    assert icon_body("menu").startswith("<line")
+    monkeypatch.undo()
+    icon_body.cache_clear()
+
+
+def test_navbar_renders_icons_without_lucide():
+    """Test that NavBar's toggle uses inline SVG instead of data-lucide placeholders."""
+    html = NavBar().render()
+    assert "data-lucide" not in html
+    assert html.count("<svg") == 2
@@ -0,0 +1,61 @@
+"""Tests for the tabs components."""
+
+import asyncio
+
+import pytest
+from air import Div, P
+from starlette.requests import Request
+
+from eidos.components import AsyncHTMXTabs, HTMXTabs
+from eidos.components.tabs import panel_response
+
+
+def make_request(headers: dict[str, str]) -> Request:
+    raw = [(name.lower().encode(), value.encode()) for name, value in headers.items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw})
+
+
+def test_htmx_tabs_modes():
+    """Test that prefetch and panel caching are declared for eidos.js, and absent by default."""
+    tabs = (("General", "/general"), ("Security", "/security"))
+    assert "data-eidos-tabs" not in HTMXTabs(*tabs).render()
+    assert 'data-eidos-tabs="prefetch cache"' in HTMXTabs(*tabs, prefetch=True, cache_panels=True).render()
+    assert 'data-eidos-tabs="cache"' in HTMXTabs(*tabs, cache_panels=True).render()
+
+
+def test_panel_response_etag():
+    """Test that panels carry an ETag and unchanged ones are answered with 304."""
+    content = Div(P("General settings"))
+    response = panel_response(make_request({}), content)
+    assert response.status_code == 200
+    assert response.body == str(content).encode()
+    etag = response.headers["etag"]
+
+    assert panel_response(make_request({"If-None-Match": f'"other", W/{etag}'}), content).status_code == 304
+    assert panel_response(make_request({"If-None-Match": etag}), Div(P("Changed"))).status_code == 200
+
+
+def test_resolver_renders_selected_panel_inline():
+    """Test that the resolver fills the selected panel, leaving no fetch on load."""
+    tabs = (("General", "/general"), ("Security", "/security"))
+    html = HTMXTabs(*tabs, selected=1, resolver=lambda url: P(f"Panel {url}")).render()
+    assert (
+        '<div role="tabpanel" class="eidos-tab-panel eidos-tab-panel-active" id="tab-content"><p>Panel /security</p>'
+        in html
+    )
+    assert "hx-trigger" not in html and "None" not in html
+
+    fallback = HTMXTabs(*tabs, resolver=lambda url: None).render()
+    assert 'hx-get="/general" hx-trigger="load delay:100ms"' in fallback
+
+
+def test_async_resolver():
+    """Test that AsyncHTMXTabs awaits the resolver, and HTMXTabs refuses async ones."""
+
+    async def resolver(url: str) -> Div:
+        return Div(P(f"Panel {url}"))
+
+    html = asyncio.run(AsyncHTMXTabs(("General", "/general"), resolver=resolver)).render()
+    assert "<p>Panel /general</p>" in html and "hx-trigger" not in html
+    with pytest.raises(TypeError, match="AsyncHTMXTabs"):
+        HTMXTabs(("General", "/general"), resolver=resolver)
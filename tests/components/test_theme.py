@@ -0,0 +1,49 @@
+"""Tests for server-side theme resolution."""
+
+from starlette.requests import Request
+
+from eidos import EidosHeaders, ThemeSwitch, theme_from_request
+from eidos.assets import CSS_FILES, build_css_bundle, theme_css_files
+from eidos.purge import critical_css
+
+
+def make_request(headers: dict[str, str]) -> Request:
+    raw = [(name.lower().encode(), value.encode()) for name, value in headers.items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw})
+
+
+def test_theme_from_request():
+    """Test that the cookie wins, then the color scheme client hint, then light."""
+    assert theme_from_request(make_request({})) == "light"
+    assert theme_from_request(make_request({"Cookie": "eidos-theme=dark"})) == "dark"
+    assert theme_from_request(make_request({"Cookie": "eidos-theme=blue"})) == "light"
+    assert theme_from_request(make_request({"Sec-CH-Prefers-Color-Scheme": '"dark"'})) == "dark"
+    assert (
+        theme_from_request(make_request({"Cookie": "eidos-theme=light", "Sec-CH-Prefers-Color-Scheme": '"dark"'}))
+        == "light"
+    )
+
+
+def test_theme_css_files():
+    """Test that a theme's stylesheets leave out the other theme."""
+    assert theme_css_files() == CSS_FILES
+    assert theme_css_files("dark") == ("css/styles.css", "css/themes/eidos-variables.css", "css/themes/dark.css")
+    assert '[data-theme="light"]' not in critical_css(theme="dark")
+
+
+def test_headers_with_server_theme():
+    """Test that a server-rendered theme drops the init script and links only its bundle."""
+    tags = [str(tag) for tag in EidosHeaders(theme="dark")]
+    dark, light = (build_css_bundle(theme_css_files(theme)).url for theme in ("dark", "light"))
+    assert f'<link data-eidos-light="{light}" data-eidos-dark="{dark}" href="{dark}" rel="stylesheet" />' in tags
+    assert build_css_bundle().url not in "".join(tags)
+    assert not any("localStorage" in tag for tag in tags)
+    assert any('data-cookie="eidos-theme"' in tag for tag in tags)
+    assert any("localStorage" in tag for tag in map(str, EidosHeaders()))
+    assert not any("data-cookie" in tag for tag in map(str, EidosHeaders()))
+
+
+def test_theme_switch_initial_icon():
+    """Test that a known theme shows the matching icon before Alpine starts."""
+    assert ">🌙</button>" in ThemeSwitch().render()
+    assert ">☀️</button>" in ThemeSwitch(theme="dark").render()
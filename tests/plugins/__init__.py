@@ -0,0 +1 @@
+"""Plugin tests for EidosUI."""
@@ -0,0 +1,44 @@
+"""Tests for the GitHub-style alerts extension."""
+
+from eidos.plugins.markdown import MarkdownRenderer
+
+
+def test_alert_renders_header_and_markdown_body():
+    """Test that alert bodies are parsed as markdown under a typed header."""
+    html = MarkdownRenderer().render("> [!TIP]\n> Use **bold**")
+
+    assert 'class="eidos-alert eidos-alert-success"' in html
+    assert '<span class="eidos-alert-title">Tip</span>' in html
+    assert "<strong>bold</strong>" in html
+
+
+def test_alert_continuation_blocks_are_markdown():
+    """Test that continuation blocks are parsed as markdown, not plain text."""
+    html = MarkdownRenderer().render("> [!NOTE]\n> First\n\n> - one\n> - two")
+
+    assert html.count("eidos-alert-content") == 1
+    assert "<li>one</li>" in html
+    assert "> -" not in html
+
+
+def test_plain_blockquote_is_not_an_alert():
+    """Test that ordinary blockquotes are left to the blockquote processor."""
+    html = MarkdownRenderer().render("> [!UNKNOWN]\n> text\n\n> quote")
+
+    assert "eidos-alert" not in html
+    assert "<blockquote>" in html
+
+
+def test_alert_headers_are_independent_copies():
+    """Test that each alert gets its own copy of the prebuilt header."""
+    html = MarkdownRenderer().render("> [!NOTE]\n> a\n\nText\n\n> [!NOTE]\n> b")
+
+    assert html.count('<div class="eidos-alert-header">') == 2
+
+
+def test_consecutive_alerts_stay_separate():
+    """Test that an alert directly after another starts a new alert."""
+    html = MarkdownRenderer().render("> [!NOTE]\n> a\n\n> [!WARNING]\n> b")
+
+    assert html.count("eidos-alert-content") == 2
+    assert html.index("<p>a</p>") < html.index("eidos-alert-warning") < html.index("<p>b</p>")
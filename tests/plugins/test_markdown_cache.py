@@ -0,0 +1,69 @@
+"""Tests for the markdown file cache."""
+
+import os
+
+from eidos.plugins.markdown import MarkdownFileCache, MarkdownRenderer
+
+
+class CountingRenderer(MarkdownRenderer):
+    """Renderer that counts how often it actually renders."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def render(self, markdown_text, **kwargs):
+        self.calls += 1
+        return super().render(markdown_text, **kwargs)
+
+
+def test_render_file_hits_cache(tmp_path):
+    """Test that an unchanged file is rendered only once."""
+    page = tmp_path / "page.md"
+    page.write_text("# Hello")
+    renderer = CountingRenderer()
+    cache = MarkdownFileCache(tmp_path / "cache", renderer=renderer)
+
+    assert 'id="hello">Hello</h1>' in cache.render_file(page)
+    assert 'id="hello">Hello</h1>' in cache.render_file(page)
+    assert renderer.calls == 1
+
+
+def test_cache_survives_restart(tmp_path):
+    """Test that a new cache instance reuses entries written by another one."""
+    page = tmp_path / "page.md"
+    page.write_text("# Hello")
+    MarkdownFileCache(tmp_path / "cache").warm(tmp_path)
+
+    renderer = CountingRenderer()
+    cache = MarkdownFileCache(tmp_path / "cache", renderer=renderer)
+    cache.render_file(page)
+
+    assert renderer.calls == 0
+
+
+def test_changed_file_is_rerendered(tmp_path):
+    """Test that modifying a file invalidates its entry."""
+    page = tmp_path / "page.md"
+    page.write_text("# Hello")
+    cache = MarkdownFileCache(tmp_path / "cache")
+    cache.render_file(page)
+
+    page.write_text("# Goodbye")
+    os.utime(page, ns=(0, page.stat().st_mtime_ns + 1_000_000))
+
+    assert "Goodbye" in cache.render_file(page)
+
+
+def test_touched_file_reuses_content_entry(tmp_path):
+    """Test that a new mtime with identical content does not re-render."""
+    page = tmp_path / "page.md"
+    page.write_text("# Hello")
+    renderer = CountingRenderer()
+    cache = MarkdownFileCache(tmp_path / "cache", renderer=renderer)
+    cache.render_file(page)
+
+    os.utime(page, ns=(0, page.stat().st_mtime_ns + 1_000_000))
+    cache.render_file(page)
+
+    assert renderer.calls == 1
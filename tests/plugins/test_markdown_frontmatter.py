@@ -0,0 +1,115 @@
+"""Tests for front matter parsing and the content index."""
+
+import datetime
+import os
+
+from eidos.plugins.markdown import ContentIndex, MarkdownFileCache, parse_front_matter, read_front_matter
+
+POST = """---
+title: "Faster Builds"
+date: 2025-03-14
+tags: [python, performance]
+draft: false
+authors:
+  - Ada
+  - Grace
+---
+# Faster Builds
+"""
+
+
+def test_parse_front_matter():
+    """Test that values are typed and the body is returned without the header."""
+    meta, body = parse_front_matter(POST)
+    assert meta == {
+        "title": "Faster Builds",
+        "date": datetime.date(2025, 3, 14),
+        "tags": ["python", "performance"],
+        "draft": False,
+        "authors": ["Ada", "Grace"],
+    }
+    assert body == "# Faster Builds\n"
+
+
+def test_yes_and_no_stay_strings(tmp_path):
+    """Test that only true/false are booleans, so titles and tags like "no" survive."""
+    meta, _ = parse_front_matter("---\ntitle: No\ntags: [yes, no]\ndraft: yes\n---\n")
+    assert meta == {"title": "No", "tags": ["yes", "no"], "draft": "yes"}
+
+    page = tmp_path / "no.md"
+    page.write_text("---\ntitle: No\ntags: [no]\ndraft: yes\n---\n")
+    index = ContentIndex(tmp_path)
+    assert index.tags() == {"no": 1}
+    assert [page.title for page in index.pages(include_drafts=True)] == ["No"]
+    assert index.pages() == []
+
+
+def test_without_front_matter():
+    """Test that documents without a header (or an unclosed one) are unchanged."""
+    assert parse_front_matter("# Title") == ({}, "# Title")
+    assert parse_front_matter("---\ntitle: x\n# never closed") == ({}, "---\ntitle: x\n# never closed")
+
+
+def test_read_front_matter(tmp_path):
+    """Test reading just the header from a file."""
+    page = tmp_path / "post.md"
+    page.write_text(POST)
+    assert read_front_matter(page)["tags"] == ["python", "performance"]
+
+
+def test_file_cache_strips_front_matter(tmp_path):
+    """Test that rendered files don't include their front matter."""
+    page = tmp_path / "post.md"
+    page.write_text(POST)
+    html = MarkdownFileCache(tmp_path / "cache").render_file(page)
+    assert 'id="faster-builds">Faster Builds</h1>' in html
+    assert "<hr" not in html and "performance" not in html
+
+
+def write(path, title, date, tags, draft=False):
+    path.write_text(f"---\ntitle: {title}\ndate: {date}\ntags: [{', '.join(tags)}]\ndraft: {draft}\n---\nBody\n")
+
+
+def test_content_index_queries(tmp_path):
+    """Test tag and date queries, ordering and draft handling."""
+    write(tmp_path / "a.md", "A", "2025-01-10", ["python"])
+    write(tmp_path / "b.md", "B", "2025-02-10", ["python", "css"])
+    write(tmp_path / "c.md", "C", "2025-03-10", ["css"], draft=True)
+    index = ContentIndex(tmp_path)
+
+    assert [page.title for page in index.pages()] == ["B", "A"]
+    assert [page.title for page in index.pages(include_drafts=True)] == ["C", "B", "A"]
+    assert [page.title for page in index.by_tag("python")] == ["B", "A"]
+    assert [page.title for page in index.by_tag("css", include_drafts=True)] == ["C", "B"]
+    assert [page.title for page in index.by_date(start=datetime.date(2025, 2, 1))] == ["B"]
+    assert index.tags() == {"css": 2, "python": 2}
+
+
+def test_content_index_refresh_is_incremental(tmp_path):
+    """Test that refresh only re-reads changed files and drops deleted ones."""
+    write(tmp_path / "a.md", "A", "2025-01-10", ["python"])
+    write(tmp_path / "b.md", "B", "2025-02-10", ["css"])
+    index = ContentIndex(tmp_path)
+    assert index.refresh() == set()
+
+    write(tmp_path / "a.md", "A2", "2025-01-10", ["rust"])
+    os.utime(tmp_path / "a.md", ns=(1, 1))
+    (tmp_path / "b.md").unlink()
+    assert index.refresh() == {tmp_path / "a.md", tmp_path / "b.md"}
+
+    assert [page.title for page in index.pages()] == ["A2"]
+    assert index.by_tag("python") == []
+    assert index.tags() == {"rust": 1}
+
+
+def test_content_index_refresh_swaps_in_a_complete_index(tmp_path):
+    """Test that readers holding the old index are unaffected by a refresh."""
+    write(tmp_path / "a.md", "A", "2025-01-10", ["python"])
+    index = ContentIndex(tmp_path)
+    pages, tags = index._index
+
+    write(tmp_path / "b.md", "B", "2025-02-10", ["python"])
+    index.refresh()
+
+    assert list(pages) == [tmp_path / "a.md"] and tags == {"python": {tmp_path / "a.md"}}
+    assert [page.title for page in index.by_tag("python")] == ["B", "A"]
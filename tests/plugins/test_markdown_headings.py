@@ -0,0 +1,64 @@
+"""Tests for structured render results and heading anchors."""
+
+from eidos.plugins.markdown import HeadingsExtension, MarkdownFileCache, MarkdownRenderer
+from eidos.plugins.markdown.extensions.headings import HeadingsTreeprocessor
+
+DOCUMENT = "# Intro\n\nOne two three.\n\n## Setup\n\n```\nnot counted\n```\n\n## Setup\n\n# End"
+
+
+def test_structured_render_collects_heading_tree():
+    """Test that headings are nested by level with unique slug ids."""
+    result = MarkdownRenderer().render(DOCUMENT, structured=True)
+
+    assert [h.text for h in result.headings] == ["Intro", "End"]
+    assert [h.id for h in result.headings[0].children] == ["setup", "setup_1"]
+    assert result.html == MarkdownRenderer([HeadingsExtension(anchors=True)]).render(DOCUMENT)
+
+
+def test_structured_render_writes_heading_ids():
+    """Test that every id in the heading tree is on a heading in the HTML."""
+    renderer = MarkdownRenderer()
+    result = renderer.render(DOCUMENT, structured=True)
+
+    for heading_id in ("intro", "setup", "setup_1", "end"):
+        assert f'id="{heading_id}"' in result.html
+    assert "<h1>Intro</h1>" in renderer.render(DOCUMENT)
+
+
+def test_plain_render_skips_the_headings_walk(monkeypatch):
+    """Test that plain renders pay nothing for the structured metadata."""
+
+    def fail(*args):
+        raise AssertionError("walked the tree")
+
+    monkeypatch.setattr(HeadingsTreeprocessor, "_walk", fail)
+    assert "<h1>Intro</h1>" in MarkdownRenderer().render(DOCUMENT)
+
+
+def test_word_count_skips_code_blocks():
+    """Test that word count and reading time ignore preformatted code."""
+    result = MarkdownRenderer().render(DOCUMENT, structured=True)
+
+    assert result.word_count == 7
+    assert result.reading_time == 1
+
+
+def test_anchors_add_ids_to_headings():
+    """Test that anchors put slug ids on the heading elements."""
+    html = MarkdownRenderer([HeadingsExtension(anchors=True)]).render("## Getting Started")
+
+    assert 'id="getting-started"' in html
+    assert "<h2>" not in html
+    assert "<h2>" in MarkdownRenderer().render("## Getting Started")
+
+
+def test_file_cache_returns_structured_result(tmp_path):
+    """Test that the file cache stores the structured result with the HTML."""
+    page = tmp_path / "page.md"
+    page.write_text(DOCUMENT)
+    MarkdownFileCache(tmp_path / "cache").render_file(page)
+
+    result = MarkdownFileCache(tmp_path / "cache").render_file(page, structured=True)
+
+    assert result.headings[0].children[1].id == "setup_1"
+    assert result.word_count == 7
@@ -0,0 +1,79 @@
+"""Tests for the syntax highlighting extension."""
+
+import subprocess
+import sys
+
+import pytest
+
+from eidos.plugins.markdown import HighlightExtension, MarkdownRenderer, get_renderer
+from eidos.plugins.markdown.extensions.highlight import highlight_cache
+
+
+def fake_highlighter(code, lang):
+    """Highlighter that only knows one language."""
+    fake_highlighter.calls += 1
+    if lang != "demo":
+        return None
+    return f'<span class="eidos-hl-kw">{code.strip()}</span>'
+
+
+fake_highlighter.calls = 0
+
+
+def test_custom_highlighter_is_used_and_cached():
+    """Test that a pluggable highlighter runs once per snippet."""
+    highlight_cache.clear()
+    fake_highlighter.calls = 0
+    renderer = MarkdownRenderer([HighlightExtension(highlighter=fake_highlighter)])
+
+    html = renderer.render("```demo\nhello\n```")
+    renderer.render("```demo\nhello\n```")
+
+    assert '<code class="language-demo"><span class="eidos-hl-kw">hello</span></code>' in html
+    assert fake_highlighter.calls == 1
+
+
+def test_unknown_language_falls_back_to_fenced_code():
+    """Test that blocks the highlighter declines are rendered as plain code."""
+    renderer = MarkdownRenderer([HighlightExtension(highlighter=fake_highlighter)])
+
+    html = renderer.render("```other\na < b\n```")
+
+    assert '<pre><code class="language-other">a &lt; b' in html
+
+
+def test_pygments_highlighter_emits_theme_classes():
+    """Test that the default highlighter maps tokens to eidos-hl classes."""
+    pytest.importorskip("pygments")
+    html = MarkdownRenderer([HighlightExtension()]).render("```python\ndef f(): pass\n```")
+
+    assert '<span class="eidos-hl-kw">def</span>' in html
+    assert '<span class="eidos-hl-fn">f</span>' in html
+
+
+def test_config_key_is_stable_across_processes():
+    """Test that the highlighter is keyed by name, not by its address."""
+    key = MarkdownRenderer([HighlightExtension()]).config_key
+    script = (
+        "from eidos.plugins.markdown import HighlightExtension, MarkdownRenderer;"
+        "print(MarkdownRenderer([HighlightExtension()]).config_key)"
+    )
+    output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    assert output.stdout.strip() == key
+
+
+def test_closure_highlighters_are_kept_apart():
+    """Test that closures from one factory neither share a renderer nor each other's cached output."""
+
+    def make(tag):
+        def highlighter(code, lang):
+            return f"<{tag}>{code.strip()}</{tag}>"
+
+        return highlighter
+
+    first = get_renderer([HighlightExtension(highlighter=make("b"))])
+    second = get_renderer([HighlightExtension(highlighter=make("i"))])
+
+    assert first is not second
+    assert "<b>x</b>" in first.render("```demo\nx\n```")
+    assert "<i>x</i>" in second.render("```demo\nx\n```")
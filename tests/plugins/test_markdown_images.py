@@ -0,0 +1,52 @@
+"""Tests for the lazy-loading image extension."""
+
+import struct
+
+from eidos.plugins.markdown import ImageExtension, MarkdownRenderer, image_size
+
+
+def write_png(path, width, height):
+    """Write just enough of a PNG for its header to be read."""
+    path.write_bytes(b"\x89PNG\r\n\x1a\n" + b"\x00\x00\x00\rIHDR" + struct.pack(">II", width, height))
+
+
+def write_jpeg(path, width, height):
+    """Write a JPEG header with an APP0 segment followed by SOF0."""
+    app0 = b"\xff\xe0" + struct.pack(">H", 16) + b"JFIF\x00" + b"\x00" * 9
+    sof0 = b"\xff\xc0" + struct.pack(">HBHH", 17, 8, height, width)
+    path.write_bytes(b"\xff\xd8" + app0 + sof0)
+
+
+def test_image_size_reads_headers(tmp_path):
+    """Test dimension detection for PNG, GIF and JPEG."""
+    write_png(tmp_path / "a.png", 120, 40)
+    (tmp_path / "b.gif").write_bytes(b"GIF89a" + struct.pack("<HH", 16, 9))
+    write_jpeg(tmp_path / "c.jpg", 640, 480)
+
+    assert image_size(tmp_path / "a.png") == (120, 40)
+    assert image_size(tmp_path / "b.gif") == (16, 9)
+    assert image_size(tmp_path / "c.jpg") == (640, 480)
+    assert image_size(tmp_path / "missing.png") is None
+
+
+def test_local_images_get_dimensions(tmp_path):
+    """Test that local images get lazy loading and width/height."""
+    write_png(tmp_path / "logo.png", 120, 40)
+    renderer = MarkdownRenderer([ImageExtension(root=str(tmp_path), url_prefix="/static/")])
+
+    html = renderer.render("![Logo](/static/logo.png)")
+
+    assert 'loading="lazy"' in html
+    assert 'decoding="async"' in html
+    assert 'width="120"' in html
+    assert 'height="40"' in html
+
+
+def test_remote_and_outside_images_only_get_lazy_loading(tmp_path):
+    """Test that remote URLs and paths escaping root are not measured."""
+    renderer = MarkdownRenderer([ImageExtension(root=str(tmp_path))])
+
+    html = renderer.render("![a](https://example.com/a.png) ![b](../secret.png)")
+
+    assert html.count('loading="lazy"') == 2
+    assert "width=" not in html
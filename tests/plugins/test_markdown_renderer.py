@@ -0,0 +1,62 @@
+"""Tests for MarkdownRenderer configuration and sharing."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from eidos.plugins.markdown import MarkdownRenderer, get_renderer
+
+
+def test_constructor_does_not_mutate_extensions():
+    """Test that the caller's extension list is left untouched."""
+    extensions = ["toc"]
+    renderer = MarkdownRenderer(extensions)
+
+    assert extensions == ["toc"]
+    assert renderer.extensions[0] == "toc"
+    assert "fenced_code" in renderer.extensions
+
+
+def test_defaults_can_be_left_out():
+    """Test that defaults=False uses exactly the given extensions."""
+    renderer = MarkdownRenderer(["tables"], defaults=False)
+
+    assert renderer.extensions == ["tables"]
+    assert renderer.render("a\nb") == '<div class="eidos-md"><p>a\nb</p></div>'
+
+
+def test_get_renderer_shares_by_configuration():
+    """Test that identical configurations share a renderer."""
+    assert get_renderer(["toc"]) is get_renderer(["toc"])
+    assert get_renderer() is get_renderer([])
+    assert get_renderer(["toc"]) is not get_renderer(["footnotes"])
+
+
+def test_shared_renderer_is_frozen():
+    """Test that shared renderers reject new extensions."""
+    with pytest.raises(RuntimeError):
+        get_renderer().add_extension("toc")
+
+
+def test_add_extensions_rebuilds_lazily():
+    """Test that added extensions take effect on the next render."""
+    renderer = MarkdownRenderer()
+    key = renderer.config_key
+    renderer.add_extensions("abbr", "def_list")
+
+    assert renderer.config_key != key
+    assert "<dl>" in renderer.render("Term\n: Definition")
+
+
+def test_plugin_import_is_lazy():
+    """Test that importing the plugin does not import Python-Markdown."""
+    code = (
+        "import sys, eidos.plugins.markdown as m; "
+        "assert 'markdown' not in sys.modules; "
+        "m.Markdown('# Hi'); "
+        "assert 'markdown' in sys.modules"
+    )
+    root = Path(__file__).parents[2]
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=root)
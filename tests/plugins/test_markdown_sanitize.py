@@ -0,0 +1,61 @@
+"""Tests for safe (sanitized) markdown rendering."""
+
+from eidos.plugins.markdown import DEFAULT_POLICY, MarkdownRenderer, SanitizePolicy
+
+
+def test_raw_html_is_escaped():
+    """Test that raw HTML in the source is not passed through."""
+    html = MarkdownRenderer(safe=True).render('<script>alert(1)</script>\n\nHi <b onclick="x">there</b>')
+
+    assert "<script>" not in html
+    assert "<b " not in html
+    assert "&lt;script&gt;" in html
+
+
+def test_unsafe_urls_are_removed():
+    """Test that javascript: links are stripped, including obfuscated ones."""
+    html = MarkdownRenderer(safe=True).render("[a](javascript:alert(1)) [b](JaVa\tscript:x) [c](/ok) [d](https://x.io)")
+
+    assert "javascript" not in html.lower()
+    assert 'href="/ok"' in html
+    assert 'href="https://x.io"' in html
+
+
+def test_entity_encoded_schemes_are_removed():
+    """Test that schemes hidden behind decimal, hex and named character references are stripped."""
+    renderer = MarkdownRenderer(safe=True)
+    for url in (
+        "&#106;avascript:alert(1)",
+        "&#x6A;avascript:alert(1)",
+        "javascript&colon;alert(1)",
+        "jav&#x09;ascript:x",
+    ):
+        html = renderer.render(f"[a]({url})")
+        assert "href" not in html, url
+        rendered = "".join(str(tag) for tag in renderer.render_tags(f"[a]({url})"))
+        assert "href" not in rendered, url
+    assert 'href="/a?b=1&amp;c=2"' in renderer.render("[a](/a?b=1&c=2)")
+
+
+def test_markdown_features_survive():
+    """Test that alerts, tables and code still render in safe mode."""
+    source = "> [!NOTE]\n> Hi\n\n| a |\n|:--|\n| 1 |\n\n```\n<b>\n```"
+    html = MarkdownRenderer(safe=True).render(source)
+
+    assert "eidos-alert-title" in html
+    assert 'style="text-align: left;"' in html
+    assert "<code>&lt;b&gt;" in html
+
+
+def test_disallowed_tags_are_unwrapped():
+    """Test that elements outside the policy keep their text."""
+    policy = SanitizePolicy(tags=DEFAULT_POLICY.tags - {"strong"}, attributes=DEFAULT_POLICY.attributes)
+    html = MarkdownRenderer(safe=True, policy=policy).render("a **bold** move")
+
+    assert "<p>a bold move</p>" in html
+
+
+def test_safe_mode_is_part_of_config_key():
+    """Test that sanitized output is cached separately from raw output."""
+    assert MarkdownRenderer(safe=True).config_key != MarkdownRenderer().config_key
+    assert MarkdownRenderer(safe=True).config_key == MarkdownRenderer(safe=True).config_key
@@ -0,0 +1,43 @@
+"""Tests for rendering markdown to air tags."""
+
+import air
+
+from eidos.plugins.markdown import Markdown, MarkdownRenderer
+
+
+def test_blocks_are_air_tags():
+    """Test that each top-level block becomes its own air tag."""
+    blocks = MarkdownRenderer().render_tags("# Title\n\nSome *text*\n\n- one\n- two")
+    assert [type(block) for block in blocks] == [air.H1, air.P, air.Ul]
+    assert str(blocks[1]) == "<p>Some <em>text</em></p>"
+
+
+def test_text_and_attributes_are_escaped():
+    """Test that text is escaped once and attribute values are escaped by us."""
+    blocks = MarkdownRenderer().render_tags("`a & b <c>` 5 > 3 &copy;\n\n[x](/q?a=1&b=2 'say \"hi\"')")
+    assert str(blocks[0]) == "<p><code>a &amp; b &lt;c&gt;</code> 5 &gt; 3 &copy;</p>"
+    assert 'title="say &quot;hi&quot;" href="/q?a=1&amp;b=2"' in str(blocks[1])
+
+
+def test_stashed_html_becomes_raw():
+    """Test that raw HTML and fenced code come through unchanged."""
+    blocks = MarkdownRenderer().render_tags('<div class="x">raw</div>\n\n```\n<b>\n```')
+    assert isinstance(blocks[0], air.Raw)
+    assert str(blocks[0]) == '<div class="x">raw</div>'
+    assert str(blocks[1]) == "<pre><code>&lt;b&gt;\n</code></pre>"
+
+
+def test_safe_mode_and_extensions():
+    """Test that treeprocessors (sanitizing) and extension postprocessors still apply."""
+    safe = MarkdownRenderer(safe=True).render_tags("<script>alert(1)</script>")
+    assert str(safe[0]) == "<p>&lt;script&gt;alert(1)&lt;/script&gt;</p>"
+
+    footnotes = "".join(str(block) for block in MarkdownRenderer(["footnotes"]).render_tags("A[^1]\n\n[^1]: B"))
+    assert "qq" not in footnotes and "↩" in footnotes
+
+
+def test_markdown_component_as_tags():
+    """Test that the component keeps the same wrappers in tag mode."""
+    result = Markdown("# Hi", as_tags=True, class_="prose")
+    assert str(result) == '<div class="prose"><div class="eidos-md"><h1>Hi</h1></div></div>'
+    assert MarkdownRenderer().render_tags("  ") == []
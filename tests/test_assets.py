@@ -0,0 +1,154 @@
+"""Tests for the asset manifest and CSS bundle."""
+
+import gzip
+import json
+import os
+import stat
+import tempfile
+
+import pytest
+
+from eidos import EidosHeaders
+from eidos.assets import (
+    ASSET_FILES,
+    CSS_FILES,
+    PACKAGE_DIR,
+    _private_dir,
+    asset_url,
+    build_css_bundle,
+    build_manifest,
+    bundle_dir,
+    minify_css,
+    precompress,
+)
+from eidos.components.headers import get_css_urls
+from eidos.plugins.markdown import MarkdownCSS
+from eidos.utils import get_eidos_static_files
+
+
+def test_minify_css():
+    """Test that insignificant whitespace and comments go, strings and combinators stay."""
+    css = """
+    /* don't keep this */
+    .a,
+    .b > .c {
+        content: '  x ; } ';
+        margin: 0 auto;
+    }
+    nav :hover { color: red; }
+    @media (min-width: 768px) { .d { width: calc(100% - 2rem); } }
+    """
+    assert minify_css(css) == (
+        ".a,.b>.c{content:'  x ; } ';margin:0 auto}nav :hover{color:red}"
+        "@media (min-width: 768px){.d{width:calc(100% - 2rem)}}"
+    )
+
+
+def test_bundle_contains_every_stylesheet_in_order():
+    """Test that the bundle is the minified stylesheets, hashed by content."""
+    bundle = build_css_bundle()
+    parts = [minify_css((PACKAGE_DIR / name).read_text()) for name in CSS_FILES]
+    assert bundle.content == "\n".join(parts)
+    assert bundle.url == f"/eidos/bundle/eidos.{bundle.digest}.css"
+    assert len(bundle.content) < sum(len((PACKAGE_DIR / name).read_text()) for name in CSS_FILES)
+
+
+def test_build_manifest(tmp_path):
+    """Test that every asset is copied under a content-hashed name and listed in the manifest."""
+    manifest = build_manifest(tmp_path)
+    bundle = build_css_bundle()
+    assert (tmp_path / bundle.filename).read_text() == bundle.content
+    assert manifest.url("eidos.css") == bundle.url
+
+    for name in ASSET_FILES:
+        url = manifest.url(name)
+        filename = url.removeprefix("/eidos/bundle/")
+        assert (tmp_path / filename).read_bytes() == (PACKAGE_DIR / name).read_bytes()
+        assert manifest.is_fingerprinted(filename)
+    assert url.startswith("/eidos/bundle/plugins/markdown/css/markdown.") and url.endswith(".css")
+
+    assert json.loads((tmp_path / "manifest.json").read_text()) == manifest.to_dict()
+    assert not manifest.is_fingerprinted("manifest.json")
+    with pytest.raises(KeyError, match="Unknown eidos asset"):
+        manifest.url("missing.css")
+
+
+def test_precompress(tmp_path):
+    """Test that text assets get a gzip variant (and zstd when available), other files none."""
+    css = tmp_path / "a.css"
+    css.write_text(".a{color:red}" * 100)
+    variants = precompress(css)
+    assert tmp_path / "a.css.gz" in variants
+    assert gzip.decompress((tmp_path / "a.css.gz").read_bytes()) == css.read_bytes()
+    assert {path.suffix for path in variants} <= {".gz", ".zst"}
+
+    image = tmp_path / "a.png"
+    image.write_bytes(b"\x89PNG")
+    assert precompress(image) == []
+
+    build_manifest(tmp_path / "build")
+    assert (tmp_path / "build" / f"{build_css_bundle().filename}.gz").exists()
+
+
+def test_planted_files_are_rewritten(tmp_path):
+    """Test that existing files and variants are reused only if they hold the expected content."""
+    manifest = build_manifest(tmp_path)
+    filename = manifest.url("js/theme.js").removeprefix("/eidos/bundle/")
+    (tmp_path / filename).write_text("alert(1)")
+    (tmp_path / f"{filename}.gz").write_bytes(gzip.compress(b"alert(1)"))
+
+    build_manifest(tmp_path)
+    original = (PACKAGE_DIR / "js/theme.js").read_bytes()
+    assert (tmp_path / filename).read_bytes() == original
+    assert gzip.decompress((tmp_path / f"{filename}.gz").read_bytes()) == original
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions")
+def test_default_bundle_dir_is_private(tmp_path, monkeypatch):
+    """Test that the default directory is created for this user only, and a shared one is refused."""
+    monkeypatch.delenv("EIDOS_BUNDLE_DIR", raising=False)
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    directory = bundle_dir()
+    assert directory.parent == tmp_path
+    assert stat.S_IMODE(directory.stat().st_mode) == 0o700
+
+    directory.chmod(0o777)
+    _private_dir.cache_clear()
+    with pytest.raises(PermissionError, match="EIDOS_BUNDLE_DIR"):
+        bundle_dir()
+    _private_dir.cache_clear()
+
+
+def test_urls_come_from_the_manifest():
+    """Test that headers, get_css_urls and MarkdownCSS use content-hashed URLs."""
+    assert get_css_urls() == [asset_url(name) for name in CSS_FILES]
+    headers = "".join(str(tag) for tag in EidosHeaders())
+    assert asset_url("js/theme.js") in headers and asset_url("js/eidos.js") in headers
+    assert asset_url("plugins/markdown/css/markdown.css") in str(MarkdownCSS())
+
+
+def test_headers_link_only_the_bundle():
+    """Test that EidosHeaders links the bundle, and the individual files when asked."""
+    stylesheets = [str(tag) for tag in EidosHeaders() if 'rel="stylesheet"' in str(tag)]
+    assert stylesheets == [f'<link href="{build_css_bundle().url}" rel="stylesheet" />']
+
+    unbundled = [str(tag) for tag in EidosHeaders(bundle_css=False) if 'rel="stylesheet"' in str(tag)]
+    assert len(unbundled) == len(CSS_FILES)
+
+
+def test_static_files_serve_the_bundle():
+    """Test that the bundle directory is mounted and holds the bundle."""
+    directory = get_eidos_static_files()["/eidos/bundle"]
+    assert (PACKAGE_DIR / directory / build_css_bundle().filename).exists()
+
+
+def test_headers_are_rendered_once_per_flag_combination():
+    """Test that repeated calls reuse the serialized tags, and a nonce only touches scripts."""
+    assert EidosHeaders()[0] is EidosHeaders()[0]
+    assert EidosHeaders(include_alpine=False) != EidosHeaders()
+
+    tags = [str(tag) for tag in EidosHeaders(nonce='n"1')]
+    assert tags == [
+        tag.replace("<script", '<script nonce="n&quot;1"', 1) for tag in (str(tag) for tag in EidosHeaders())
+    ]
+    assert all("nonce" not in str(tag) for tag in EidosHeaders())
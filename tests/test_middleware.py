@@ -0,0 +1,108 @@
+"""Tests for resource hints and the Early Hints middleware."""
+
+import asyncio
+
+from starlette.applications import Starlette
+from starlette.responses import HTMLResponse, JSONResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from eidos import EidosHeaders
+from eidos.assets import asset_url, get_css_bundle_url
+from eidos.components.headers import ResourceHint, get_resource_hints, link_header
+from eidos.components.theme import THEME_COOKIE
+from eidos.middleware import EarlyHintsMiddleware
+
+
+def test_resource_hints_follow_headers_flags():
+    """Test that origins are preconnected and local assets preloaded, per flag."""
+    hints = get_resource_hints()
+    assert ResourceHint("preconnect", "https://cdn.tailwindcss.com") in hints
+    assert ResourceHint("dns-prefetch", "https://unpkg.com") in hints
+    assert ResourceHint("preload", get_css_bundle_url(), as_="style") in hints
+    assert ResourceHint("preload", asset_url("js/eidos.js"), as_="script") in hints
+
+    hints = get_resource_hints(
+        include_tailwind=False, include_lucide=False, include_alpine=False, include_eidos_js=False
+    )
+    assert [hint.rel for hint in hints] == ["preload", "preload"]
+
+
+def test_headers_include_hints():
+    """Test that EidosHeaders emits the hints as link tags after the meta tags."""
+    tags = [str(tag) for tag in EidosHeaders()]
+    assert tags[2] == '<link href="https://cdn.tailwindcss.com" rel="preconnect" />'
+    assert f'<link href="{get_css_bundle_url()}" as="style" rel="preload" />' in tags
+    assert not any("preload" in tag or "preconnect" in tag for tag in map(str, EidosHeaders(resource_hints=False)))
+
+
+def test_link_header():
+    """Test the HTTP Link header format."""
+    hints = [ResourceHint("preconnect", "https://unpkg.com"), ResourceHint("preload", "/a.css", as_="style")]
+    assert link_header(hints) == "<https://unpkg.com>; rel=preconnect, </a.css>; rel=preload; as=style"
+
+
+def app():
+    routes = [
+        Route("/", lambda request: HTMLResponse("<p>hi</p>")),
+        Route("/api", lambda request: JSONResponse({})),
+    ]
+    return EarlyHintsMiddleware(Starlette(routes=routes), include_alpine=False)
+
+
+def test_link_header_on_html_responses():
+    """Test that only HTML responses get the Link header."""
+    client = TestClient(app())
+    html = client.get("/", headers={"accept": "text/html"})
+    assert html.headers["link"] == link_header(get_resource_hints(include_alpine=False))
+    assert "cdn.jsdelivr.net" not in html.headers["link"]
+    assert "link" not in client.get("/api", headers={"accept": "text/html"}).headers
+    assert "link" not in client.get("/", headers={"accept": "application/json"}).headers
+
+
+def test_hints_follow_the_request_theme_and_extras():
+    """Test that the cookie-selected theme's stylesheet is hinted, plus per-request extras."""
+    tenant = ResourceHint("preload", "/eidos/bundle/themes/acme.css", as_="style")
+    routes = [Route("/", lambda request: HTMLResponse("<p>hi</p>"))]
+    middleware = EarlyHintsMiddleware(
+        Starlette(routes=routes),
+        server_theme=True,
+        extra_hints=lambda request: [tenant] if request.url.path == "/" else [],
+    )
+    client = TestClient(middleware)
+
+    dark = client.get("/", headers={"accept": "text/html", "cookie": f"{THEME_COOKIE}=dark"}).headers["link"]
+    assert f"<{get_css_bundle_url('dark')}>; rel=preload; as=style" in dark
+    assert get_css_bundle_url("light") not in dark
+    assert dark.endswith(tenant.to_header())
+
+    light = client.get("/", headers={"accept": "text/html"}).headers["link"]
+    assert get_css_bundle_url("light") in light and get_css_bundle_url("dark") not in light
+
+
+def test_early_hints_sent_when_supported():
+    """Test that a 103 is sent before the response when the server offers the extension."""
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": [(b"accept", b"text/html")],
+        "query_string": b"",
+        "extensions": {"http.response.early_hint": {}},
+    }
+    asyncio.run(app()(scope, receive, send))
+    assert [message["type"] for message in sent][:2] == ["http.response.early_hint", "http.response.start"]
+    assert b"<https://cdn.tailwindcss.com>; rel=preconnect" in sent[0]["links"]
+
+    sent.clear()
+    del scope["extensions"]
+    asyncio.run(app()(scope, receive, send))
+    assert sent[0]["type"] == "http.response.start"
@@ -0,0 +1,83 @@
+"""Tests for purging unused rules from styles.css."""
+
+import pytest
+
+from eidos import H1, Button, EidosHeaders
+from eidos.assets import get_css_bundle_url
+from eidos.purge import build_purged_css, critical_css, purge_css
+from eidos.utils import track_classes
+
+CSS = """
+:root { --x: 1px; }
+body, .eidos-body { margin: 0; }
+.eidos-btn, .eidos-card > .eidos-btn { color: red; }
+.eidos-btn:not(.eidos-btn-ghost):hover { color: blue; }
+.eidos-table td { padding: 0; }
+@media (min-width: 768px) {
+    .eidos-table { width: 100%; }
+    .eidos-btn { padding: 1rem; }
+}
+.eidos-modal { animation: fadeIn 1s; }
+@keyframes fadeIn { from { opacity: 0; } to { opacity: 1; } }
+"""
+
+
+def test_purge_keeps_only_matching_selectors():
+    """Test selector lists, :not(), media queries and keyframes."""
+    assert purge_css(CSS, ["eidos-btn"]) == (
+        ":root{--x:1px}body{margin:0}.eidos-btn{color:red}.eidos-btn:not(.eidos-btn-ghost):hover{color:blue}"
+        "@media (min-width: 768px){.eidos-btn{padding:1rem}}"
+    )
+    assert "@keyframes fadeIn" in purge_css(CSS, ["eidos-modal"])
+    assert purge_css(CSS, ["eidos-btn", "eidos-table"]) == purge_css(CSS, ["eidos-table", "eidos-btn", "unused"])
+
+
+def test_tracked_tags_keep_their_rules(tmp_path):
+    """Test that classes recorded from the tag factories keep their component styles."""
+    with track_classes() as classes:
+        H1("Title"), Button("Go")
+    css = (tmp_path / build_purged_css(classes, directory=tmp_path).filename).read_text()
+    assert ".eidos-h1{" in css and ".eidos-btn-primary{" in css
+    assert ".eidos-h2{" not in css
+
+
+@pytest.fixture
+def built(tmp_path, monkeypatch):
+    monkeypatch.setenv("EIDOS_BUNDLE_DIR", str(tmp_path))
+    yield build_purged_css(["eidos-h1"], safelist=["eidos-btn"])
+
+
+def test_purged_bundle(built, tmp_path):
+    """Test that the bundle has the used rules and theme variables, and is linked by EidosHeaders."""
+    css = (tmp_path / built.filename).read_text()
+    assert ".eidos-h1{" in css and ".eidos-btn{" in css
+    assert ".eidos-table" not in css
+    assert '[data-theme="dark"]' in css
+    stylesheets = [str(tag) for tag in EidosHeaders(purge_css=True) if 'rel="stylesheet"' in str(tag)]
+    assert stylesheets == [f'<link href="{built.url}" rel="stylesheet" />']
+
+
+def test_critical_css_is_cached_per_layout():
+    """Test that extraction keeps the layout's rules and the theme variables, once per class set."""
+    layout = frozenset({"eidos-h1", "eidos-table"})
+    css = critical_css(layout)
+    assert ".eidos-h1{" in css and ".eidos-table{" in css and "--color-primary:" in css
+    assert ".eidos-btn{" not in css
+    assert critical_css(frozenset({"eidos-table", "eidos-h1"})) is css
+    assert ".eidos-btn{" in critical_css()
+
+
+def test_headers_inline_critical_css():
+    """Test that the critical CSS is inlined and the full bundle loaded without blocking."""
+    tags = [str(tag) for tag in EidosHeaders(inline_critical=True, critical_classes=["eidos-h1"], nonce="abc")]
+    assert f'<style nonce="abc">{critical_css(frozenset({"eidos-h1"}))}</style>' in tags
+    assert not [tag for tag in tags if tag.startswith("<link") and 'rel="stylesheet"' in tag]
+    bundle = get_css_bundle_url()
+    assert f'<noscript><link href="{bundle}" rel="stylesheet" /></noscript>' in tags
+    assert tags.count(f'<link data-eidos-deferred="" href="{bundle}" as="style" rel="preload" />') == 1
+    assert not [tag for tag in tags if "onload" in tag]
+    assert [tag for tag in tags if "link[data-eidos-deferred]" in tag][0].startswith('<script nonce="abc"')
+
+    # Inlined ahead of the blocking library scripts
+    style = next(index for index, tag in enumerate(tags) if tag.startswith("<style"))
+    assert style < next(index for index, tag in enumerate(tags) if 'cdn.tailwindcss.com"></script>' in tag)
@@ -0,0 +1,59 @@
+"""Tests for serving eidos assets with immutable caching."""
+
+from starlette.applications import Starlette
+from starlette.testclient import TestClient
+
+from eidos.assets import asset_url
+from eidos.static import IMMUTABLE_CACHE_CONTROL, EidosStaticFiles, _accepted_encodings
+from eidos.utils import get_eidos_static_files
+
+
+def client():
+    app = Starlette()
+    for mount_path, directory in get_eidos_static_files(markdown=True).items():
+        app.mount(mount_path, EidosStaticFiles(directory=directory))
+    return TestClient(app)
+
+
+def test_fingerprinted_assets_are_immutable():
+    """Test that content-hashed URLs are served with far-future caching."""
+    for name in ("css/styles.css", "js/theme.js", "plugins/markdown/css/markdown.css", "eidos.css"):
+        response = client().get(asset_url(name))
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+
+
+def test_other_files_are_served_normally():
+    """Test that unhashed paths and the manifest keep the default caching."""
+    http = client()
+    for url in ("/eidos/css/styles.css", "/eidos/bundle/manifest.json"):
+        response = http.get(url)
+        assert response.status_code == 200
+        assert "cache-control" not in response.headers
+
+
+def test_precompressed_variant_is_negotiated():
+    """Test that the gzip variant is sent when accepted, and the original otherwise."""
+    http = client()
+    url = asset_url("eidos.css")
+    original = http.get(url, headers={"accept-encoding": "identity"})
+    assert "content-encoding" not in original.headers
+    assert original.headers["vary"] == "Accept-Encoding"
+
+    compressed = http.get(url, headers={"accept-encoding": "gzip, deflate"})
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.headers["content-type"] == "text/css; charset=utf-8"
+    assert int(compressed.headers["content-length"]) < int(original.headers["content-length"])
+    assert compressed.content == original.content  # decoded by the client
+
+    refused = http.get(url, headers={"accept-encoding": "gzip;q=0"})
+    assert "content-encoding" not in refused.headers
+
+    # An explicit refusal wins over the wildcard
+    for refused_encoding in ("gzip", "zstd"):
+        response = http.get(url, headers={"accept-encoding": f"{refused_encoding};q=0, *"})
+        assert response.headers.get("content-encoding") != refused_encoding
+    assert _accepted_encodings("zstd;q=0, *") == ({"*"}, {"zstd"})
+
+    etag = compressed.headers["etag"]
+    assert http.get(url, headers={"accept-encoding": "gzip", "if-none-match": etag}).status_code == 304
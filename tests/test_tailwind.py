@@ -0,0 +1,109 @@
+"""Tests for generating static Tailwind utility CSS."""
+
+import logging
+
+import pytest
+
+from eidos import EidosHeaders, NavBar
+from eidos.assets import write_generated_asset
+from eidos.tailwind import build_tailwind_css, classes_in_html, generate_css, get_tailwind_css_url
+from eidos.utils import stringify, track_classes
+
+
+def test_generate_utilities():
+    """Test spacing, sizing, colors, arbitrary values and unknown tokens."""
+    css = generate_css(
+        ["p-4", "px-2", "-mt-2", "w-1/2", "w-[22rem]", "bg-blue-500/50", "text-lg", "text-gray-700", "eidos-btn"],
+        preflight=False,
+    )
+    assert css.splitlines() == [
+        ".-mt-2{margin-top:-0.5rem}",
+        ".w-1\\/2{width:50%}",
+        ".w-\\[22rem\\]{width:22rem}",
+        ".bg-blue-500\\/50{background-color:rgb(59 130 246 / 0.5)}",
+        ".p-4{padding:1rem}",
+        ".px-2{padding-left:0.5rem;padding-right:0.5rem}",
+        ".text-lg{font-size:1.125rem;line-height:1.75rem}",
+        ".text-gray-700{color:#374151}",
+    ]
+
+
+def test_variants():
+    """Test that responsive rules are grouped per breakpoint after the base rules."""
+    css = generate_css(
+        ["md:flex", "hidden", "hover:underline", "dark:bg-black", "2xl:p-1", "md:gap-4"], preflight=False
+    )
+    assert css.splitlines() == [
+        ".hidden{display:none}",
+        '[data-theme="dark"] .dark\\:bg-black{background-color:#000000}',
+        ".hover\\:underline:hover{text-decoration-line:underline}",
+        "@media (min-width: 768px){.md\\:flex{display:flex}.md\\:gap-4{gap:1rem}}",
+        "@media (min-width: 1536px){.\\32 xl\\:p-1{padding:0.25rem}}",
+    ]
+    assert generate_css(["unknown:flex", "bogus"], preflight=False) == ""
+
+
+def test_output_is_deterministic():
+    """Test that the same classes in any order give the same stylesheet."""
+    classes = ["flex", "p-2", "md:p-4", "border", "border-t-2", "rounded-lg"]
+    assert generate_css(classes) == generate_css(reversed(classes))
+    assert generate_css(classes).startswith("*,::before,::after")
+
+
+def test_collect_classes():
+    """Test collecting classes from stringify and from rendered HTML."""
+    with track_classes() as classes:
+        stringify("flex", ["gap-2", None], "eidos-btn eidos-btn-primary")
+    stringify("not-tracked")
+    assert classes == {"flex", "gap-2", "eidos-btn", "eidos-btn-primary"}
+
+    html = str(NavBar())
+    found = classes_in_html(html)
+    assert {"md:hidden", "cursor-pointer", "w-6", "h-6"} <= found
+    assert classes_in_html("""<div :class="open ? 'block' : 'hidden'" class='a b'></div>""") == {
+        "a",
+        "b",
+        "block",
+        "hidden",
+    }
+
+
+@pytest.fixture
+def built(tmp_path, monkeypatch):
+    monkeypatch.setenv("EIDOS_BUNDLE_DIR", str(tmp_path))
+    yield build_tailwind_css(["flex", "p-4"])
+
+
+def test_headers_link_static_tailwind(built, tmp_path):
+    """Test that EidosHeaders links the built stylesheet instead of the CDN script."""
+    assert (tmp_path / built.filename).read_text().endswith(".p-4{padding:1rem}")
+    html = "".join(str(tag) for tag in EidosHeaders(static_tailwind=True))
+    assert f'<link href="{built.url}" rel="stylesheet" />' in html
+    assert "cdn.tailwindcss.com" not in html
+
+
+def test_headers_link_rebuilt_tailwind(built):
+    """Test that a stylesheet rebuilt by another process is linked without a restart."""
+    assert get_tailwind_css_url() == built.url
+    EidosHeaders(static_tailwind=True)
+    # What another process's build_tailwind_css leaves behind; this process's state is untouched
+    rebuilt = write_generated_asset("tailwind.css", generate_css(["flex", "p-8"]).encode())
+    html = "".join(str(tag) for tag in EidosHeaders(static_tailwind=True))
+    assert rebuilt.url != built.url
+    assert f'<link href="{rebuilt.url}" rel="stylesheet" />' in html
+
+
+def test_unsupported_classes_are_reported(tmp_path, caplog):
+    """Test that utilities the generator does not know are logged, but component classes are not."""
+    with caplog.at_level(logging.WARNING, logger="eidos.tailwind"):
+        build_tailwind_css(["flex", "eidos-btn", "backdrop-blur-md"], directory=tmp_path)
+    assert "backdrop-blur-md" in caplog.text
+    assert "eidos-btn" not in caplog.text
+    assert "flex" not in caplog.text
+
+
+def test_missing_static_tailwind(tmp_path, monkeypatch):
+    """Test that using a stylesheet that was never built says how to build it."""
+    monkeypatch.setenv("EIDOS_BUNDLE_DIR", str(tmp_path))
+    with pytest.raises(FileNotFoundError, match="python -m eidos.tailwind"):
+        get_tailwind_css_url()
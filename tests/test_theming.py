@@ -0,0 +1,83 @@
+"""Tests for compiling per-tenant themes."""
+
+import pytest
+from starlette.applications import Starlette
+from starlette.testclient import TestClient
+
+from eidos.static import IMMUTABLE_CACHE_CONTROL, EidosStaticFiles
+from eidos.theming import ThemeCSS, ThemeSpec, compile_theme, theme_cache, theme_css
+from eidos.utils import get_eidos_static_files
+
+
+@pytest.fixture(autouse=True)
+def clear_theme_cache():
+    theme_cache.clear()
+    yield
+    theme_cache.clear()
+
+
+def test_theme_css():
+    """Test that each group of overrides lands in the right rule, with -rgb derived from hex colors."""
+    spec = ThemeSpec(
+        colors={"primary": "#e11d48", "text": "rgb(0 0 0)"},
+        dark_colors={"primary": "#fb7"},
+        radii={"md": "0"},
+        fonts={"base": '"Inter", sans-serif'},
+        variables={"--space-md": "1.25rem"},
+    )
+    assert theme_css(spec) == (
+        ':root{--radius-md:0;--font-family-base:"Inter", sans-serif;--space-md:1.25rem}\n'
+        ':root:not([data-theme="dark"]),[data-theme="light"]'
+        "{--color-primary:#e11d48;--color-text:rgb(0 0 0);--color-primary-rgb:225, 29, 72}\n"
+        '[data-theme="dark"]{--color-primary:#fb7;--color-primary-rgb:255, 187, 119}'
+    )
+    assert theme_css(ThemeSpec()) == ""
+
+
+def test_light_palette_leaves_dark_mode_alone():
+    """Test that overriding only the light palette does not match pages in dark mode."""
+    css = theme_css(ThemeSpec(colors={"primary": "#e11d48"}))
+    assert css.startswith(':root:not([data-theme="dark"]),[data-theme="light"]{')
+    assert '[data-theme="dark"]{' not in css
+
+
+def test_invalid_specs_are_rejected():
+    """Test that typos and values that could break out of their declaration raise."""
+    with pytest.raises(ValueError, match="Unknown theme variable '--color-primray'"):
+        theme_css(ThemeSpec(colors={"primray": "red"}))
+    with pytest.raises(ValueError, match="Unknown theme variable 'space-md'"):
+        theme_css(ThemeSpec(variables={"space-md": "1rem"}))
+    for value in ("red}body{display:none", "red;--x:1", "</style>", ""):
+        with pytest.raises(ValueError, match="Invalid value"):
+            theme_css(ThemeSpec(colors={"primary": value}))
+
+
+def test_compile_theme_is_cached_and_content_hashed(tmp_path, monkeypatch):
+    """Test that equal specs compile once, to a file named by its content."""
+    compiled = compile_theme(ThemeSpec(radii={"md": "0", "lg": "0"}), tmp_path)
+    assert (tmp_path / compiled.filename).read_text() == compiled.css
+    assert compiled.url == f"/eidos/bundle/themes/{compiled.digest}.css"
+    assert compile_theme(ThemeSpec(radii={"lg": "0", "md": "0"}), tmp_path) is compiled
+    assert len(theme_cache) == 1
+
+    # Another directory gets its own copy of the file
+    monkeypatch.setenv("EIDOS_BUNDLE_DIR", str(tmp_path / "bundle"))
+    assert compile_theme(ThemeSpec(radii={"md": "0", "lg": "0"})) == compiled
+    assert (tmp_path / "bundle" / compiled.filename).exists()
+
+
+def test_compiled_themes_are_served_immutable(tmp_path, monkeypatch):
+    """Test that ThemeCSS links a stylesheet served from the bundle mount with far-future caching."""
+    monkeypatch.setenv("EIDOS_BUNDLE_DIR", str(tmp_path))
+    spec = ThemeSpec(colors={"primary": "#e11d48"})
+    link = ThemeCSS(spec).render()
+    compiled = compile_theme(spec)
+    assert link == f'<link href="{compiled.url}" rel="stylesheet" />'
+    assert (tmp_path / compiled.filename).exists()
+
+    app = Starlette()
+    for mount_path, directory in get_eidos_static_files().items():
+        app.mount(mount_path, EidosStaticFiles(directory=directory))
+    response = TestClient(app).get(compiled.url)
+    assert response.text == compiled.css
+    assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
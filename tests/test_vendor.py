@@ -0,0 +1,108 @@
+"""Tests for serving pinned third-party libraries locally."""
+
+import dataclasses
+
+import pytest
+from starlette.applications import Starlette
+from starlette.testclient import TestClient
+
+from eidos import EidosHeaders
+from eidos.assets import PACKAGE_DIR
+from eidos.components import headers
+from eidos.components.headers import get_resource_hints
+from eidos.static import IMMUTABLE_CACHE_CONTROL, EidosStaticFiles
+from eidos.utils import get_eidos_static_files
+from eidos.vendor import VENDORED_LIBRARIES, VendoredLibrary, download, get_vendored_assets, sri_hash, vendor_dir
+
+
+@pytest.fixture
+def vendor(tmp_path, monkeypatch):
+    """A vendor directory holding a stand-in file for each library."""
+    monkeypatch.setenv("EIDOS_VENDOR_DIR", str(tmp_path))
+    # Stand-ins, pinned to their own content
+    pinned = {}
+    for key, library in VENDORED_LIBRARIES.items():
+        content = f"/* {library.name} {library.version} */".encode()
+        (tmp_path / library.filename).write_bytes(content)
+        pinned[key] = dataclasses.replace(library, integrity=sri_hash(content))
+    monkeypatch.setattr("eidos.vendor.VENDORED_LIBRARIES", pinned)
+    get_vendored_assets.cache_clear()
+    headers._render_headers.cache_clear()
+    yield tmp_path
+    get_vendored_assets.cache_clear()
+    headers._render_headers.cache_clear()
+
+
+def test_sri_hash():
+    """Test the integrity format against a known SHA-384 digest."""
+    assert sri_hash(b"") == "sha384-OLBgp1GsljhM2TJ+sbHjaiH9txEUvgdDTAzHv2P24donTt6/529l+9Ua0vFImLlb"
+
+
+def test_vendored_headers(vendor):
+    """Test that vendored mode links local, pinned files with integrity and no CDN hints."""
+    html = "".join(str(tag) for tag in EidosHeaders(vendored=True))
+    for asset in get_vendored_assets().values():
+        assert f'src="/eidos/vendor/{asset.library.filename}"' in html
+        assert asset.integrity == asset.library.integrity
+        assert f'integrity="{asset.integrity}"' in html
+    assert "cdn.tailwindcss.com" not in html and "unpkg.com" not in html and "jsdelivr" not in html
+    assert not [hint for hint in get_resource_hints(vendored=True) if hint.rel != "preload"]
+
+
+def test_static_files_mount_vendor_dir(vendor):
+    """Test that the vendor directory is mounted only when asked."""
+    assert get_eidos_static_files(vendored=True)["/eidos/vendor"] == str(vendor)
+    assert "/eidos/vendor" not in get_eidos_static_files()
+
+
+def test_missing_vendored_files_fail_early(vendor):
+    """Test that a missing download is reported with how to fix it."""
+    (vendor / VENDORED_LIBRARIES["alpine"].filename).unlink()
+    with pytest.raises(FileNotFoundError, match="python -m eidos.vendor"):
+        get_eidos_static_files(vendored=True)
+
+
+def test_changed_vendored_file_fails(vendor):
+    """Test that a local file that no longer matches its pin is refused, not re-hashed."""
+    (vendor / VENDORED_LIBRARIES["alpine"].filename).write_text("alert(1)")
+    with pytest.raises(ValueError, match="does not match its pinned integrity"):
+        get_vendored_assets()
+
+
+def test_download_verifies_pinned_integrity(tmp_path, monkeypatch):
+    """Test that downloads must match their pin, and unpinned libraries are refused."""
+    source = tmp_path / "lib.js"
+    source.write_text("lib()")
+    out = tmp_path / "out"
+
+    pinned = VendoredLibrary("lib", "1.0.0", source.as_uri(), integrity=sri_hash(b"lib()"))
+    monkeypatch.setattr("eidos.vendor.VENDORED_LIBRARIES", {"lib": pinned})
+    assert download(out) == [out / "lib-1.0.0.js"]
+
+    tampered = VendoredLibrary("lib", "1.0.1", source.as_uri(), integrity=sri_hash(b"other()"))
+    monkeypatch.setattr("eidos.vendor.VENDORED_LIBRARIES", {"lib": tampered})
+    with pytest.raises(ValueError, match="does not match its pinned integrity"):
+        download(out)
+    assert not (out / "lib-1.0.1.js").exists()
+
+    unpinned = VendoredLibrary("lib", "1.0.2", source.as_uri())
+    monkeypatch.setattr("eidos.vendor.VENDORED_LIBRARIES", {"lib": unpinned})
+    with pytest.raises(ValueError, match="No integrity pinned"):
+        download(out)
+    assert not (out / "lib-1.0.2.js").exists()
+
+
+def test_vendor_dir_is_outside_the_package(monkeypatch):
+    """Test that the default vendor directory is not inside the installed package."""
+    monkeypatch.delenv("EIDOS_VENDOR_DIR", raising=False)
+    assert not vendor_dir().is_relative_to(PACKAGE_DIR)
+
+
+def test_vendored_files_are_immutable(vendor):
+    """Test that the versioned vendored files are served with far-future caching."""
+    app = Starlette()
+    for mount_path, directory in get_eidos_static_files(vendored=True).items():
+        app.mount(mount_path, EidosStaticFiles(directory=directory))
+    response = TestClient(app).get(get_vendored_assets()["alpine"].url)
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL